@@ -27,7 +27,7 @@ bl_info = {
     'support': 'COMMUNITY',
     }
 
-from . import panels, handlers, operators, preferences, properties, utils
+from . import panels, handlers, operators, preferences, properties, rules, checks, changes, scheduler, snapshot, records, external_files, node_scan, membership, visibility, modifier_stack, text_layout, placement, overlay, filecheck, stat_cache, utils
 
 def register():
     properties.register()
@@ -0,0 +1,176 @@
+import bpy
+
+from .properties import HEADSUP_Props
+from .rules import *
+
+
+class HEADSUP_ChangeSet:
+    """What a single depsgraph update changed, as far as the rules care."""
+
+    def __init__(self):
+        self.inputs = set()
+        self.objects = set()        # Objects to re-check for visibility/modifier mismatches
+        self.materials = set()      # Materials to re-scan
+        self.node_trees = set()     # Pointers of node trees whose cached scans are outdated
+        self.collections = set()    # Collections whose content or hierarchy changed
+        self.compositor = False     # Compositor node tree changed
+        self.external_ids = set()   # Data-blocks whose external file paths may have changed
+
+
+def _active_pointers(active_obj):
+    """Pointers of the active object and the data blocks the active object rules read."""
+    if active_obj is None:
+        return set()
+    pointers = {active_obj.as_pointer()}
+    data = active_obj.data
+    if data is not None:
+        pointers.add(data.as_pointer())
+        shape_keys = getattr(data, "shape_keys", None)
+        if shape_keys is not None:
+            pointers.add(shape_keys.as_pointer())
+    return pointers
+
+
+def detect_context_changes(state, changes):
+    """Add the inputs that change without tagging the depsgraph."""
+    # Space settings (lock camera, local view, ...) don't tag the depsgraph
+    changes.inputs.add(INPUT_WINDOWS)
+
+    if state.mode != HEADSUP_Props.last_mode:
+        HEADSUP_Props.last_mode = state.mode
+        changes.inputs.add(INPUT_MODE)
+
+    active_pointer = state.active_obj.as_pointer() if state.active_obj else None
+    if active_pointer != HEADSUP_Props.last_active_pointer:
+        HEADSUP_Props.last_active_pointer = active_pointer
+        changes.inputs.add(INPUT_ACTIVE_OBJECT)
+    return changes
+
+
+# Data-blocks with file paths of their own, see external_files.py
+FILE_ID_TYPES = ('Image', 'Library', 'MovieClip', 'Sound', 'VectorFont', 'Volume', 'CacheFile')
+# Modifiers with point caches or cache directories, see external_files._point_caches
+CACHE_MODIFIER_TYPES = {'CLOTH', 'SOFT_BODY', 'DYNAMIC_PAINT', 'FLUID', 'PARTICLE_SYSTEM'}
+
+
+def _may_own_cache_files(obj):
+    """True if ``obj`` has or had modifiers or particle systems that can point to cache files."""
+    index = HEADSUP_Props.external_files
+    if index is not None and index["objects"].get(obj.as_pointer()):
+        return True
+    return len(obj.particle_systems) > 0 or any(modifier.type in CACHE_MODIFIER_TYPES for modifier in obj.modifiers)
+
+def _strips_changed(scene):
+    """True if strips were added to or removed from ``scene`` since its last update.
+
+    Strip paths are covered by msgbus, other scene edits must not re-read the external files.
+    """
+    editor = scene.sequence_editor
+    count = 0
+    if editor is not None:
+        strips = getattr(editor, "strips_all", None)
+        if strips is None:
+            strips = editor.sequences_all
+        count = len(strips)
+    pointer = scene.as_pointer()
+    if HEADSUP_Props.strip_counts.get(pointer) == count:
+        return False
+    HEADSUP_Props.strip_counts[pointer] = count
+    return True
+
+
+def _compositor_scenes(node_tree):
+    """Scenes compositing with ``node_tree``, their File Output nodes may have changed."""
+    return [scene for scene in bpy.data.scenes
+            if (getattr(scene, "compositing_node_group", None) or getattr(scene, "node_tree", None)) == node_tree]
+
+
+def is_valid_id(id_data):
+    """False for data-blocks that were removed since they were queued."""
+    try:
+        id_data.name
+    except ReferenceError:
+        return False
+    return True
+
+
+def classify_updates(depsgraph, changes=None):
+    """Decide which rule inputs and data items a depsgraph update affects.
+
+    The result is merged into ``changes`` so that several updates can be
+    coalesced into one evaluation.
+
+    Object updates that only carry ``is_updated_transform`` (or only
+    ``is_updated_shading``) cannot change visibility or modifier settings, so
+    they never queue the object for a mismatch check. Only the active object
+    rules re-run for them.
+    """
+    if changes is None:
+        changes = HEADSUP_ChangeSet()
+
+    if depsgraph is None:
+        changes.inputs.update(ALL_INPUTS)
+        return changes
+
+    active_pointers = _active_pointers(bpy.context.active_object)
+
+    for update in depsgraph.updates:
+        id_data = update.id.original
+        if id_data.as_pointer() in active_pointers:
+            changes.inputs.add(INPUT_ACTIVE_OBJECT)
+
+        if isinstance(id_data, bpy.types.Object):
+            transform = update.is_updated_transform
+            geometry = update.is_updated_geometry
+            shading = update.is_updated_shading
+            # Modifier toggles tag the geometry, ID level changes carry no flag at all
+            if geometry or not (transform or shading):
+                changes.objects.add(id_data)
+                changes.inputs.add(INPUT_OBJECTS)
+                # Point caches are modifier and particle settings, edit mode and sculpt strokes
+                # of objects without them must not re-run the file rules
+                if _may_own_cache_files(id_data):
+                    changes.external_ids.add(id_data)
+                    changes.inputs.add(INPUT_EXTERNAL_FILES)
+        elif isinstance(id_data, bpy.types.Scene):
+            changes.inputs.update({INPUT_TOOL_SETTINGS, INPUT_RENDER, INPUT_SCENE, INPUT_VIEW_LAYERS,
+                                   INPUT_SEQUENCER, INPUT_COMPOSITOR, INPUT_FILE})
+            if _strips_changed(id_data):
+                changes.external_ids.add(id_data)
+                changes.inputs.add(INPUT_EXTERNAL_FILES)
+        elif isinstance(id_data, bpy.types.Collection):
+            changes.collections.add(id_data)
+            changes.inputs.update({INPUT_OBJECTS, INPUT_VIEW_LAYERS})
+        elif isinstance(id_data, bpy.types.Material):
+            if not id_data.library:
+                changes.materials.add(id_data)
+            if id_data.node_tree:
+                changes.node_trees.add(id_data.node_tree.as_pointer())
+            changes.inputs.add(INPUT_MATERIALS)
+        elif isinstance(id_data, bpy.types.CompositorNodeTree):
+            changes.compositor = True
+            changes.node_trees.add(id_data.as_pointer())
+            changes.inputs.add(INPUT_COMPOSITOR)
+            scenes = _compositor_scenes(id_data)
+            if scenes:
+                changes.external_ids.update(scenes)
+                changes.inputs.add(INPUT_EXTERNAL_FILES)
+        elif isinstance(id_data, bpy.types.World):
+            # Scanned for the image sequence frames of warn_42
+            if id_data.node_tree:
+                changes.node_trees.add(id_data.node_tree.as_pointer())
+        elif isinstance(id_data, bpy.types.NodeTree):
+            # Node groups can be used by any material
+            changes.node_trees.add(id_data.as_pointer())
+            changes.inputs.add(INPUT_MATERIALS)
+        elif isinstance(id_data, bpy.types.Image):
+            changes.inputs.add(INPUT_IMAGES)
+        elif isinstance(id_data, bpy.types.Library):
+            changes.inputs.add(INPUT_LIBRARIES)
+        elif isinstance(id_data, bpy.types.Text):
+            changes.inputs.add(INPUT_TEXTS)
+
+        if type(id_data).__name__ in FILE_ID_TYPES:
+            changes.external_ids.add(id_data)
+            changes.inputs.add(INPUT_EXTERNAL_FILES)
+    return changes
@@ -0,0 +1,876 @@
+import bpy
+import os
+import traceback
+
+from .utils import *
+from .properties import *
+from .properties import HEADSUP_Props
+from .rules import *
+from .snapshot import *
+from .filecheck import *
+from .external_files import *
+from .node_scan import *
+from .membership import *
+from .visibility import *
+from .modifier_stack import *
+
+#Current Warn List:
+#    1 Lock Camera to View
+#    2 Viewport/Render Visibility Mismatch
+#    3 Shapekey Warning in Sculpt Mode
+#    4 Auto Keying
+#    5 Proportional Editing
+#    6 Affect only Origins/Locations/Parents
+#    7 Snapping
+#    8 Scaling Issues
+#    9 Mirror Options
+#    10 Simplify
+#    11 Sequencer
+#    12 Render Border
+#    13 Auto-Merge Vertices
+#    14 UV Select Sync
+#    15 Live Unwrapping
+#    16 Correct Face Attributes
+#    17 Multiple Image Sequence Nodes with same datablock
+#    18 Sculpt Mode and Corrective Smooth
+#    19 Automatically Pack Ressources
+#    20 LocalView
+#    21 Clipping Borders (Alt+B)
+#    22 Active Object: Shadow Catcher / Holdout
+#    23 Render Resolution Percentage not 100%
+#    24 Render: Filter Size not 1.5
+#    25 Viewport/Render Modifier Mismatch
+#    26 Sample Override
+#    27 Render Samples Low or High
+#    28 Active Object: Array with relative Offset not first in stack
+#    29 Viewport: Hidden Object Types
+#    30 Viewport: Unselectable Object Types
+#    31 Animation: Preview Range is used
+#    32 Cycles: Render Device
+#    33 Active Object: Locked Transforms
+#    34 Active Object: Rig in Rest Position
+#    35 Render: Material Override
+#    36 Compositing: Use Nodes
+#    37 Render: Output to video
+#    38 Render: Film Transparent
+#    39 Sequencer: Loud audio
+#    40 Active Object: Render < Viewport Subdiv
+#    41 Material: Undefined Nodes
+#    42 Missing: Textures
+#    43 Missing: Libraries
+#    44 Blender Version
+#    45 Compositing: Renderlayer Node
+#    46 Active Object: In Front
+#    47 Active Object: Visible Texture Space
+#    48 Active Object: Wireframe Display
+#    49 Active Object: Collection Instance
+#    50 Active Object: Faces/Verts Instance
+#    51 Active Object: Solo Active Shape Key
+#    52 Active Object: Shape Key Edit Mode
+#    53 Missing: External Files
+#    54 Data: Absolute Paths
+#    55 Data: Outside Project Root
+
+def get_sequencer_strips(scene):
+    """Strips checked by the sequencer rules, empty if the scene has no sequencer."""
+    if not scene.sequence_editor:
+        return ()
+    if bpy.app.version < (5, 0, 0):
+        return scene.sequence_editor.sequences_all
+    # Rules run from a timer without screen context, look for an open sequencer in any window
+    for window in bpy.context.window_manager.windows:
+        if any(area.type == 'SEQUENCE_EDITOR' for area in window.screen.areas):
+            return bpy.data.scenes[window.workspace.sequencer_scene.name].sequence_editor.strips
+    return scene.sequence_editor.strips
+
+# Rules are evaluated (and displayed) in the order they are registered below.
+
+@headsup_rule("warn_1", inputs={INPUT_WINDOWS})
+def check_lock_camera(state):
+    new_warnings = []
+    for space in get_snapshot(state).spaces:
+        if space.lock_camera:
+            new_warnings.append(HEADSUP_Warning("[Camera to View] is ON!", scope=space.identifier))
+    return new_warnings
+
+@headsup_rule("warn_2", inputs={INPUT_OBJECTS, INPUT_VIEW_LAYERS})
+def check_visibility_mismatch(state):
+    new_warnings = []
+    if len(state.check_objects) > 0:
+        # Flags changed by drivers or scripts don't notify msgbus, the modifier check sees those objects as well
+        state.check_objects.update(refresh_visibility(state.scene))
+        HEADSUP_Props.object_mismatches = check_object_mismatches(state.scene)
+    if HEADSUP_Props.collection_check_bool:
+        HEADSUP_Props.collection_mismatches = check_collection_mismatches()
+
+    if len(HEADSUP_Props.collection_mismatches) > 0 and len(HEADSUP_Props.object_mismatches) == 0:
+       new_warnings.append(f"[Collection Render/Viewport Mismatch] check HeadsUp SidePanel")
+    if len(HEADSUP_Props.object_mismatches) > 0 and len(HEADSUP_Props.collection_mismatches) == 0:
+       new_warnings.append(f"[Object Render/Viewport Mismatch] check HeadsUp SidePanel")
+    if len(HEADSUP_Props.object_mismatches) > 0 and len(HEADSUP_Props.collection_mismatches) > 0:
+       new_warnings.append(f"[Object & Collection Render/Viewport Mismatches] check HeadsUp SidePanel")
+
+    # Collection and layer changes set the flag again through depsgraph updates and msgbus
+    HEADSUP_Props.collection_check_bool = False
+    return new_warnings
+
+@headsup_rule("warn_3", inputs={INPUT_MODE, INPUT_ACTIVE_OBJECT})
+def check_sculpt_shape_key(state):
+    active_obj = state.active_obj
+    if active_obj and active_obj.type == 'MESH':
+        if state.mode == 'SCULPT':
+            if active_obj.data.shape_keys:
+                active_shape_key_index = active_obj.active_shape_key_index
+                if active_shape_key_index != 0:
+                    active_shape_key = active_obj.data.shape_keys.key_blocks[active_shape_key_index]
+                    if round(active_shape_key.value, 3) != 1.0:
+                        return [f"Active [Shape Key] is not 1.0! Set to: {round(active_shape_key.value, 3)}!"]
+    return []
+
+@headsup_rule("warn_4", inputs={INPUT_MODE, INPUT_TOOL_SETTINGS}, options=("warn_4_a",))
+def check_auto_keying(state):
+    if state.prefs.warn_4_a == '⏺[REC] only':
+        return []
+    if state.mode == 'OBJECT' or state.mode == 'POSE':
+        if state.scene.tool_settings.use_keyframe_insert_auto:
+            return ["[Auto Keying] is ON!"]
+    return []
+
+@headsup_rule("warn_5", inputs={INPUT_MODE, INPUT_TOOL_SETTINGS, INPUT_WINDOWS})
+def check_proportional_editing(state):
+    new_warnings = []
+    tool_settings = state.scene.tool_settings
+    if state.mode == 'EDIT_MESH':
+        if tool_settings.use_proportional_edit:
+            new_warnings.append("[Proportional Editing (Edit Mode/UV)] is ON!")
+    if state.mode == 'OBJECT':
+        if tool_settings.use_proportional_edit_objects:
+            new_warnings.append("[Proportional Editing (Object Mode)] is ON!")
+
+    editor_types = get_snapshot(state).editor_types
+    if 'GRAPH_EDITOR' in editor_types and tool_settings.use_proportional_fcurve:
+        new_warnings.append("[Proportional Editing (Graph Editor)] is ON!")
+    if 'DOPESHEET_EDITOR' in editor_types and tool_settings.use_proportional_action:
+        new_warnings.append("[Proportional Editing (Dopesheet)] is ON!")
+    return new_warnings
+
+@headsup_rule("warn_6", inputs={INPUT_MODE, INPUT_TOOL_SETTINGS})
+def check_affect_only(state):
+    new_warnings = []
+    tool_settings = state.scene.tool_settings
+    if state.mode == 'OBJECT':
+        if tool_settings.use_transform_data_origin:
+            new_warnings.append("[Affect Only >Origins<] is ON!")
+        if tool_settings.use_transform_pivot_point_align:
+            new_warnings.append("[Affect Only >Locations<] is ON!")
+        if tool_settings.use_transform_skip_children:
+            new_warnings.append("[Affect Only >Parents<] is ON!")
+    return new_warnings
+
+@headsup_rule("warn_7", inputs={INPUT_MODE, INPUT_TOOL_SETTINGS})
+def check_snapping(state):
+    new_warnings = []
+    tool_settings = state.scene.tool_settings
+    if state.mode == 'OBJECT' or state.mode == 'EDIT_MESH':
+        if tool_settings.use_snap:
+            new_warnings.append("[Snapping] is ON!")
+    if state.mode == 'EDIT_MESH':
+        if tool_settings.use_snap_uv:
+            new_warnings.append("[Snapping (UV)] is ON!")
+    return new_warnings
+
+@headsup_rule("warn_8", inputs={INPUT_ACTIVE_OBJECT}, options=("warn_8_a", "warn_8_b", "warn_8_c"))
+def check_scaling(state):
+    prefs = state.prefs
+    active_obj = state.active_obj
+    if not active_obj:
+        return []
+    scale = active_obj.scale
+    if not round(scale[0],3) == round(scale[1],3) == round(scale[2],3):
+        if any(axis <= 0 for axis in scale):
+            if prefs.warn_8_a:
+                return ["[Non-Uniform Scale (Zero or Negative Axis!)] for active Object!"]
+        else:
+            if prefs.warn_8_b and active_obj.type not in ("LIGHT","META","CAMERA","LIGHT_PROBE"):
+                return ["[Non-Uniform Scale] for active Object!"]
+    else:
+        if scale[0] != 1.0:
+            if scale[0] < 0:
+                if prefs.warn_8_a:
+                    return ["[Negative Scale] for active Object!"]
+            else:
+                if prefs.warn_8_c and active_obj.type not in ("LIGHT","META","CAMERA","LIGHT_PROBE"):
+                    return ["[Scale is not 1] for active Object!"]
+    return []
+
+@headsup_rule("warn_9", inputs={INPUT_MODE, INPUT_ACTIVE_OBJECT})
+def check_mirror_options(state):
+    active_obj = state.active_obj
+    if state.mode != 'OBJECT':
+        if active_obj and active_obj.type == 'MESH':
+            mesh = active_obj.data
+            mirror_warnings = []
+            if mesh.use_mirror_x:
+                mirror_warnings.append("'X'")
+            if mesh.use_mirror_y:
+                mirror_warnings.append("'Y'")
+            if mesh.use_mirror_z:
+                mirror_warnings.append("'Z'")
+            if mesh.use_mirror_topology:
+                mirror_warnings.append("'Topology'")
+
+            if mirror_warnings:
+                return [f"[Mirror {', '.join(mirror_warnings)}] is ON!"]
+    return []
+
+@headsup_rule("warn_10", inputs={INPUT_MODE, INPUT_RENDER}, options=("warn_10_a", "simplify_viewport", "simplify_render"))
+def check_simplify(state):
+    new_warnings = []
+    prefs = state.prefs
+    render = state.scene.render
+    if state.mode == 'OBJECT':
+        if render.use_simplify:
+            sub_v = render.simplify_subdivision
+            sub_r = render.simplify_subdivision_render
+            if not prefs.warn_10_a:
+                if sub_v <= prefs.simplify_viewport and not sub_r <= prefs.simplify_render:
+                    new_warnings.append(f"[Simplify] is ON! Viewport: {sub_v}, Render: {sub_r}")
+            if sub_r <= prefs.simplify_render:
+                new_warnings.append(f"[Simplify] is ON! Render Subdivision is low: {sub_r}!")
+    return new_warnings
+
+@headsup_rule("warn_11", inputs={INPUT_MODE, INPUT_RENDER, INPUT_SEQUENCER})
+def check_sequencer(state):
+    scene = state.scene
+    if state.mode == 'OBJECT':
+        if scene.render.use_sequencer:
+            has_non_audio_strips = any(
+                strip.type != 'SOUND' for strip in get_sequencer_strips(scene)
+            )
+            if has_non_audio_strips:
+                return ["[Sequencer] is ON and contains Data!"]
+    return []
+
+@headsup_rule("warn_12", inputs={INPUT_MODE, INPUT_RENDER})
+def check_render_border(state):
+    render = state.scene.render
+    if state.mode == 'OBJECT':
+        if render.use_border:
+            border_x = render.border_max_x - render.border_min_x
+            border_y = render.border_max_y - render.border_min_y
+
+            if border_x != 1.0 or border_y != 1.0:
+                if render.use_crop_to_border:
+                    return ["[Render Border with Crop] is ON!"]
+                return ["[Render Border] is ON!"]
+    return []
+
+@headsup_rule("warn_13", inputs={INPUT_MODE, INPUT_TOOL_SETTINGS})
+def check_automerge(state):
+    if state.mode == 'EDIT_MESH':
+        if state.scene.tool_settings.use_mesh_automerge:
+            return ["[Automerge Vertices] is ON!"]
+    return []
+
+@headsup_rule("warn_14", inputs={INPUT_MODE, INPUT_TOOL_SETTINGS})
+def check_uv_select_sync(state):
+    if state.mode == 'EDIT_MESH':
+        if state.scene.tool_settings.use_uv_select_sync:
+            return ["[UV Sync Selection] is ON!"]
+    return []
+
+@headsup_rule("warn_15", inputs={INPUT_MODE, INPUT_TOOL_SETTINGS})
+def check_live_unwrap(state):
+    if state.mode == 'EDIT_MESH':
+        if state.scene.tool_settings.use_edge_path_live_unwrap:
+            return ["[Live Unwrap] is ON!"]
+    return []
+
+@headsup_rule("warn_16", inputs={INPUT_MODE, INPUT_TOOL_SETTINGS})
+def check_correct_face_attributes(state):
+    if state.mode == 'EDIT_MESH':
+        if state.scene.tool_settings.use_transform_correct_face_attributes:
+            return ["[Correct Face Attributes] is ON!(UVs change with Editmode Transforms)!"]
+    return []
+
+@headsup_rule("warn_17", inputs={INPUT_MATERIALS, INPUT_IMAGES})
+def check_image_sequence_nodes(state):
+    # Only the materials on the check-list are re-indexed, and only the images they use re-checked
+    if state.full:
+        reset_sequence_index()
+    if state.check_materials:
+        changed_images = update_sequence_index(state.check_materials, state.tree_summaries)
+        update_sequence_conflicts(changed_images)
+    HEADSUP_Props.image_sequence_conflicts = sequence_conflicts()
+    if HEADSUP_Props.image_sequence_conflicts:
+        return ["Several [Image Sequence] nodes with different settings refer to the same datablock, expect issues!"]
+    return []
+
+@headsup_rule("warn_18", inputs={INPUT_MODE, INPUT_ACTIVE_OBJECT})
+def check_sculpt_corrective_smooth(state):
+    active_obj = state.active_obj
+    if active_obj and active_obj.type == 'MESH':
+        if state.mode == 'SCULPT':
+            if any(mod.type == 'CORRECTIVE_SMOOTH' and mod.show_viewport for mod in active_obj.modifiers):
+                return ["Sculpting with an active [Corrective Smooth] modifier!"]
+    return []
+
+@headsup_rule("warn_19", inputs={INPUT_FILE})
+def check_autopack(state):
+    if bpy.context.blend_data.use_autopack:
+        return ["[Autopack Ressources] is ON!"]
+    return []
+
+@headsup_rule("warn_20", inputs={INPUT_WINDOWS})
+def check_local_view(state):
+    new_warnings = []
+    for space in get_snapshot(state).spaces:
+        if space.local_view:
+            new_warnings.append(HEADSUP_Warning("[Local View] is ON!", scope=space.identifier))
+    return new_warnings
+
+@headsup_rule("warn_21", inputs={INPUT_WINDOWS})
+def check_clipping_border(state):
+    new_warnings = []
+    for space in get_snapshot(state).spaces:
+        if space.clip_planes:
+            new_warnings.append(HEADSUP_Warning("[Clipping Border] is ON! Alt+B to reset", scope=space.identifier))
+    return new_warnings
+
+@headsup_rule("warn_22", inputs={INPUT_MODE, INPUT_ACTIVE_OBJECT})
+def check_shadow_catcher_holdout(state):
+    active_obj = state.active_obj
+    if state.mode == 'OBJECT':
+        if active_obj and active_obj.type == 'MESH':
+            if active_obj.is_shadow_catcher and not active_obj.is_holdout:
+                return ["Active Object is [Shadow Catcher]"]
+            if active_obj.is_holdout and not active_obj.is_shadow_catcher:
+                return ["Active Object is [Holdout]"]
+            if active_obj.is_holdout and active_obj.is_shadow_catcher:
+                return ["Active Object is [Holdout & Shadow Catcher]"]
+    return []
+
+@headsup_rule("warn_23", inputs={INPUT_MODE, INPUT_RENDER})
+def check_resolution_percentage(state):
+    if state.mode == 'OBJECT':
+        resolution_percentage = state.scene.render.resolution_percentage
+        if resolution_percentage != 100:
+            return [f"[Render Resolution Percentage] is: {resolution_percentage}%!"]
+    return []
+
+@headsup_rule("warn_24", inputs={INPUT_MODE, INPUT_RENDER})
+def check_filter_size(state):
+    new_warnings = []
+    scene = state.scene
+    if state.mode == 'OBJECT':
+        if scene.render.engine  == "CYCLES":
+            if scene.cycles.filter_width != 1.5:
+                pixel_filter = round(scene.cycles.filter_width,2)
+                new_warnings.append(f"[Pixel Filter(Cycles)]: {pixel_filter} px!(Default 1.5px)")
+        if scene.render.engine  == "BLENDER_EEVEE" or scene.render.engine == "BLENDER_EEVEE_NEXT":
+            if scene.render.filter_size != 1.5:
+                pixel_filter = round(scene.render.filter_size,2)
+                new_warnings.append(f"[Pixel Filter(EEVEE):] {pixel_filter} px!(Default 1.5px)")
+    return new_warnings
+
+@headsup_rule("warn_25", inputs={INPUT_MODE, INPUT_ACTIVE_OBJECT, INPUT_OBJECTS, INPUT_VIEW_LAYERS}, options=("warn_25_a",))
+def check_modifier_visibility(state):
+    active_obj = state.active_obj
+    if state.mode != 'OBJECT' or state.prefs.warn_25_a == 'ACTIVE_ONLY':
+        # Checked once the scene-wide mode runs again
+        HEADSUP_Props.modifier_pending_objects.update(state.check_objects)
+    if state.mode == 'OBJECT':
+        if state.prefs.warn_25_a == 'ACTIVE_ONLY':
+            if active_obj:
+                modifier_list = []
+                if not active_obj.hide_render and not active_obj.hide_viewport:
+                    for modifier in active_obj.modifiers:
+                        if modifier.show_viewport != modifier.show_render:
+                            modifier_list.append(modifier.name)
+                if len(modifier_list) > 0:
+                    modifier_string = " & ".join(sorted(modifier_list))
+                    return [f"[Modifier Visibility Mismatch] for [{modifier_string}]"]
+        else:
+            check_objects = state.check_objects | HEADSUP_Props.modifier_pending_objects
+            HEADSUP_Props.modifier_pending_objects = set()
+            if len(check_objects) > 0:
+                # Only stacks reported by the depsgraph are read again
+                update_modifier_mismatches(check_objects)
+            if len(HEADSUP_Props.modifier_mismatches) > 0:
+                return [f"[Modifier Render/Viewport Mismatch] check HeadsUp SidePanel"]
+    return []
+
+@headsup_rule("warn_26", inputs={INPUT_MODE, INPUT_RENDER, INPUT_VIEW_LAYERS})
+def check_sample_override(state):
+    if state.mode == 'OBJECT':
+        if state.scene.render.engine  == "CYCLES":
+            view_layer_list = []
+            for view_layer in state.scene.view_layers:
+                if view_layer.samples != 0:
+                    view_layer_list.append(f"'{view_layer.name}': {view_layer.samples}")
+
+            if len(view_layer_list) > 0:
+                return [f"[Sample Override] for ViewLayer(s): {' | '.join(view_layer_list)}"]
+    return []
+
+@headsup_rule("warn_27", inputs={INPUT_MODE, INPUT_RENDER}, options=("sample_limit_lower",))
+def check_low_samples(state):
+    new_warnings = []
+    scene = state.scene
+    prefs = state.prefs
+    if state.mode == 'OBJECT':
+        if scene.render.engine  == "CYCLES":
+            if scene.cycles.samples <= prefs.sample_limit_lower :
+                new_warnings.append(f"[Low Samples(Cycles)]: {scene.cycles.samples} samples!")
+        if scene.render.engine == "BLENDER_EEVEE":
+            if scene.eevee.taa_render_samples <= prefs.sample_limit_lower :
+                new_warnings.append(f"[Low Samples(EEVEE)]: {scene.eevee.taa_render_samples} samples!")
+    return new_warnings
+
+@headsup_rule("warn_27_a", inputs={INPUT_MODE, INPUT_RENDER}, options=("sample_limit_upper",))
+def check_high_samples(state):
+    new_warnings = []
+    scene = state.scene
+    prefs = state.prefs
+    if state.mode == 'OBJECT':
+        if scene.render.engine  == "CYCLES":
+            if scene.cycles.samples >= prefs.sample_limit_upper :
+                new_warnings.append(f"[High Samples(Cycles)]: {scene.cycles.samples} samples!")
+        if scene.render.engine == "BLENDER_EEVEE":
+            if scene.eevee.taa_render_samples >= prefs.sample_limit_upper :
+                new_warnings.append(f"[High Samples(EEVEE)]: {scene.eevee.taa_render_samples} samples!")
+    return new_warnings
+
+@headsup_rule("warn_28", inputs={INPUT_MODE, INPUT_ACTIVE_OBJECT})
+def check_relative_array(state):
+    new_warnings = []
+    active_obj = state.active_obj
+    if state.mode == 'OBJECT':
+        if active_obj and active_obj.modifiers:
+            for i, mod in enumerate(active_obj.modifiers):
+                if mod.type == 'ARRAY' and mod.use_relative_offset:
+                    if i != 0:
+                        new_warnings.append(f"Modifiers before [Array] with Relative Offset!")
+    return new_warnings
+
+@headsup_rule("warn_29", inputs={INPUT_WINDOWS})
+def check_hidden_object_types(state):
+    new_warnings = []
+    for space in get_snapshot(state).spaces:
+        if space.hidden_mask:
+            new_warnings.append(HEADSUP_Warning(f"[Viewport doesn't show: {object_type_labels(space.hidden_mask)}]", scope=space.identifier))
+    return new_warnings
+
+@headsup_rule("warn_30", inputs={INPUT_WINDOWS})
+def check_unselectable_object_types(state):
+    new_warnings = []
+    for space in get_snapshot(state).spaces:
+        if space.unselectable_mask:
+            new_warnings.append(HEADSUP_Warning(f"[Viewport can't select: {object_type_labels(space.unselectable_mask)}]", scope=space.identifier))
+    return new_warnings
+
+@headsup_rule("warn_31", inputs={INPUT_SCENE})
+def check_preview_range(state):
+    scene = state.scene
+    if scene.use_preview_range:
+        if scene.frame_preview_start != scene.frame_start or scene.frame_preview_end != scene.frame_end:
+            return [f"[Preview Range]: {scene.frame_preview_start}-{scene.frame_preview_end}!"]
+    return []
+
+@headsup_rule("warn_32", inputs={INPUT_MODE, INPUT_RENDER}, options=("warn_32_a",))
+def check_render_device(state):
+    scene = state.scene
+    if state.mode == 'OBJECT':
+        if scene.render.engine  == "CYCLES":
+            if state.prefs.warn_32_a == 'GPU':
+                if scene.cycles.device == 'CPU':
+                    return [f"[Cycles not using GPU]"]
+            else:
+                if scene.cycles.device == 'GPU':
+                    return [f"[Cycles not using CPU]"]
+    return []
+
+@headsup_rule("warn_33", inputs={INPUT_MODE, INPUT_ACTIVE_OBJECT})
+def check_locked_transforms(state):
+    active_obj = state.active_obj
+    if active_obj and state.mode == 'OBJECT':
+        lock_warnings = []
+        if any(active_obj.lock_scale):
+            locked_axes = ",".join(axis for axis, locked in zip("XYZ", active_obj.lock_scale) if locked)
+            lock_warnings.append(f"Scale({locked_axes})")
+        if any(active_obj.lock_location):
+            locked_axes = ",".join(axis for axis, locked in zip("XYZ", active_obj.lock_location) if locked)
+            lock_warnings.append(f"Location({locked_axes})")
+        if any(active_obj.lock_rotation):
+            locked_axes = ",".join(axis for axis, locked in zip("XYZ", active_obj.lock_rotation) if locked)
+            lock_warnings.append(f"Rotation({locked_axes})")
+        if len(lock_warnings) > 0:
+            lock_message = ", ".join(lock_warnings)
+            return [f"[Lock {lock_message}] for Active Object"]
+    return []
+
+@headsup_rule("warn_34", inputs={INPUT_ACTIVE_OBJECT})
+def check_rest_position(state):
+    active_obj = state.active_obj
+    if active_obj and active_obj.type == 'ARMATURE':
+        if active_obj.data.pose_position == 'REST':
+            return [f"Active Rig is in [Rest Position]"]
+    return []
+
+@headsup_rule("warn_35", inputs={INPUT_MODE, INPUT_RENDER, INPUT_VIEW_LAYERS})
+def check_material_override(state):
+    new_warnings = []
+    scene = state.scene
+    if scene.render.engine  == "CYCLES":
+        if state.mode == 'OBJECT':
+            view_layer_list = []
+            for view_layer in scene.view_layers:
+                if view_layer.material_override:
+                    view_layer_list.append(f"'{view_layer.name}'")
+            if len(view_layer_list) > 0:
+                new_warnings.append(f"[Material Override] for ViewLayer(s): {' | '.join(view_layer_list)}")
+            view_layer_list = []
+            for view_layer in scene.view_layers:
+                if bpy.app.version >= (4, 3, 0):
+                    if view_layer.world_override:
+                        view_layer_list.append(f"'{view_layer.name}'")
+            if len(view_layer_list) > 0:
+                new_warnings.append(f"[World Override] for ViewLayer(s): {' | '.join(view_layer_list)}")
+    return new_warnings
+
+@headsup_rule("warn_36", inputs={INPUT_MODE, INPUT_RENDER, INPUT_COMPOSITOR})
+def check_compositor_use_nodes(state):
+    new_warnings = []
+    scene = state.scene
+    if state.mode == 'OBJECT':
+        if bpy.app.version < (5, 0, 0):
+            if scene.render.use_compositing and not scene.use_nodes:
+                if scene.node_tree is not None:
+                    if len(scene.node_tree.nodes) > 0:
+                        new_warnings.append(f"[Compositor]: 'Use Nodes' is OFF, but contains nodes!")
+
+            if not scene.render.use_compositing and scene.use_nodes:
+                if scene.node_tree is not None:
+                    if len(scene.node_tree.nodes) > 0:
+                        new_warnings.append(f"[Compositor]: 'Use Nodes' is ON, but Postprocessing is OFF!")
+        else:
+            if not scene.render.use_compositing:
+                if  scene.compositing_node_group is not None:
+                    new_warnings.append(f"[Compositor]: has Compositing nodes, but Postprocessing is OFF!")
+    return new_warnings
+
+@headsup_rule("warn_37", inputs={INPUT_MODE, INPUT_RENDER})
+def check_video_output(state):
+    if state.mode == 'OBJECT':
+        try:
+            file_format = state.scene.render.image_settings.file_format
+            if file_format in {'FFMPEG', 'AVI_RAW', 'AVI_JPEG'}:
+                return [f"[File Output] is set to {file_format} video!"]
+        except:
+            print("HeadUp: Skipping File Output Check")
+    return []
+
+@headsup_rule("warn_38", inputs={INPUT_MODE, INPUT_RENDER}, options=("warn_38_a",))
+def check_film_transparent(state):
+    render = state.scene.render
+    if state.mode == 'OBJECT':
+        if state.prefs.warn_38_a == "OFF":
+            if not render.film_transparent:
+                return [f"[Film 'Transparent'] is OFF!"]
+        else:
+            if render.film_transparent:
+                return [f"[Film 'Transparent'] is ON!"]
+    return []
+
+@headsup_rule("warn_39", inputs={INPUT_SEQUENCER}, options=("warn_39_a",))
+def check_loud_audio(state):
+    scene = state.scene
+    threshold = state.prefs.warn_39_a
+    has_loud_audio_strips = any(
+        strip.type == 'SOUND' and strip.volume > threshold for strip in get_sequencer_strips(scene)
+    )
+    if has_loud_audio_strips:
+        return ["[Sequencer] contains LOUD audio strip(s)!"]
+    return []
+
+@headsup_rule("warn_40", inputs={INPUT_MODE, INPUT_ACTIVE_OBJECT})
+def check_render_subdivisions(state):
+    new_warnings = []
+    active_obj = state.active_obj
+    if state.mode == 'OBJECT':
+        if active_obj:
+            for modifier in active_obj.modifiers:
+                if modifier.show_render:
+                    if modifier.type in {'SUBSURF', 'MULTIRES'} and modifier.render_levels < modifier.levels:
+                        new_warnings.append(f"[{modifier.name}] Render subdivisions lower than viewport")
+    return new_warnings
+
+@headsup_rule("warn_41", inputs={INPUT_MODE, INPUT_MATERIALS})
+def check_undefined_nodes(state):
+    if state.check_materials:
+        HEADSUP_Props.undefined_nodes = []
+        for material in state.check_materials:
+            node_tree = material_tree(material)
+            if node_tree is None:
+                continue
+            # Unchanged trees and shared node groups are not walked again
+            undefined, _image_users = tree_summary(node_tree, state.tree_summaries)
+            if undefined:
+                HEADSUP_Props.undefined_nodes.append(material.name)
+                HEADSUP_Props.problematic_materials.add(material)
+    if HEADSUP_Props.undefined_nodes and state.mode == 'OBJECT':
+        return [f"[Undefined Nodes found] check HeadsUp SidePanel"]
+    return []
+
+def image_sequence_frames():
+    """Image → set of file frame numbers used by image nodes and textures."""
+    settings_by_image = []
+    node_trees = [mat.node_tree for mat in bpy.data.materials if mat.node_tree]
+    node_trees += [world.node_tree for world in bpy.data.worlds if world.node_tree]
+    node_trees += list(bpy.data.node_groups)
+    node_trees += [scene.node_tree for scene in bpy.data.scenes if getattr(scene, "node_tree", None)]
+    # Node groups are in the list themselves, the cached scans of unchanged trees are reused
+    for node_tree in node_trees:
+        scan = get_tree_scan(node_tree)
+        for _node_path, image, settings in scan.image_users + scan.other_image_users:
+            if is_valid_id(image):
+                settings_by_image.append((image, settings))
+    for texture in bpy.data.textures:
+        if getattr(texture, "image", None) and getattr(texture, "image_user", None):
+            image_user = texture.image_user
+            settings_by_image.append((texture.image, (image_user.frame_start, image_user.frame_offset, image_user.frame_duration)))
+
+    frames = {}
+    for image, (_frame_start, frame_offset, frame_duration) in settings_by_image:
+        if image is None or image.source != 'SEQUENCE':
+            continue
+        # Scene frames map to file frames 1 + offset ... duration + offset
+        first = frame_offset + 1
+        frames.setdefault(image, set()).update(range(first, first + frame_duration))
+    return frames
+
+@headsup_rule("warn_42", inputs={INPUT_IMAGES, INPUT_MATERIALS, INPUT_EXTERNAL_FILES})
+def check_missing_textures(state):
+    # Paths are checked by background workers, unknown ones count as present until then.
+    # Tiles and sequence frames are looked up in one cached listing of their directory.
+    new_warnings = []
+    missing_textures = False
+    sequence_frames = None
+    for external_file in get_external_files(("images",)):
+        image = external_file.owner
+        if image.users == 0:
+            continue
+        abs_path = external_file.abs_path
+        track_path(image, abs_path)
+        directory = os.path.dirname(abs_path)
+
+        if image.source == 'TILED' and ("<UDIM>" in abs_path or "<UVTILE>" in abs_path):
+            missing = missing_files(directory, tile_file_names(abs_path, [tile.number for tile in image.tiles]))
+            if missing:
+                new_warnings.append(f"[Missing UDIM Tiles] {image.name}: {format_numbers(missing)}")
+            continue
+
+        if image.source == 'SEQUENCE':
+            if sequence_frames is None:
+                sequence_frames = image_sequence_frames()
+            names = sequence_file_names(abs_path, sequence_frames.get(image, ()))
+            if names:
+                missing = missing_files(directory, names)
+                if missing:
+                    new_warnings.append(f"[Missing Sequence Frames] {image.name}: {format_numbers(missing)}")
+                continue
+
+        if path_exists(abs_path) is False:
+            missing_textures = True
+
+    if missing_textures:
+        new_warnings.insert(0, f"[Missing Textures] found")
+    return new_warnings
+
+@headsup_rule("warn_43", inputs={INPUT_LIBRARIES, INPUT_EXTERNAL_FILES})
+def check_missing_libraries(state):
+    broken_libraries = []
+    for external_file in get_external_files(("libraries",)):
+        track_path(external_file.owner, external_file.abs_path)
+        if path_exists(external_file.abs_path) is False:
+            broken_libraries.append(external_file.path)
+    if broken_libraries:
+        return [f"[Missing Libraries] found"]
+    return []
+
+@headsup_rule("warn_44", inputs={INPUT_FILE})
+def check_blender_version(state):
+    if not HEADSUP_Props.saved_just_now:
+        if bpy.app.version_file[:2] != bpy.data.version[:2]:
+            if not bpy.data.filepath == '':
+                return [f"[Blender Version] File was last saved with Blender {bpy.data.version[0]}.{bpy.data.version[1]}!"]
+    return []
+
+@headsup_rule("warn_45", inputs={INPUT_COMPOSITOR, INPUT_VIEW_LAYERS})
+def check_renderlayer_nodes(state):
+    if not HEADSUP_Props.compositor_check_bool:
+        # Nothing changed since the last check, keep the previous result
+        return HEADSUP_Props.rule_results.get("warn_45", [])
+    compositor_warnings = check_renderlayer_compositing_conditions()
+    # Compositor changes set the flag again through depsgraph updates and msgbus
+    HEADSUP_Props.compositor_check_bool = False
+    if compositor_warnings:
+        return [f"[Compositor]: {', '.join(set(compositor_warnings))}"]
+    return []
+
+@headsup_rule("warn_46", inputs={INPUT_ACTIVE_OBJECT})
+def check_in_front(state):
+    active_obj = state.active_obj
+    if active_obj and active_obj.show_in_front:
+        return [f"Active Object is [In Front]"]
+    return []
+
+@headsup_rule("warn_47", inputs={INPUT_ACTIVE_OBJECT})
+def check_texture_space(state):
+    active_obj = state.active_obj
+    if active_obj and active_obj.show_texture_space:
+        return [f"Active Object has [Texture Space] visible"]
+    return []
+
+@headsup_rule("warn_48", inputs={INPUT_ACTIVE_OBJECT})
+def check_display_type(state):
+    active_obj = state.active_obj
+    if active_obj and active_obj.type not in {'LIGHT', 'CAMERA', 'SPEAKER'}:
+        if active_obj.display_type == 'WIRE':
+            return [f"Active Object in [Wireframe Display Mode]"]
+        if active_obj.display_type == 'BOUNDS':
+            return [f"Active Object in [Bounds Display Mode]"]
+    return []
+
+@headsup_rule("warn_49", inputs={INPUT_ACTIVE_OBJECT})
+def check_collection_instance(state):
+    active_obj = state.active_obj
+    if active_obj and active_obj.type == 'EMPTY' and active_obj.instance_type != 'NONE':
+        return [f"Active Object has [Collection Instance] enabled"]
+    return []
+
+@headsup_rule("warn_50", inputs={INPUT_MODE, INPUT_ACTIVE_OBJECT})
+def check_face_vert_instance(state):
+    active_obj = state.active_obj
+    if state.mode == 'OBJECT':
+        if active_obj and active_obj.instance_type != 'NONE' and active_obj.type in {'MESH', 'FONT'}:
+            if active_obj.instance_type == 'FACES':
+                return [f"Active Object has [Face Instance] enabled"]
+            if active_obj.instance_type == 'VERTS':
+                return [f"Active Object has [Vertice Instance] enabled"]
+    return []
+
+@headsup_rule("warn_51", inputs={INPUT_MODE, INPUT_ACTIVE_OBJECT})
+def check_solo_shape_key(state):
+    active_obj = state.active_obj
+    if state.mode == 'OBJECT':
+        if active_obj and active_obj.type == 'MESH':
+            if active_obj.show_only_shape_key:
+                return ["Active Object has [Solo Active Shape Key] enabled"]
+    return []
+
+@headsup_rule("warn_52", inputs={INPUT_MODE, INPUT_ACTIVE_OBJECT})
+def check_shape_key_edit_mode(state):
+    active_obj = state.active_obj
+    if state.mode == 'EDIT_MESH':
+        if active_obj.data.shape_keys and len(active_obj.data.shape_keys.key_blocks) > 1 and active_obj.use_shape_key_edit_mode:
+            if active_obj.active_shape_key:
+                if active_obj.active_shape_key.value == 1.0:
+                    return ["Active Object has [Shape Key Edit Mode] enabled"]
+                return ["Active Object has [Shape Key Edit Mode] enabled, but active Shape Key value is not 1.0"]
+    return []
+
+# Images and libraries have rules of their own
+OTHER_FILE_COLLECTIONS = tuple(kind for kind in FILE_COLLECTIONS if kind not in {"images", "libraries"})
+
+@headsup_rule("warn_53", inputs={INPUT_EXTERNAL_FILES})
+def check_missing_external_files(state):
+    missing = []
+    for external_file in get_external_files(OTHER_FILE_COLLECTIONS):
+        # Output folders are created by the render
+        if external_file.is_output:
+            continue
+        if path_exists(external_file.abs_path) is False:
+            missing.append(external_file.label)
+    if missing:
+        return [f"[Missing Files] {format_labels(missing)}"]
+    return []
+
+@headsup_rule("warn_54", inputs={INPUT_EXTERNAL_FILES})
+def check_absolute_paths(state):
+    absolute = [external_file.label for external_file in get_external_files() if not external_file.is_relative]
+    if absolute:
+        return [f"[Absolute Paths] {format_labels(absolute)}"]
+    return []
+
+@headsup_rule("warn_55", inputs={INPUT_EXTERNAL_FILES, INPUT_FILE}, options=("warn_55_a",))
+def check_outside_project_root(state):
+    project_root = state.prefs.warn_55_a or os.path.dirname(bpy.data.filepath)
+    if not project_root:
+        return []
+    project_root = os.path.normpath(bpy.path.abspath(project_root))
+    outside = []
+    for external_file in get_external_files():
+        try:
+            inside = os.path.commonpath((project_root, external_file.abs_path)) == project_root
+        except ValueError:
+            inside = False  # Another drive
+        if not inside:
+            outside.append(external_file.label)
+    if outside:
+        return [f"[Outside Project Root] {format_labels(outside)}"]
+    return []
+
+@headsup_rule("custom_warn", inputs={INPUT_TEXTS}, info="custom")
+def check_custom_warnings(state):
+    new_warnings = []
+    for text_block in bpy.data.texts:
+        if text_block.lines:
+            first_line = text_block.lines[0].body.strip()
+            if first_line.lower().startswith("headsup:"):
+                message = first_line[8:].strip()  # Skip the first 8 characters ("Headsup:")
+                new_warnings.append(f"[CUSTOM] {message}")
+    return new_warnings
+
+def check_object_mismatches(scene):
+    """Find objects with mismatched hide_render and hide_viewport statuses."""
+    try:
+        SKIPPED_TYPES = {'CAMERA', 'LATTICE', 'ARMATURE', 'SPEAKER'}
+
+        object_view_layer_map = {}
+
+        # Only objects whose flags differ in the visibility snapshot are looked at
+        for obj in mismatched_objects(scene):
+            if obj.type in SKIPPED_TYPES:
+                continue
+            if obj.type == 'EMPTY':
+                if obj.instance_collection == None:
+                    continue
+
+            # The object has a mismatch, add it to the map and problematic_objects if a view layer renders it
+            object_view_layer_map[obj] = visible_view_layers(obj)
+            if object_view_layer_map[obj]:
+                HEADSUP_Props.problematic_objects.add(obj)
+
+        # Build mismatch list
+        mismatch_list = [
+            {"object": obj, "view_layers": view_layers}
+            for obj, view_layers in object_view_layer_map.items()
+            if view_layers
+        ]
+
+        return mismatch_list
+    except Exception:
+        print("HeadsUp [check_object_mismatches] Error:")
+        traceback.print_exc()
+        return []
+
+def check_collection_mismatches():
+    """Find collections with mismatched hide_render and hide_viewport attributes."""
+    try:
+        # Shares the walk and its cached subtrees with update_visible_collections
+        return collection_mismatches()
+    except Exception:
+        print("HeadsUp [check_collection_mismatches] Error:")
+        traceback.print_exc()
+        return []
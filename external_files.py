@@ -0,0 +1,179 @@
+import bpy
+import os
+
+from .properties import HEADSUP_Props
+from .changes import is_valid_id
+
+# Data collections holding IDs that reference files on disk. Scenes own
+# sequencer strips and File Output nodes, objects own point caches.
+FILE_COLLECTIONS = (
+    "images", "libraries", "movieclips", "sounds", "fonts", "volumes",
+    "cache_files", "scenes", "objects",
+)
+
+# Data collection of each ID type
+ID_TYPE_KINDS = {
+    'IMAGE': "images",
+    'LIBRARY': "libraries",
+    'MOVIECLIP': "movieclips",
+    'SOUND': "sounds",
+    'FONT': "fonts",
+    'VOLUME': "volumes",
+    'CACHEFILE': "cache_files",
+    'SCENE': "scenes",
+    'OBJECT': "objects",
+}
+
+# Warning label of each ID type
+ID_LABELS = {
+    "images": "Image",
+    "libraries": "Library",
+    "movieclips": "Movie Clip",
+    "sounds": "Sound",
+    "fonts": "Font",
+    "volumes": "Volume",
+    "cache_files": "Cache File",
+}
+
+
+class HEADSUP_ExternalFile:
+    """A single file or directory a data-block reads from or writes to."""
+
+    __slots__ = ("kind", "owner", "label", "path", "abs_path", "is_output")
+
+    def __init__(self, kind, owner, label, path, is_output=False):
+        self.kind = kind            # Data collection of the owner, e.g. "images"
+        self.owner = owner          # ID the path belongs to
+        self.label = label          # Shown in warnings, e.g. "Sound 'music'"
+        self.path = path            # As stored in the file, "//" for relative paths
+        self.abs_path = os.path.normpath(bpy.path.abspath(path, library=owner.library))
+        self.is_output = is_output  # Written by a render, only has to be portable
+
+    @property
+    def is_relative(self):
+        return self.path.startswith("//")
+
+    def __repr__(self):
+        return f"<HEADSUP_ExternalFile {self.label} {self.path!r}>"
+
+
+def _is_packed(id_data):
+    return bool(getattr(id_data, "packed_file", None))
+
+
+def _strip_files(scene):
+    """Movie and image strips of ``scene``, sound strips are covered by bpy.data.sounds."""
+    if not scene.sequence_editor:
+        return
+    strips = getattr(scene.sequence_editor, "strips_all", None)
+    if strips is None:
+        strips = scene.sequence_editor.sequences_all
+    for strip in strips:
+        if strip.type == 'MOVIE' and strip.filepath:
+            yield strip.name, strip.filepath
+        elif strip.type == 'IMAGE' and strip.directory and len(strip.elements):
+            yield strip.name, os.path.join(strip.directory, strip.elements[0].filename)
+
+
+def _file_output_paths(scene):
+    """Base paths of the File Output nodes in the compositor of ``scene``."""
+    node_tree = getattr(scene, "compositing_node_group", None) or getattr(scene, "node_tree", None)
+    if node_tree is None:
+        return
+    for node in node_tree.nodes:
+        if node.type != 'OUTPUT_FILE':
+            continue
+        # Renamed to "directory" in Blender 5.0
+        path = getattr(node, "base_path", None) or getattr(node, "directory", None)
+        if path:
+            yield node.name, path
+
+
+def _point_caches(obj):
+    """Point caches of ``obj`` that read from or write to a user chosen directory."""
+    caches = [(modifier.name, getattr(modifier, "point_cache", None)) for modifier in obj.modifiers]
+    caches += [(system.name, system.point_cache) for system in obj.particle_systems]
+    for name, cache in caches:
+        if cache is not None and cache.use_external and cache.filepath:
+            yield name, cache.filepath, False
+    for modifier in obj.modifiers:
+        if modifier.type == 'FLUID' and modifier.fluid_type == 'DOMAIN':
+            yield modifier.name, modifier.domain_settings.cache_directory, True
+
+
+def id_files(kind, id_data):
+    """External files referenced by one data-block."""
+    if kind == "scenes":
+        files = [HEADSUP_ExternalFile(kind, id_data, f"Strip '{name}'", path)
+                 for name, path in _strip_files(id_data)]
+        files += [HEADSUP_ExternalFile(kind, id_data, f"File Output '{name}'", path, is_output=True)
+                  for name, path in _file_output_paths(id_data)]
+        return files
+    if kind == "objects":
+        return [HEADSUP_ExternalFile(kind, id_data, f"Cache '{id_data.name}/{name}'", path, is_output)
+                for name, path, is_output in _point_caches(id_data) if path]
+
+    if _is_packed(id_data) or not id_data.filepath:
+        return []
+    if kind == "images" and id_data.source not in {'FILE', 'SEQUENCE', 'MOVIE', 'TILED'}:
+        return []
+    if kind == "fonts" and id_data.filepath == "<builtin>":
+        return []
+    return [HEADSUP_ExternalFile(kind, id_data, f"{ID_LABELS[kind]} '{id_data.name}'", id_data.filepath)]
+
+
+def _index_collection(kind):
+    return {id_data.as_pointer(): id_files(kind, id_data) for id_data in getattr(bpy.data, kind)}
+
+
+def mark_external_ids(ids):
+    """Re-read the files of ``ids`` on the next ``get_external_files``."""
+    HEADSUP_Props.external_dirty_ids.update(ids)
+
+
+def mark_external_kind(kind):
+    """Re-read a whole data collection, used by msgbus callbacks that don't tell which ID changed."""
+    HEADSUP_Props.external_dirty_kinds.add(kind)
+
+
+def invalidate_external_files():
+    HEADSUP_Props.external_files = None
+    HEADSUP_Props.external_dirty_ids = set()
+    HEADSUP_Props.external_dirty_kinds = set()
+    HEADSUP_Props.strip_counts = {}
+
+
+def get_external_files(kinds=FILE_COLLECTIONS):
+    """Up to date list of the external files, one pass over ``bpy.data`` on the first call.
+
+    Afterwards only the data-blocks reported by the depsgraph or msgbus are
+    read again. A collection is re-read completely when its length changed,
+    that is when data-blocks were added or removed.
+    """
+    index = HEADSUP_Props.external_files
+    if index is None:
+        index = HEADSUP_Props.external_files = {kind: _index_collection(kind) for kind in FILE_COLLECTIONS}
+    else:
+        dirty_kinds = HEADSUP_Props.external_dirty_kinds
+        for kind in FILE_COLLECTIONS:
+            if kind in dirty_kinds or len(index[kind]) != len(getattr(bpy.data, kind)):
+                index[kind] = _index_collection(kind)
+                dirty_kinds.add(kind)
+        for id_data in HEADSUP_Props.external_dirty_ids:
+            if not is_valid_id(id_data):
+                continue
+            kind = ID_TYPE_KINDS.get(id_data.id_type)
+            if kind is not None and kind not in dirty_kinds:
+                index[kind][id_data.as_pointer()] = id_files(kind, id_data)
+    HEADSUP_Props.external_dirty_ids = set()
+    HEADSUP_Props.external_dirty_kinds = set()
+
+    return [file for kind in kinds for files in index[kind].values() for file in files]
+
+
+def format_labels(labels, max_labels=3):
+    """"Sound 'a', Font 'b' +2" style list of labels."""
+    text = ", ".join(labels[:max_labels])
+    if len(labels) > max_labels:
+        text += f" +{len(labels) - max_labels}"
+    return text
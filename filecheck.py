@@ -0,0 +1,323 @@
+import bpy
+import os
+import queue
+import re
+import threading
+import time
+import traceback
+
+from .properties import HEADSUP_Props
+from .rules import *
+from .scheduler import *
+from .stat_cache import *
+
+WORKER_COUNT = 4
+MAX_STUCK_WORKERS = 4       # Stuck threads can't be stopped, replace at most this many at a time
+PATH_TIMEOUT = 2.0          # Seconds a single stat may take before its mount counts as unreachable
+MOUNT_COOLDOWN = 30.0       # Seconds an unreachable mount is not touched again
+CACHE_LIFETIME = 10.0       # Seconds after which a cached result is refreshed in the background
+DRAIN_INTERVAL = 0.1
+
+# Frame number of an image sequence file: the last group of digits
+SEQUENCE_DIGITS = re.compile(r"\d+(?=\D*$)")
+
+# Kinds of background checks
+CHECK_PATH = 'PATH'             # existence, size and mtime of a file
+CHECK_DIRECTORY = 'DIRECTORY'   # mtime and names of a directory
+
+# Filled by the main thread, emptied by the workers
+_requests = queue.Queue()
+# Filled by the workers, drained on the main thread by drain_results
+_results = queue.Queue()
+# (kind, path) → (monotonic time a worker started checking it, worker thread), written by the workers
+_started = {}
+_workers = []
+_stuck_workers = []     # Replaced workers still blocked in a stat, they exit once it returns
+# Result of a request dropped because the breaker of its mount opened while it was queued
+SKIPPED = object()
+
+
+def _stat_path(path):
+    """(exists, size, mtime) of ``path``."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False, None, None
+    return True, stat.st_size, stat.st_mtime
+
+
+def _list_directory(directory, cached_mtime):
+    """(mtime, names) of ``directory``, names is None if the mtime did not change."""
+    try:
+        mtime = os.stat(directory).st_mtime
+    except OSError:
+        return None
+    if mtime == cached_mtime:
+        return mtime, None
+    with os.scandir(directory) as entries:
+        return mtime, frozenset(entry.name for entry in entries)
+
+
+def _worker():
+    """Check paths until the add-on is disabled or the worker was replaced. Never touches bpy."""
+    while True:
+        request = _requests.get()
+        if request is None:
+            return
+        kind, path, cached_mtime = request
+        # Requests queued for a mount that stopped responding would block this worker too
+        if HEADSUP_Props.unreachable_mounts.get(mount_of(path), 0.0) > time.monotonic():
+            _results.put((kind, path, SKIPPED))
+            continue
+        _started[(kind, path)] = (time.monotonic(), threading.current_thread())
+        try:
+            if kind == CHECK_PATH:
+                value = _stat_path(path)
+            else:
+                value = _list_directory(path, cached_mtime)
+        except Exception:
+            value = (False, None, None) if kind == CHECK_PATH else None
+        _results.put((kind, path, value))
+        if threading.current_thread() not in _workers:
+            # Replaced while it was stuck
+            return
+
+
+def _start_worker():
+    worker = threading.Thread(target=_worker, name="HeadsUp file check", daemon=True)
+    worker.start()
+    _workers.append(worker)
+
+
+def _fill_workers():
+    """Start workers up to WORKER_COUNT while fewer than MAX_STUCK_WORKERS are stuck."""
+    _stuck_workers[:] = [thread for thread in _stuck_workers if thread.is_alive()]
+    while len(_workers) < WORKER_COUNT and len(_stuck_workers) + len(_workers) < WORKER_COUNT + MAX_STUCK_WORKERS:
+        _start_worker()
+
+
+def mount_of(path):
+    """Drive, UNC share or first two directories of ``path``, the unit of the circuit breaker."""
+    drive, rest = os.path.splitdrive(path)
+    if drive:
+        return drive
+    parts = rest.split(os.sep)
+    return os.sep.join(parts[:3])
+
+
+def is_mount_unreachable(mount):
+    open_until = HEADSUP_Props.unreachable_mounts.get(mount)
+    if open_until is None:
+        return False
+    if time.monotonic() < open_until:
+        return True
+    # Let the next check probe the mount again
+    del HEADSUP_Props.unreachable_mounts[mount]
+    return False
+
+
+def _submit(kind, path, cached_mtime=None):
+    key = (kind, path)
+    if key in HEADSUP_Props.pending_paths:
+        return
+    if len(_workers) < WORKER_COUNT:
+        _fill_workers()
+    HEADSUP_Props.pending_paths[key] = time.monotonic()
+    _requests.put((kind, path, cached_mtime))
+    if not bpy.app.timers.is_registered(drain_results):
+        # Persistent, results of the old file still have to leave the queue after a load
+        bpy.app.timers.register(drain_results, first_interval=DRAIN_INTERVAL, persistent=True)
+
+
+def path_exists(path):
+    """Cached existence of ``path``, None while the first check is still running.
+
+    Paths on a mount that timed out recently count as missing. Stale results
+    are returned while they are refreshed in the background. With the
+    persistent stat cache enabled, results of earlier sessions count as well.
+    """
+    if is_mount_unreachable(mount_of(path)):
+        return False
+    cached = HEADSUP_Props.path_cache.get(path)
+    if cached is None:
+        cached = load_stat(path, time.monotonic())
+        if cached is not None:
+            HEADSUP_Props.path_cache[path] = cached
+    if cached is None or time.monotonic() - cached[1] > CACHE_LIFETIME:
+        _submit(CHECK_PATH, path)
+    return cached[0] if cached is not None else None
+
+
+def directory_index(directory):
+    """Cached set of file names in ``directory``.
+
+    None while the first listing is still running, an empty set if the
+    directory is missing or unreachable. Stale listings are refreshed in the
+    background, but only re-read if the directory mtime changed.
+    """
+    if is_mount_unreachable(mount_of(directory)):
+        return frozenset()
+    cached = HEADSUP_Props.directory_cache.get(directory)
+    if cached is None or time.monotonic() - cached[2] > CACHE_LIFETIME:
+        _submit(CHECK_DIRECTORY, directory, cached[0] if cached is not None else None)
+    return cached[1] if cached is not None else None
+
+
+def tile_file_names(path, tile_numbers):
+    """File name of every UDIM tile, ``path`` contains <UDIM> or <UVTILE>."""
+    basename = os.path.basename(path)
+    names = {}
+    for number in tile_numbers:
+        u = (number - 1001) % 10 + 1
+        v = (number - 1001) // 10 + 1
+        names[number] = basename.replace("<UDIM>", str(number)).replace("<UVTILE>", f"u{u}_v{v}")
+    return names
+
+
+def sequence_file_names(path, frames):
+    """File name of every frame, numbered like the last digit group of ``path``."""
+    basename = os.path.basename(path)
+    match = SEQUENCE_DIGITS.search(basename)
+    if match is None:
+        return {}
+    head, digits, tail = basename[:match.start()], match.group(0), basename[match.end():]
+    return {frame: f"{head}{str(frame).zfill(len(digits))}{tail}" for frame in frames}
+
+
+def missing_files(directory, names):
+    """Sorted keys of ``names`` whose file is not in ``directory``, None while it is being listed."""
+    index = directory_index(directory)
+    if index is None:
+        return None
+    return sorted(key for key, name in names.items() if name not in index)
+
+
+def format_numbers(numbers, max_ranges=5):
+    """Compact "1002, 1005-1007" style list of sorted numbers."""
+    ranges = []
+    for number in numbers:
+        if ranges and number == ranges[-1][1] + 1:
+            ranges[-1][1] = number
+        else:
+            ranges.append([number, number])
+    text = ", ".join(str(first) if first == last else f"{first}-{last}" for first, last in ranges[:max_ranges])
+    if len(ranges) > max_ranges:
+        text += ", …"
+    return text
+
+
+def track_path(id_data, path):
+    """Forget the cached result of the previous path once an ID points somewhere else."""
+    pointer = id_data.as_pointer()
+    previous = HEADSUP_Props.id_paths.get(pointer)
+    if previous != path:
+        if previous is not None:
+            HEADSUP_Props.path_cache.pop(previous, None)
+            HEADSUP_Props.directory_cache.pop(os.path.dirname(previous), None)
+        HEADSUP_Props.id_paths[pointer] = path
+
+
+def _store_result(kind, path, value):
+    """Put a worker result into its cache, True if the cached answer changed."""
+    now = time.monotonic()
+    if kind == CHECK_PATH:
+        exists = value[0]
+        queue_stat(path, value)
+        previous = HEADSUP_Props.path_cache.get(path)
+        HEADSUP_Props.path_cache[path] = (exists, now)
+        return previous is None or previous[0] != exists
+
+    previous = HEADSUP_Props.directory_cache.get(path)
+    if value is None:
+        HEADSUP_Props.directory_cache[path] = (None, frozenset(), now)
+        return previous is None or previous[0] is not None
+    mtime, names = value
+    if names is None:
+        # Unchanged since the cached listing
+        if previous is not None:
+            HEADSUP_Props.directory_cache[path] = (mtime, previous[1], now)
+        return False
+    HEADSUP_Props.directory_cache[path] = (mtime, names, now)
+    return previous is None or previous[1] != names
+
+
+def drain_results():
+    """Timer moving worker results into the caches and re-running the file rules."""
+    try:
+        changed = False
+        while True:
+            try:
+                kind, path, value = _results.get_nowait()
+            except queue.Empty:
+                break
+            HEADSUP_Props.pending_paths.pop((kind, path), None)
+            _started.pop((kind, path), None)
+            if value is SKIPPED:
+                # Counts as missing through the open breaker, checked again once it closes
+                continue
+            if _store_result(kind, path, value):
+                changed = True
+            # A late answer closes the breaker again
+            HEADSUP_Props.unreachable_mounts.pop(mount_of(path), None)
+        flush_stats()
+
+        now = time.monotonic()
+        for key, (started, thread) in list(_started.items()):
+            if now - started > PATH_TIMEOUT and key in HEADSUP_Props.pending_paths:
+                # The worker is stuck in the stat, replace it and stop asking this mount
+                mount = mount_of(key[1])
+                del HEADSUP_Props.pending_paths[key]
+                _started.pop(key, None)
+                HEADSUP_Props.unreachable_mounts[mount] = now + MOUNT_COOLDOWN
+                if thread in _workers:
+                    _workers.remove(thread)
+                    _stuck_workers.append(thread)
+                _fill_workers()
+                changed = True
+                print(f"HeadsUp: {key[1]} did not respond within {PATH_TIMEOUT}s, skipping {mount} for {MOUNT_COOLDOWN}s")
+
+        if not _workers:
+            _fill_workers()
+        if not _workers:
+            # Too many workers are stuck to start new ones, queued requests would wait forever.
+            # They stay unknown, the next evaluation submits them again
+            for key, queued in list(HEADSUP_Props.pending_paths.items()):
+                if key not in _started and now - queued > PATH_TIMEOUT:
+                    del HEADSUP_Props.pending_paths[key]
+
+        if changed:
+            request_inputs({INPUT_IMAGES, INPUT_LIBRARIES, INPUT_EXTERNAL_FILES})
+    except Exception:
+        print("HeadsUp [drain_results] Error:")
+        traceback.print_exc()
+
+    if HEADSUP_Props.pending_paths or not _results.empty():
+        return DRAIN_INTERVAL
+    return None
+
+
+def reset_file_checks():
+    """Forget cached results and breakers, e.g. after loading another file."""
+    HEADSUP_Props.path_cache = {}
+    HEADSUP_Props.directory_cache = {}
+    HEADSUP_Props.id_paths = {}
+    HEADSUP_Props.unreachable_mounts = {}
+
+
+def stop_file_checks():
+    """Let the workers finish, stuck ones are daemon threads and die with Blender."""
+    global _requests, _results
+    for _worker_thread in _workers:
+        _requests.put(None)
+    _workers.clear()
+    _stuck_workers.clear()
+    # Stuck workers that come back later must not pick up the sentinels of new ones
+    _requests = queue.Queue()
+    _results = queue.Queue()
+    if bpy.app.timers.is_registered(drain_results):
+        bpy.app.timers.unregister(drain_results)
+    HEADSUP_Props.pending_paths = {}
+    _started.clear()
+    reset_file_checks()
+    flush_stats()
+    close_stat_cache()
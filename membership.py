@@ -0,0 +1,144 @@
+import bpy
+import traceback
+
+from .properties import HEADSUP_Props
+
+
+def collection_bit(collection):
+    """Bit of ``collection`` in the membership and view layer masks, assigned on first use."""
+    pointer = collection.as_pointer()
+    bit = HEADSUP_Props.collection_bits.get(pointer)
+    if bit is None:
+        bit = HEADSUP_Props.collection_bits[pointer] = 1 << len(HEADSUP_Props.collection_bits)
+    return bit
+
+
+def object_mask(obj):
+    """Bits of the collections ``obj`` is linked to, cached until its collections change."""
+    pointer = obj.as_pointer()
+    mask = HEADSUP_Props.object_masks.get(pointer)
+    if mask is None:
+        mask = 0
+        for collection in obj.users_collection:
+            mask |= collection_bit(collection)
+        HEADSUP_Props.object_masks[pointer] = mask
+    return mask
+
+
+def visible_view_layers(obj):
+    """Names of the used view layers that render ``obj``, one AND per layer."""
+    mask = object_mask(obj)
+    return [layer_name for layer_name, layer_mask in HEADSUP_Props.view_layer_masks.items() if mask & layer_mask]
+
+
+def invalidate_object_masks(objects=None):
+    """Forget the cached membership of ``objects``, or of all objects."""
+    if objects is None:
+        HEADSUP_Props.object_masks = {}
+        return
+    for obj in objects:
+        HEADSUP_Props.object_masks.pop(obj.as_pointer(), None)
+
+
+def reset_membership():
+    """Forget all bits, masks and walked trees, e.g. after loading another file."""
+    HEADSUP_Props.collection_bits = {}
+    HEADSUP_Props.object_masks = {}
+    HEADSUP_Props.view_layer_masks = {}
+    HEADSUP_Props.subtree_results = {}
+
+
+def walk_layer(layer):
+    """(visible mask, mismatched collection names) of the layer collection tree of ``layer``.
+
+    One iterative pass yields both results. Subtrees are cached per layer,
+    so only the subtrees dropped by ``invalidate_collection_subtrees`` are
+    walked again. They are keyed by the path of collection pointers from the
+    root, a collection linked under several parents has a LayerCollection
+    with its own exclude flag for every link.
+    """
+    cache = HEADSUP_Props.subtree_results.setdefault(layer.as_pointer(), {})
+    root = layer.layer_collection
+    root_path = (root.collection.as_pointer(),)
+    stack = [(root, root_path, False)]
+    while stack:
+        layer_coll, path, children_done = stack.pop()
+        collection = layer_coll.collection
+        if not children_done:
+            if path in cache:
+                continue
+            stack.append((layer_coll, path, True))
+            for child in layer_coll.children:
+                stack.append((child, path + (child.collection.as_pointer(),), False))
+            continue
+
+        mask = 0
+        mismatches = []
+        # Excluded collections are skipped themselves, their children are still checked
+        if not layer_coll.exclude:
+            if collection.hide_render != collection.hide_viewport:
+                mismatches.append(collection.name)
+            if not collection.hide_render:
+                mask = collection_bit(collection)
+        for child in layer_coll.children:
+            child_mask, child_mismatches = cache[path + (child.collection.as_pointer(),)]
+            # Children of a collection hidden in render are never rendered
+            if not collection.hide_render:
+                mask |= child_mask
+            mismatches.extend(child_mismatches)
+        cache[path] = (mask, tuple(mismatches))
+    return cache[root_path]
+
+
+def walk_view_layers():
+    """Walk every view layer of the scene, cached subtrees are reused."""
+    view_layers = bpy.context.scene.view_layers
+    # Trees of removed layers and other scenes are dropped
+    layer_pointers = {layer.as_pointer() for layer in view_layers}
+    for layer_pointer in list(HEADSUP_Props.subtree_results):
+        if layer_pointer not in layer_pointers:
+            del HEADSUP_Props.subtree_results[layer_pointer]
+    return [(layer, walk_layer(layer)) for layer in view_layers]
+
+
+def invalidate_collection_subtrees(collections=None):
+    """Walk every link of ``collections`` and all their ancestors again, or every tree without ``collections``."""
+    if collections is None:
+        HEADSUP_Props.subtree_results = {}
+        return
+    pointers = {collection.as_pointer() for collection in collections}
+    for layer_results in HEADSUP_Props.subtree_results.values():
+        for path in list(layer_results):
+            if pointers.isdisjoint(path):
+                continue
+            # The path itself and its prefixes, the ancestors up to the root
+            for length in range(1, len(path) + 1):
+                layer_results.pop(path[:length], None)
+
+
+def update_visible_collections():
+    """Store per used view layer the bits of the collections it renders.
+
+    Object masks stay valid, only the layer masks depend on exclude and
+    hide_render.
+    """
+    HEADSUP_Props.view_layer_masks = {}
+    try:
+        for layer, (layer_mask, _mismatches) in walk_view_layers():
+            if layer.use:
+                HEADSUP_Props.view_layer_masks[layer.name] = layer_mask
+    except Exception:
+        print("HeadsUp [update_visible_collections] Error:")
+        traceback.print_exc()
+
+
+def collection_mismatches():
+    """Collections with differing hide_render and hide_viewport, with the view layers including them."""
+    mismatch_dict = {}
+    for layer, (_layer_mask, mismatches) in walk_view_layers():
+        for collection_name in mismatches:
+            view_layers = mismatch_dict.setdefault(collection_name, [])
+            if layer.name not in view_layers:
+                view_layers.append(layer.name)
+    return [{"collection_name": collection_name, "view_layers": view_layers}
+            for collection_name, view_layers in mismatch_dict.items()]
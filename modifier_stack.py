@@ -0,0 +1,78 @@
+import bpy
+
+from .properties import HEADSUP_Props
+from .changes import is_valid_id
+from .membership import *
+
+if bpy.app.version >= (4, 3, 0):
+    CHECKED_TYPES = {'MESH', 'CURVE', 'LATTICE', 'FONT', 'GREASEPENCIL'}
+else:
+    CHECKED_TYPES = {'MESH', 'CURVE', 'LATTICE', 'FONT', 'GPENCIL'}
+
+
+def has_stack_mismatch(obj):
+    """True if a modifier of ``obj`` differs between viewport and render.
+
+    Cached per object until the depsgraph reports it, see ``invalidate_stack_mismatches``.
+    """
+    pointer = obj.as_pointer()
+    mismatch = HEADSUP_Props.stack_mismatches.get(pointer)
+    if mismatch is None:
+        mismatch = HEADSUP_Props.stack_mismatches[pointer] = any(
+            modifier.show_viewport != modifier.show_render for modifier in obj.modifiers)
+    return mismatch
+
+
+def invalidate_stack_mismatches(objects=None):
+    """Read the modifier stacks of ``objects``, or of all objects, again on their next check."""
+    if objects is None:
+        HEADSUP_Props.stack_mismatches = {}
+        return
+    for obj in objects:
+        HEADSUP_Props.stack_mismatches.pop(obj.as_pointer(), None)
+
+
+def reset_modifier_mismatches(stacks=True):
+    """Forget the tracked mismatches, and with ``stacks`` the cached stack results as well."""
+    HEADSUP_Props.modifier_mismatch_index = {}
+    HEADSUP_Props.modifier_mismatch_layers = {}
+    HEADSUP_Props.modifier_mismatches = []
+    HEADSUP_Props.modifier_pending_objects = set()
+    if stacks:
+        invalidate_stack_mismatches()
+
+
+def update_modifier_mismatches(check_objects):
+    """Re-check ``check_objects`` and refresh the scene-wide mismatch lists.
+
+    Objects that are not on the check-list keep their previous result, the
+    lists are rebuilt from the tracked mismatches only.
+    """
+    index = HEADSUP_Props.modifier_mismatch_index
+    for obj in check_objects:
+        if not is_valid_id(obj):
+            continue
+        pointer = obj.as_pointer()
+        index.pop(pointer, None)
+        if obj.type not in CHECKED_TYPES:
+            continue
+        # Skip objects fully hidden
+        if obj.hide_viewport and obj.hide_render:
+            continue
+        if not has_stack_mismatch(obj):
+            continue
+        # View layers rendering one of the object's collections
+        view_layers = visible_view_layers(obj)
+        if view_layers:
+            index[pointer] = (obj, view_layers)
+
+    layers = {}
+    for pointer, (obj, view_layers) in list(index.items()):
+        if not is_valid_id(obj):
+            del index[pointer]
+            continue
+        for layer_name in view_layers:
+            layers.setdefault(layer_name, []).append(obj)
+    HEADSUP_Props.modifier_mismatch_layers = layers
+    HEADSUP_Props.modifier_mismatches = [{"object": obj, "view_layers": view_layers}
+                                         for obj, view_layers in index.values()]
@@ -0,0 +1,163 @@
+import bpy
+
+from .properties import HEADSUP_Props
+from .changes import is_valid_id
+
+
+class HEADSUP_TreeScan:
+    """What the material rules read from the nodes of one node tree, without its node groups."""
+
+    __slots__ = ("fingerprint", "undefined", "image_users", "other_image_users", "groups")
+
+    def __init__(self, fingerprint):
+        self.fingerprint = fingerprint
+        self.undefined = False      # Contains an 'Undefined' node
+        self.image_users = []       # (node path, image, (frame start, offset, duration)) of image nodes
+        self.other_image_users = [] # The same for other nodes with an image user, e.g. environment textures
+        self.groups = []            # Node trees of the group nodes
+
+
+def tree_fingerprint(node_tree):
+    """Cheap structural fingerprint, catches added and removed nodes and links.
+
+    Changed node settings don't alter it, the depsgraph reports those and
+    ``invalidate_tree_scans`` drops the tree.
+    """
+    return len(node_tree.nodes), len(node_tree.links)
+
+
+def scan_tree(node_tree):
+    scan = HEADSUP_TreeScan(tree_fingerprint(node_tree))
+    for node in node_tree.nodes:
+        if "undefined" in node.bl_idname.lower():
+            scan.undefined = True
+            continue
+        if node.type == 'GROUP':
+            if node.node_tree:
+                scan.groups.append(node.node_tree)
+            continue
+        image = getattr(node, "image", None)
+        image_user = getattr(node, "image_user", None)
+        if image and image_user:
+            settings = (image_user.frame_start, image_user.frame_offset, image_user.frame_duration)
+            users = scan.image_users if node.type == 'TEX_IMAGE' else scan.other_image_users
+            users.append((node.name, image, settings))
+    return scan
+
+
+def get_tree_scan(node_tree):
+    """Scan of ``node_tree``, only repeated if the tree was reported as changed."""
+    key = node_tree.as_pointer()
+    scan = HEADSUP_Props.tree_scans.get(key)
+    if scan is None or scan.fingerprint != tree_fingerprint(node_tree):
+        scan = HEADSUP_Props.tree_scans[key] = scan_tree(node_tree)
+    return scan
+
+
+def tree_summary(node_tree, memo):
+    """(undefined, image users) of ``node_tree`` including all nested node groups.
+
+    Groups used by several trees are summarized once per ``memo``.
+    """
+    key = node_tree.as_pointer()
+    summary = memo.get(key)
+    if summary is not None:
+        return summary
+    # Guards against groups containing themselves
+    memo[key] = (False, ())
+    scan = get_tree_scan(node_tree)
+    undefined = scan.undefined
+    image_users = list(scan.image_users)
+    for group in scan.groups:
+        group_undefined, group_image_users = tree_summary(group, memo)
+        undefined = undefined or group_undefined
+        image_users.extend((f"{group.name} › {node_path}", image, settings)
+                           for node_path, image, settings in group_image_users)
+    summary = memo[key] = (undefined, tuple(image_users))
+    return summary
+
+
+def material_tree(material):
+    """Node tree the material rules check, None for unused, linked or node-less materials."""
+    if material.users == 0 or not material.use_nodes or material.library:
+        return None
+    return material.node_tree
+
+
+def invalidate_tree_scans(pointers=None):
+    """Forget the scans of the given node tree pointers, or of all trees."""
+    if pointers is None:
+        HEADSUP_Props.tree_scans = {}
+        return
+    for pointer in pointers:
+        HEADSUP_Props.tree_scans.pop(pointer, None)
+
+
+def reset_sequence_index():
+    HEADSUP_Props.sequence_users = {}
+    HEADSUP_Props.sequence_materials = {}
+    HEADSUP_Props.sequence_conflicts = {}
+    HEADSUP_Props.image_sequence_conflicts = {}
+
+
+def update_sequence_index(materials, memo):
+    """Re-index the image nodes of ``materials``, returns the pointers of the images whose users changed.
+
+    Images are keyed by pointer, renaming one doesn't outdate the index.
+    """
+    index = HEADSUP_Props.sequence_users
+    dirty_images = set()
+    for material in materials:
+        pointer = material.as_pointer()
+        # Drop what the material used before
+        for image_pointer in HEADSUP_Props.sequence_materials.pop(pointer, ()):
+            users = index.get(image_pointer)
+            if users is not None:
+                users.pop(pointer, None)
+                if not users:
+                    del index[image_pointer]
+            dirty_images.add(image_pointer)
+
+        node_tree = material_tree(material)
+        if node_tree is None:
+            continue
+        uses = {}
+        images = {}
+        for node_path, image, settings in tree_summary(node_tree, memo)[1]:
+            image_pointer = image.as_pointer()
+            images[image_pointer] = image
+            uses.setdefault(image_pointer, []).append((node_path, settings))
+        for image_pointer, nodes in uses.items():
+            index.setdefault(image_pointer, {})[pointer] = (material, images[image_pointer], tuple(nodes))
+        HEADSUP_Props.sequence_materials[pointer] = tuple(uses)
+        dirty_images.update(uses)
+    return dirty_images
+
+
+def update_sequence_conflicts(image_pointers):
+    """Recompute the conflicts of ``image_pointers`` only, the others keep their previous result."""
+    for image_pointer in image_pointers:
+        HEADSUP_Props.sequence_conflicts.pop(image_pointer, None)
+        users = HEADSUP_Props.sequence_users.get(image_pointer, {})
+        if len({settings for _material, _image, nodes in users.values() for _node_path, settings in nodes}) > 1:
+            HEADSUP_Props.sequence_conflicts[image_pointer] = list(users.values())
+
+
+def sequence_conflicts():
+    """Image name → (material name, node path, settings) of every node using it with differing settings.
+
+    Images are only reported while they are sequences, materials only while
+    they still exist and are used.
+    """
+    conflicts = {}
+    for users in HEADSUP_Props.sequence_conflicts.values():
+        image = users[0][1]
+        if not is_valid_id(image) or image.source != 'SEQUENCE':
+            continue
+        rows = [(material.name, node_path, settings)
+                for material, _image, nodes in users if is_valid_id(material) and material.users
+                for node_path, settings in nodes]
+        if len({settings for _material_name, _node_path, settings in rows}) > 1:
+            # Current name, the image may have been renamed since it was indexed
+            conflicts[image.name] = sorted(rows)
+    return conflicts
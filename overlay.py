@@ -0,0 +1,231 @@
+import bpy
+import blf
+import traceback
+
+from .utils import *
+from .properties import HEADSUP_Props
+from .records import *
+from .text_layout import *
+from .placement import *
+
+
+def set_text_size(prefs):
+    """Calculate and set the warning text size."""
+    HEADSUP_Props.actual_text_size = calculate_text_size(prefs)
+    if bpy.app.version >= (4, 0, 0):
+        blf.size(0, HEADSUP_Props.actual_text_size)
+    else:
+        blf.size(0, HEADSUP_Props.actual_text_size, bpy.context.preferences.system.dpi)
+
+
+def set_text_shadow():
+    blf.enable(0, blf.SHADOW)
+    if bpy.app.version >= (4, 0, 0):
+        blf.shadow_offset(0, 0, 0)  # Offset shadow
+        blf.shadow(0, 6, 0.0, 0.0, 0.0, 0.8)
+    else:
+        blf.shadow_offset(0, 1, -1)  # Offset shadow (x=2, y=-2)
+        blf.shadow(0, 3, 0.0, 0.0, 0.0, 0.9)  # Blur level and shadow color (black with 70% opacity)
+
+
+def draw_version_banner(context, prefs, shadow_alpha):
+    """"Fullscreen" version warning in the center of the editor."""
+    if not prefs.warn_44_a or HEADSUP_Props.saved_just_now:
+        return
+    if bpy.data.filepath == '':
+        return
+    current_version = bpy.app.version_file[:2]
+    file_version = bpy.data.version[:2]
+    if file_version == current_version:
+        return
+
+    font_id = 0
+    area_width = context.area.width
+    area_height = context.area.height
+
+    # Set warning text
+    blf.color(font_id, *prefs.warn_color, 1.0)
+    if bpy.app.version >= (4, 0, 0):
+        blf.size(font_id, 33)
+    else:
+        blf.size(font_id, 30, bpy.context.preferences.system.dpi)
+
+    # Enable shadow effect
+    blf.enable(font_id, blf.SHADOW)
+    blf.shadow_offset(font_id, 0, 0)
+    if bpy.app.version >= (4, 0, 0):
+        blf.shadow(font_id, 6, 0.0, 0.0, 0.0, shadow_alpha)
+    else:
+        blf.shadow(font_id, 5, 0.0, 0.0, 0.0, shadow_alpha)
+
+    warning_text = "Attention:"
+    text_width, _ = blf.dimensions(font_id, warning_text)
+    blf.position(font_id, (area_width - text_width) / 2, area_height / 2 + 35, 0)
+    blf.draw(font_id, warning_text)
+
+    # Set file version text
+    blf.color(font_id, *prefs.highlight_color, 1.0)
+    file_version_text = f"File created in Blender {file_version[0]}.{file_version[1]}"
+    text_width, _ = blf.dimensions(font_id, file_version_text)
+    blf.position(font_id, (area_width - text_width) / 2, area_height / 2, 0)
+    blf.draw(font_id, file_version_text)
+
+    # Set save file reminder text
+    if bpy.app.version >= (4, 0, 0):
+        blf.size(font_id, 15)
+    else:
+        blf.size(font_id, 15, bpy.context.preferences.system.dpi)
+
+    reminder_text = "HeadsUp: Save file to confirm and remove the warning."
+    text_width, _ = blf.dimensions(font_id, reminder_text)
+    blf.position(font_id, (area_width - text_width) / 2, area_height / 2 - 20, 0)
+    blf.draw(font_id, reminder_text)
+
+
+def draw_scan_progress(x_position, y_position, prefs, above_warnings):
+    """"scanning N%" marker of a running time-sliced full scan, above the warnings if there are any."""
+    percent = int(HEADSUP_Props.scan_progress * 100)
+    blf.color(0, *prefs.highlight_color, 1.0)
+    blf.position(0, x_position, y_position, 0)
+    blf.draw(0, f"[Scanning {percent}%]" if above_warnings else f"HeadsUp: scanning {percent}%")
+
+
+class HEADSUP_OverlayAdapter:
+    """Where and what the overlay draws in one editor type."""
+
+    name = "overlay"
+    banner_shadow_alpha = 0.9
+
+    def poll(self, context, prefs):
+        return True
+
+    def draw_background(self, context, prefs, scale):
+        """Drawn even without warnings."""
+
+    def anchor(self, context, scale):
+        return 10, 10
+
+    def records(self, context, prefs):
+        return HEADSUP_Props.warnings
+
+    def max_width(self, context, x_position, scale):
+        return context.region.width - x_position - 10
+
+    def draw_foreground(self, context, prefs, scale):
+        """Drawn on top of the warning text."""
+
+
+def is_rec_active(prefs, mode):
+    return (prefs.warn_4 and prefs.warn_4_a == mode
+            and bpy.context.scene.tool_settings.use_keyframe_insert_auto
+            and (bpy.context.mode == 'OBJECT' or bpy.context.mode == 'POSE'))
+
+
+class HEADSUP_View3DOverlay(HEADSUP_OverlayAdapter):
+    name = "draw_warning_text"
+
+    def poll(self, context, prefs):
+        return context.area is not None and context.area.type == 'VIEW_3D'
+
+    def draw_background(self, context, prefs, scale):
+        # This draws the REC overlay without a warning being triggered.
+        if is_rec_active(prefs, '⏺[REC] only'):
+            set_text_size(prefs)
+            draw_filled_red_circle()
+            draw_highlight_border(8, (1, 0, 0, 0.5))
+
+    def anchor(self, context, scale):
+        area = context.area
+        return text_anchor(text_anchor_state(area, context.space_data, scale))
+
+    def records(self, context, prefs):
+        space = context.space_data
+        if space is None or space.type != 'VIEW_3D':
+            return HEADSUP_Props.warnings
+        # For viewport specific options, only draw the warnings that apply to this space.
+        records, space_specific = warnings_for_space(space)
+        if not space.overlay.show_overlays and prefs.toggle_with_overlays:
+            if space_specific and prefs.viewport_highlighting:
+                draw_highlight_border(8)
+            # Remove the text if Overlays are deactivated
+            return []
+        return records
+
+    def max_width(self, context, x_position, scale):
+        # Wrap before the sidebar if it overlaps the viewport
+        max_width = context.region.width - x_position - 10 * scale
+        ui_region = find_region(context.area, 'UI')
+        if ui_region and ui_region.width > 1 and context.preferences.system.use_region_overlap:
+            max_width -= ui_region.width
+        return max_width
+
+    def draw_foreground(self, context, prefs, scale):
+        if is_rec_active(prefs, '⏺[REC]'):
+            draw_filled_red_circle()
+            draw_highlight_border(8, (1, 0, 0, 0.5))
+
+
+class HEADSUP_NodeEditorOverlay(HEADSUP_OverlayAdapter):
+    name = "draw_warning_text_comp"
+    banner_shadow_alpha = 1.0
+
+    def poll(self, context, prefs):
+        # Only the compositor shows warnings, skip shader and geometry node trees right away
+        space = context.space_data
+        return (prefs.compositor_warnings and space is not None
+                and space.type == 'NODE_EDITOR' and space.tree_type == 'CompositorNodeTree')
+
+    def records(self, context, prefs):
+        space = context.space_data
+        if not space.overlay.show_overlays and prefs.toggle_with_overlays:
+            return []
+        return warnings_for_space(space)[0]
+
+
+VIEW3D_OVERLAY = HEADSUP_View3DOverlay()
+NODE_EDITOR_OVERLAY = HEADSUP_NodeEditorOverlay()
+
+
+def draw_overlay(adapter):
+    """Draw the warning overlay of the current editor through its adapter."""
+    try:
+        context = bpy.context
+        prefs = context.preferences.addons[__package__].preferences
+        if not adapter.poll(context, prefs):
+            return
+        scale = (context.preferences.system.dpi / 72)
+
+        adapter.draw_background(context, prefs, scale)
+        scanning = HEADSUP_Props.scan_progress is not None
+        if not HEADSUP_Props.warn_state and not scanning:
+            return
+
+        x_position, y_position = adapter.anchor(context, scale)
+        records = adapter.records(context, prefs) if HEADSUP_Props.warn_state else []
+
+        set_text_size(prefs)
+        set_text_shadow()
+        height = draw_warning_records(records, x_position, y_position, prefs, adapter.max_width(context, x_position, scale))
+        if scanning:
+            draw_scan_progress(x_position, y_position + height, prefs, bool(height))
+
+        if HEADSUP_Props.warn_state:
+            adapter.draw_foreground(context, prefs, scale)
+            draw_version_banner(context, prefs, adapter.banner_shadow_alpha)
+
+        # Reset color to default after drawing
+        blf.color(0, 1.0, 1.0, 1.0, 1.0)
+        blf.disable(0, blf.SHADOW)
+    except Exception:
+        print(f"HeadsUp [{adapter.name}] Error:")
+        traceback.print_exc()
+
+
+def draw_warning_text():
+    """Draw the warning overlay in the 3D Viewport."""
+    draw_overlay(VIEW3D_OVERLAY)
+
+
+def draw_warning_text_comp():
+    """Draw the warning overlay in the Compositor."""
+    draw_overlay(NODE_EDITOR_OVERLAY)
@@ -35,7 +35,7 @@ class VIEW3D_PT_HeadsUpPanel_HeadsUp_Warnings(VIEW3D_PT_HeadsUpPanel, bpy.types.
         row.label(text="Read tooltips for more info", icon='INFO')
         row = layout.row()
         box=row.box()
-        for i in range(1, 52):
+        for i in range(1, 56):
             prop_name = f"warn_info_{i}"
             
             if getattr(props, prop_name, None):  
@@ -306,12 +306,39 @@ class VIEW3D_PT_HeadsUpPanel_Undefined_Nodes(VIEW3D_PT_HeadsUpPanel, bpy.types.P
                 row = box.row()
                 row.label(text=material)
 
+class VIEW3D_PT_HeadsUpPanel_Sequence_Conflicts(VIEW3D_PT_HeadsUpPanel, bpy.types.Panel):
+    bl_idname = "VIEW3D_PT_sequence_conflicts_panel"
+    bl_label = "Image Sequence Conflicts"
+
+    def draw(self, context):
+        layout = self.layout
+        row = layout.row(align=True)
+        prefs = bpy.context.preferences.addons[__package__].preferences
+
+        if not prefs.warn_17:
+            row.label(text="Check for Image Sequence conflicts disabled in Preferences")
+            return
+
+        if not HEADSUP_Props.image_sequence_conflicts:
+            row.label(text="No Image Sequence conflicts found")
+            return
+
+        row.label(text="Nodes using a sequence with different settings:")
+        for image_name, users in sorted(HEADSUP_Props.image_sequence_conflicts.items()):
+            box = layout.box()
+            box.label(text=image_name, icon='IMAGE_DATA')
+            for material_name, node_path, (frame_start, frame_offset, frame_duration) in users:
+                row = box.row()
+                row.label(text=f"{material_name} › {node_path}", icon='MATERIAL')
+                row.label(text=f"Start {frame_start}, Offset {frame_offset}, Frames {frame_duration}")
+
 def register():
     bpy.utils.register_class(VIEW3D_PT_HeadsUpPanel_HeadsUp_Warnings)
     bpy.utils.register_class(VIEW3D_PT_HeadsUpPanel_Collection_Mismatch)
     bpy.utils.register_class(VIEW3D_PT_HeadsUpPanel_Object_Mismatch)
     bpy.utils.register_class(VIEW3D_PT_HeadsUpPanel_Modifier_Mismatch)
     bpy.utils.register_class(VIEW3D_PT_HeadsUpPanel_Undefined_Nodes)
+    bpy.utils.register_class(VIEW3D_PT_HeadsUpPanel_Sequence_Conflicts)
     
 
 def unregister():
@@ -319,4 +346,5 @@ def unregister():
     bpy.utils.unregister_class(VIEW3D_PT_HeadsUpPanel_Collection_Mismatch)
     bpy.utils.unregister_class(VIEW3D_PT_HeadsUpPanel_Object_Mismatch)  
     bpy.utils.unregister_class(VIEW3D_PT_HeadsUpPanel_Modifier_Mismatch)  
-    bpy.utils.unregister_class(VIEW3D_PT_HeadsUpPanel_Undefined_Nodes)
\ No newline at end of file
+    bpy.utils.unregister_class(VIEW3D_PT_HeadsUpPanel_Undefined_Nodes)
+    bpy.utils.unregister_class(VIEW3D_PT_HeadsUpPanel_Sequence_Conflicts)
\ No newline at end of file
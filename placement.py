@@ -0,0 +1,122 @@
+import bpy
+
+# Object types whose statistics overlay takes the most, some or a few lines
+STATS_LARGE_TYPES = {'MESH', 'FONT', 'GREASEPENCIL', 'GPENCIL'}
+STATS_SMALL_TYPES = {'CAMERA', 'CURVE', 'ARMATURE', 'META', 'EMPTY', 'SPEAKER', 'LIGHT_PROBE', 'SURFACE', 'VOLUME'}
+
+
+def find_region(area, region_type):
+    return next((region for region in area.regions if region.type == region_type), None)
+
+
+def text_anchor(state):
+    """Lower left corner of the warning text, a pure function of ``text_anchor_state``."""
+    scale, modern_ui, tools_width, header_bottom, shelf_height, show_header, hud_x = state
+    x_position = 10 * scale
+    y_position = 10 * scale
+
+    if tools_width is not None:
+        x_position = 9 * scale + tools_width
+    if header_bottom and modern_ui:
+        y_position = y_position + 27 * scale
+    if shelf_height > 1:
+        y_position = y_position + shelf_height + 27 * scale
+    if not show_header and modern_ui and header_bottom:
+        y_position = y_position - 27 * scale
+    # The HUD (redo panel) is open if it starts right of the toolshelf
+    if hud_x is not None and tools_width is not None and hud_x - tools_width > 0:
+        y_position = y_position + 25 * scale
+    return x_position, y_position
+
+
+def text_anchor_state(area, space, scale):
+    """The inputs of ``text_anchor`` read from the area and its 3D Viewport space."""
+    tools_region = find_region(area, 'TOOLS')
+    header_region = find_region(area, 'HEADER')
+    shelf_region = find_region(area, 'ASSET_SHELF')
+    hud_region = find_region(area, 'HUD')
+    return (
+        scale,
+        bpy.app.version >= (4, 0, 0),
+        tools_region.width if tools_region else None,
+        bool(header_region and header_region.alignment == 'BOTTOM'),
+        shelf_region.height if shelf_region else 0,
+        space.show_region_header if space is not None else True,
+        hud_region.x - area.x if hud_region else None,
+    )
+
+
+def rec_anchor(state):
+    """Center of the REC dot and origin of its label, a pure function of ``rec_anchor_state``."""
+    (scale, modern_ui, area_height, tools_width, show_header, show_tool_header, show_text,
+     show_stats, object_type, pose_mode, ortho_side_view, engine, shading_type,
+     use_compositor, header_bottom) = state
+    radius = 9 * scale
+    x_pos = 10 * scale + radius
+    y_pos = area_height - 40 * scale - radius
+
+    if tools_width is not None:
+        x_pos = x_pos - 1 * scale + tools_width
+    if modern_ui:
+        y_pos = y_pos - 25 * scale
+    if not show_header:
+        y_pos = y_pos + 50 * scale
+    if show_header and not show_tool_header:
+        y_pos = y_pos + 25 * scale
+    if show_text:
+        y_pos = y_pos - 35 * scale
+    if show_stats:
+        if object_type is not None:
+            if object_type in STATS_LARGE_TYPES:
+                y_pos = y_pos - 100 * scale
+            if object_type in STATS_SMALL_TYPES:
+                y_pos = y_pos - 30 * scale
+            if object_type == 'LIGHT':
+                y_pos = y_pos - 56 * scale
+            if pose_mode:
+                y_pos = y_pos - 26 * scale
+        else:
+            y_pos = y_pos - 100 * scale
+
+    if ortho_side_view:
+        y_pos = y_pos - 16 * scale
+    if shading_type == 'RENDERED':
+        if engine == "CYCLES":
+            y_pos = y_pos - 16 * scale
+        if engine == "BLENDER_EEVEE" or engine == "BLENDER_EEVEE_NEXT":
+            if use_compositor == 'DISABLED':
+                y_pos = y_pos - 16 * scale
+            else:
+                y_pos = y_pos - 32 * scale
+    if header_bottom:
+        y_pos = y_pos + 27 * scale
+
+    text_margin = 4 * scale  # Distance between the circle and the text
+    return x_pos, y_pos, x_pos + radius + text_margin, y_pos - 3 * scale
+
+
+def rec_anchor_state(area, space, scale):
+    """The inputs of ``rec_anchor`` read from the context, the area and its 3D Viewport space."""
+    tools_region = find_region(area, 'TOOLS')
+    header_region = find_region(area, 'HEADER')
+    active_obj = bpy.context.active_object
+    region_3d = space.region_3d
+    return (
+        scale,
+        bpy.app.version >= (4, 0, 0),
+        area.height,
+        tools_region.width if tools_region else None,
+        space.show_region_header,
+        space.show_region_tool_header,
+        space.overlay.show_text,
+        space.overlay.show_stats,
+        active_obj.type if active_obj else None,
+        bpy.context.mode == 'POSE',
+        # Top, bottom, front, back, left or right orthographic view
+        region_3d.view_perspective == 'ORTHO' and region_3d.is_orthographic_side_view,
+        bpy.context.scene.render.engine,
+        space.shading.type,
+        getattr(space.shading, "use_compositor", 'DISABLED'),
+        bool(header_region and header_region.alignment == 'BOTTOM'),
+    )
+
@@ -4,9 +4,9 @@ from .properties import *
 class HEADSUP_Preferences(bpy.types.AddonPreferences):
     bl_idname = __package__
 
-    # Callback function for certain property changes
+    # Toggling a warning or one of its options only recompiles the rule plan
     def prop_update_callback(self, context):
-        HEADSUP_Props.load_up_done = False
+        HEADSUP_Props.plan_dirty = True
 
     # Customizable properties for colors and text size
     warn_color: bpy.props.FloatVectorProperty(
@@ -49,6 +49,7 @@ class HEADSUP_Preferences(bpy.types.AddonPreferences):
         name="Viewport: Lock Camera to View",
         description="Warn me about 'Camera to View' being active, as it can be destructive and is not undo-able",
         default=True,
+        update=prop_update_callback
     ) 
     
     warn_2: bpy.props.BoolProperty(
@@ -61,13 +62,15 @@ class HEADSUP_Preferences(bpy.types.AddonPreferences):
     warn_3: bpy.props.BoolProperty(
         name="Sculpt: Shapekey Value not 1",
         description="Warn me about Sculpting on a Shapekey which is not set to Value 1.0",
-        default=True
+        default=True,
+        update=prop_update_callback
     ) 
     
     warn_4: bpy.props.BoolProperty(
         name="Animation: Auto Keying",
         description="Warn me about 'Auto Keying' being active",
-        default=True
+        default=True,
+        update=prop_update_callback
     )
 
     warn_4_a: bpy.props.EnumProperty(
@@ -78,101 +81,118 @@ class HEADSUP_Preferences(bpy.types.AddonPreferences):
             ('⏺[REC]', "⏺[REC]", "Warn me and show a red dot and border"),
             ('⏺[REC] only', "⏺[REC] only", "Don't trigger a full warning, just show red dot and border"),
         ],
-        default='⏺[REC]'
+        default='⏺[REC]',
+        update=prop_update_callback
     )
     
     warn_5: bpy.props.BoolProperty(
         name="General: Proportional Editing",
         description="Warn me about 'Proportional Editing' being active",
-        default=True
+        default=True,
+        update=prop_update_callback
     ) 
     
     warn_6: bpy.props.BoolProperty(
         name="General: Affect Only",
         description="Warn me about any of the Affect Only (Origins/Locations/Parents) being active",
-        default=True
+        default=True,
+        update=prop_update_callback
     ) 
     
     warn_7: bpy.props.BoolProperty(
         name="General: Snapping",
         description="Warn me about Snapping",
-        default=True
+        default=True,
+        update=prop_update_callback
     ) 
     
     warn_8: bpy.props.BoolProperty(
         name="Active Object: Scaling Issues",
         description="Warn me about Scaling Issues",
-        default=True
+        default=True,
+        update=prop_update_callback
     ) 
     
     warn_8_a: bpy.props.BoolProperty(
         name="Negative",
         description="Warn me about Scaling Issues",
-        default=True
+        default=True,
+        update=prop_update_callback
     ) 
     warn_8_b: bpy.props.BoolProperty(
         name="Non-Uniform",
         description="Warn me about Scaling Issues",
-        default=False
+        default=False,
+        update=prop_update_callback
     ) 
     warn_8_c: bpy.props.BoolProperty(
         name="Non-1",
         description="Warn me about Scaling Issues",
-        default=False
+        default=False,
+        update=prop_update_callback
     ) 
     
     warn_9: bpy.props.BoolProperty(
         name="Edit: Mirror Options",
         description="Warn me about Mirror options being active",
-        default=True
+        default=True,
+        update=prop_update_callback
     ) 
     
     warn_10: bpy.props.BoolProperty(
         name="Render: Simplify",
         description="Warn me about Simplify being active when below treshhold values",
-        default=True
+        default=True,
+        update=prop_update_callback
     ) 
     
     warn_10_a: bpy.props.BoolProperty(
         name="Only warn for 'Render' subdivisions",
         description="Warn me about Simplify being active when below treshhold values",
-        default=True
+        default=True,
+        update=prop_update_callback
     ) 
     
     warn_11: bpy.props.BoolProperty(
         name="Sequencer: Sequencer contains Strips",
         description="Warn me about Post Processing 'Use Sequencer' being active while the Sequencer contains strips",
-        default=True
+        default=True,
+        update=prop_update_callback
     ) 
     
     warn_12: bpy.props.BoolProperty(
         name="Render: Render Region",
         description="Warn me about a Render Region being used",
-        default=True
+        default=True,
+        update=prop_update_callback
     ) 
     
     warn_13: bpy.props.BoolProperty(
         name="Edit: Auto-Merge Vertices",
         description="Warn me about Auto-merge Vertices being active",
-        default=True
+        default=True,
+        update=prop_update_callback
     ) 
     
     warn_14: bpy.props.BoolProperty(
         name="UV: Select Sync",
         description="Warn me about UV Select Sync being active, only showing UVs for selected Geometry",
-        default=True
+        default=True,
+        update=prop_update_callback
     ) 
     
     warn_15: bpy.props.BoolProperty(
         name="UV: Live Unwrap",
         description="Warn me about Live Unwrap being active",
-        default=True
+        default=True,
+        update=prop_update_callback
     ) 
     
     warn_16: bpy.props.BoolProperty(
         name="UV: Correct Face Attributes",
         description="Warn me about Correct Face Attributes being active. This can change the UVs with transforms done in edit mode",
-        default=True
+        default=True,
+        update=prop_update_callback
     ) 
     
     warn_17: bpy.props.BoolProperty(
@@ -185,43 +205,50 @@ class HEADSUP_Preferences(bpy.types.AddonPreferences):
     warn_18: bpy.props.BoolProperty(
         name="Sculpt: Corrective Smooth active",
         description="Warn me about active Corrective Smooth modifiers when in Sculpt Mode",
-        default=True
+        default=True,
+        update=prop_update_callback
     ) 
     
     warn_19: bpy.props.BoolProperty(
         name="General: Autopack Ressources",
         description="Warn me when Autopacking is activated for the current file",
-        default=True
+        default=True,
+        update=prop_update_callback
     )   
     
     warn_20: bpy.props.BoolProperty(
         name="Viewport: Local View",
         description="Warn me about an active Local-View",
-        default=True
+        default=True,
+        update=prop_update_callback
     )   
     
     warn_21: bpy.props.BoolProperty(
         name="Viewport: Clipping Border",
         description="Warn me about an clipping borders being used",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
     
     warn_22: bpy.props.BoolProperty(
         name="Active Object: Shadow Catcher/Holdout",
         description="Warn me if active object is a shadow catcher or holdout",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
     
     warn_23: bpy.props.BoolProperty(
         name="Render: Resolution not 100%",
         description="Warn me if the Render Resolution is not set to 100%",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
     
     warn_24: bpy.props.BoolProperty(
         name="Render: Filter Size",
         description="Warn me about the Pixel Filter being changed from its 1.50 px default",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
     
     warn_25: bpy.props.BoolProperty(
@@ -245,48 +272,56 @@ class HEADSUP_Preferences(bpy.types.AddonPreferences):
     warn_26: bpy.props.BoolProperty(
         name="Render: Sample Override",
         description="Warn me about Sample Override being active on a Viewlayer",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
     
     warn_27: bpy.props.BoolProperty(
         name="Render: Samples lower than",
         description="Warn me about Cycles samples being lower than this number",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
     warn_27_a: bpy.props.BoolProperty(
         name="Render: Samples higher than",
         description="Warn me about Cycles samples being higher than this number",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
     
     warn_28: bpy.props.BoolProperty(
         name="Active Object: Relative Array",
         description="Warn me about modifiers before an array modifier mismatching for render and viewport. Might cause changing positions of the array result",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
 
     warn_29: bpy.props.BoolProperty(
         name="Viewport: Hidden Object Types",
         description="Warn me about hidden object types in a visible viewport",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
 
     warn_30: bpy.props.BoolProperty(
         name="Viewport: Unselectable Object Types",
         description="Warn me about unselectable object types in a visible viewport",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
 
     warn_31: bpy.props.BoolProperty(
         name="Animation: Use Preview Range",
         description="Warn me about an active preview range",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
     
     warn_32: bpy.props.BoolProperty(
         name="Render: Cycles not using ",
         description="Warn me about the render device for Cycles",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
 
     warn_32_a: bpy.props.EnumProperty(
@@ -296,43 +331,50 @@ class HEADSUP_Preferences(bpy.types.AddonPreferences):
             ('GPU', "GPU", "Warn if GPU Rendering is NOT used"),
             ('CPU', "CPU", "Warn if CPU Rendering is NOT used"),
         ],
-        default='GPU'
+        default='GPU',
+        update=prop_update_callback
     )
 
     warn_33: bpy.props.BoolProperty(
         name="Active Object: Locked Transforms ",
         description="Warn me about locked location, rotation or scale",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
 
     warn_34: bpy.props.BoolProperty(
         name="Active Object: Armature in Rest Position",
         description="Warn me about an active Rig being in Rest Position",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
 
     warn_35: bpy.props.BoolProperty(
         name="Render: Material Override",
         description="Cycles: Warn me about a material override",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
     
     warn_36: bpy.props.BoolProperty(
         name="Compositing: 'Use Nodes' is OFF",
         description="Warn me if 'Use Nodes' is OFF in the compositor, but the compositor is NOT emtpy",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
 
     warn_37: bpy.props.BoolProperty(
         name="Render: Output as Video",
         description="Warn me about the Output being set to FFMPEG video, which can lead to many issues",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
 
     warn_38: bpy.props.BoolProperty(
         name="Render: Film 'Transparent' is",
         description="Warn me about a the Film 'Transparent' option being turned OFF",
-        default=False
+        default=False,
+        update=prop_update_callback
     )  
 
     warn_38_a: bpy.props.EnumProperty(
@@ -342,13 +384,15 @@ class HEADSUP_Preferences(bpy.types.AddonPreferences):
             ('OFF', "OFF", "Warn if Film Transparent is OFF"),
             ('ON', "ON", "Warn if Film Transparent is ON"),
         ],
-        default='OFF'
+        default='OFF',
+        update=prop_update_callback
     )
 
     warn_39: bpy.props.BoolProperty(
         name="Sequencer: Audio Louder than",
         description="Warn me about an audio strip being louder than a threshold",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
 
     warn_39_a: bpy.props.FloatProperty(
@@ -356,12 +400,14 @@ class HEADSUP_Preferences(bpy.types.AddonPreferences):
         default = 1.0,
         min=0.0, max=5.0,
         description="Warn me about an audio strip being louder than a threshold",
+        update=prop_update_callback
     )  
 
     warn_40: bpy.props.BoolProperty(
         name="Active Object: Render < Viewport SubDiv",
         description="Warn me about a Subdivision or MultiRes being higher for Viewport than for Render",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
 
     warn_41: bpy.props.BoolProperty(
@@ -389,94 +435,137 @@ class HEADSUP_Preferences(bpy.types.AddonPreferences):
         name="Data: Blender Version",
         description="Warn me when the file was created in another Blender version",
         default=True,
+        update=prop_update_callback
     )  
     
     warn_44_a: bpy.props.BoolProperty(
         name="Fullscreen",
         description="Show a central warning in the 3D View to remind me of the Version mismatch",
-        default=True,
+        default=True
     )  
 
     warn_45: bpy.props.BoolProperty(
         name="Compositing: Renderlayer Node Issues",
         description="Show a warning for Renderlayer Node Issues, like missing Renderlayer nodes or muted savers",
         default=True,
+        update=prop_update_callback
     )
     
     warn_46: bpy.props.BoolProperty(
         name="Active Object: In Front",
         description="Show a warning if the Active Object is set to 'In Front'",
         default=True,
+        update=prop_update_callback
     )  
 
     warn_47: bpy.props.BoolProperty(
         name="Active Object: Visible Texture Space",
         description="Show a warning if the Active Object has 'Texture Space' visible",
         default=True,
+        update=prop_update_callback
     )
 
     warn_48: bpy.props.BoolProperty(
         name="Active Object: Wireframe Display",
         description="Show a warning if the Active Object is set to 'Wireframe' or 'Bounds' display mode",
         default=True,
+        update=prop_update_callback
     )
 
     warn_49: bpy.props.BoolProperty(
         name="Active Object: Collection Instance",
         description="Show a warning if the Active Object is a Collection Instance",
         default=True,
+        update=prop_update_callback
     )
 
     warn_50: bpy.props.BoolProperty(
         name="Active Object: Faces/Verts Instance",
         description="Show a warning if the Active Object is a Faces/Verts Instance",
         default=True,
+        update=prop_update_callback
     )
 
     warn_51: bpy.props.BoolProperty(
         name="Active Object: Solo Active Shape Key",
         description="Show a warning if the Active Object has 'Solo Active Shape Key' enabled for Shape Keys",
         default=True,
+        update=prop_update_callback
     )
 
     warn_52: bpy.props.BoolProperty(
         name="Active Object: Shape Key Edit Mode",
         description="Show a warning if the Active Object has 'Shape Key Edit Mode' enabled",
         default=True,
+        update=prop_update_callback
+    )
+
+    warn_53: bpy.props.BoolProperty(
+        name="Data: Missing External Files",
+        description="Warn me about missing movie clips, sounds, fonts, volumes, caches and sequencer media",
+        default=True,
+        update=prop_update_callback
+    )
+
+    warn_54: bpy.props.BoolProperty(
+        name="Data: Absolute Paths",
+        description="Warn me about external files and output paths using absolute paths",
+        default=False,
+        update=prop_update_callback
+    )
+
+    warn_55: bpy.props.BoolProperty(
+        name="Data: Outside Project Root",
+        description="Warn me about external files and output paths outside the project root",
+        default=False,
+        update=prop_update_callback
+    )
+
+    warn_55_a: bpy.props.StringProperty(
+        name="",
+        description="Project root folder, the folder of the blend file is used if empty",
+        subtype='DIR_PATH',
+        default="",
+        update=prop_update_callback
     )
 
     custom_warn: bpy.props.BoolProperty(
         name="Enable Custom Warnings",
         description="Enable custom warnings, simply use the text editor and write 'Headsup:', followed by your custom HeadsUp Overlay warning",
-        default=True
+        default=True,
+        update=prop_update_callback
     )  
        
     sample_limit_lower: bpy.props.IntProperty(
         name="",
         default=16,
         min=1, max=4096,
-        description="Warn if Render Samples are EQUAL to or LOWER than this value"
+        description="Warn if Render Samples are EQUAL to or LOWER than this value",
+        update=prop_update_callback
     )
 
     sample_limit_upper: bpy.props.IntProperty(
         name="",
         default=4097,
         min=1, max=16384,
-        description="Warn if Render Samples are EQUAL to or HIGHER than this value"
+        description="Warn if Render Samples are EQUAL to or HIGHER than this value",
+        update=prop_update_callback
     )
     
     simplify_render: bpy.props.IntProperty(
         name="",
         default=3,
         min=0, max=20,
-        description="Warn if Render Subdivisions are EQUAL to or LOWER than this value"
+        description="Warn if Render Subdivisions are EQUAL to or LOWER than this value",
+        update=prop_update_callback
     )
     
     simplify_viewport: bpy.props.IntProperty(
         name="",
         default=0,
         min=0, max=20,
-        description="Warn if Viewport Subdivisions are EQUAL to or LOWER than this value"
+        description="Warn if Viewport Subdivisions are EQUAL to or LOWER than this value",
+        update=prop_update_callback
     )
     
     toggle_with_overlays:  bpy.props.BoolProperty(
@@ -507,6 +596,61 @@ class HEADSUP_Preferences(bpy.types.AddonPreferences):
         description="Enables debug mode for troubleshooting",
         default=True
     )
+    max_evaluation_rate: bpy.props.IntProperty(
+        name="Max Checks per Second",
+        default=10,
+        min=1, max=60,
+        description="How often per second HeadsUp re-evaluates warnings at most while Blender sends many updates (scrubbing, dragging sliders, drivers). The last change is always evaluated"
+    )
+    synchronous_evaluation: bpy.props.BoolProperty(
+        name="Synchronous Evaluation (Debug)",
+        description="Evaluate warnings directly on every depsgraph update instead of coalescing them. Slower, only meant for debugging",
+        default=False
+    )
+    cache_overlay_texture: bpy.props.BoolProperty(
+        name="Cache Overlay Texture",
+        description="Render the warning text once into a texture and reuse it on every redraw until the warnings, colors, text size or editor size change. Falls back to drawing the text directly if the texture can't be created",
+        default=False
+    )
+    adaptive_scheduling: bpy.props.BoolProperty(
+        name="Adaptive Rule Scheduling",
+        description="Measure how long every check takes and postpone expensive checks when an update would exceed the time budget. Cheap checks still run on every update, postponed ones at the latest after the maximum delay",
+        default=True
+    )
+    rule_budget: bpy.props.FloatProperty(
+        name="Budget per Update (ms)",
+        description="Time all checks of a single update should take together",
+        default=1.0,
+        min=0.1, max=100.0
+    )
+    max_staleness: bpy.props.FloatProperty(
+        name="Max Delay (s)",
+        description="Longest time a postponed check waits before it runs regardless of the budget",
+        default=2.0,
+        min=0.1, max=60.0
+    )
+    time_sliced_scans: bpy.props.BoolProperty(
+        name="Time-Sliced Full Scans",
+        description="Check all objects and materials in small slices after loading a file, switching scenes or adding view layers, so Blender stays responsive. Warnings appear while the scan progresses",
+        default=True
+    )
+    scan_slice_budget: bpy.props.IntProperty(
+        name="Slice Budget (ms)",
+        description="Time a single slice of a full scan should take at most",
+        default=10,
+        min=1, max=200
+    )
+    persistent_stat_cache: bpy.props.BoolProperty(
+        name="Persistent File Cache",
+        description="Remember which textures and libraries exist across sessions in a small database in the Blender config folder. Missing files show up right after loading a file, even on slow network storage, and are checked again in the background",
+        default=False
+    )
+    stat_cache_validity: bpy.props.FloatProperty(
+        name="Valid for (Hours)",
+        description="How long a remembered result is trusted without checking the file again",
+        default=24.0,
+        min=0.0, max=720.0
+    )
 
 
     def draw(self, context):
@@ -523,6 +667,29 @@ class HEADSUP_Preferences(bpy.types.AddonPreferences):
         row = layout.row()
         box = row.box()
         box.prop(self, "compositor_warnings")
+        row = layout.row()
+        box = row.box()
+        row = box.row()
+        row.prop(self, "max_evaluation_rate")
+        row.prop(self, "synchronous_evaluation")
+        row = box.row()
+        row.prop(self, "adaptive_scheduling")
+        sub = row.row()
+        sub.active = self.adaptive_scheduling
+        sub.prop(self, "rule_budget")
+        sub.prop(self, "max_staleness")
+        row = box.row()
+        row.prop(self, "cache_overlay_texture")
+        row = box.row()
+        row.prop(self, "time_sliced_scans")
+        sub = row.row()
+        sub.active = self.time_sliced_scans
+        sub.prop(self, "scan_slice_budget")
+        row = box.row()
+        row.prop(self, "persistent_stat_cache")
+        sub = row.row()
+        sub.active = self.persistent_stat_cache
+        sub.prop(self, "stat_cache_validity")
         # Create the main row
         row = layout.row()
         
@@ -645,6 +812,12 @@ class HEADSUP_Preferences(bpy.types.AddonPreferences):
 
         grid.prop(self, "warn_42")  # Data: Missing Textures
         grid.prop(self, "warn_43")  # Data: Missing Libraries
+        grid.prop(self, "warn_53")  # Data: Missing External Files
+        grid.prop(self, "warn_54")  # Data: Absolute Paths
+        row = grid.row()
+        split = row.split(factor=0.6)
+        split.prop(self, "warn_55")  # Data: Outside Project Root
+        split.prop(self, "warn_55_a")
         row = grid.row()
         split = row.split(factor=0.6)
         split.prop(self, "warn_44")  # Data: Blender Version
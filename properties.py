@@ -7,9 +7,38 @@ class HEADSUP_Props:
     handler_gradient = None
     warn_state = None
     warning_message = ""
-    warnings = []
+    warnings = []          # HEADSUP_Warning records of the last evaluation
+    global_warnings = []   # Records shown in every editor
+    space_warnings = {}    # Space hash → records shown in that space
+    warnings_generation = 0
+    text_layouts = {}      # (records id, text size, DPI, width) → HEADSUP_TextLayout
+    text_layouts_generation = 0
+    offscreen_failed = False
+    path_cache = {}        # Resolved path → (exists, monotonic time of the check)
+    directory_cache = {}   # Directory → (mtime, file names, monotonic time of the check)
+    pending_paths = {}     # (check kind, path) → monotonic time it was queued
+    id_paths = {}          # Image/Library pointer → resolved path it was checked with
+    unreachable_mounts = {}  # Mount → monotonic time until which it is skipped
+    pending_stats = []     # Worker results waiting to be written to the persistent stat cache
+    stat_cache_failed = False
+    stat_lookups = set()   # Paths already looked up in the persistent stat cache this session
+    external_files = None  # Data collection → ID pointer → HEADSUP_ExternalFile list, None until built
+    external_dirty_ids = set()    # IDs whose files are re-read on the next lookup
+    external_dirty_kinds = set()  # Data collections that are re-read on the next lookup
+    strip_counts = {}      # Scene pointer → number of strips at its last update, see changes._strips_changed
+    tree_scans = {}        # Node tree pointer → HEADSUP_TreeScan of its own nodes
+    sequence_users = {}    # Image pointer → material pointer → (material, image, ((node path, frame settings), ...))
+    sequence_materials = {}  # Material pointer → pointers of the images its nodes use
+    sequence_conflicts = {}  # Image pointer → users of images whose nodes disagree on the frame settings
+    image_sequence_conflicts = {}  # Conflicts shown in the side panel, see sequence_conflicts
+    shaders = {}           # Builtin shaders by name, fetched once per session
+    batches = {}           # (overlay, width, height, scale) → GPUBatch
     old_warnings = []
-    modifier_mismatches = set()
+    modifier_mismatches = []
+    stack_mismatches = {}        # Object pointer → a modifier differs between viewport and render
+    modifier_mismatch_index = {}  # Object pointer → (object, rendering view layers) of objects with a mismatch
+    modifier_mismatch_layers = {}  # View layer name → objects with a modifier mismatch rendered there
+    modifier_pending_objects = set()  # Changed while the scene-wide modifier check didn't run
     system = bpy.context.preferences.system
     dpi = int(system.dpi * (1 / system.pixel_size))
     actual_text_size = 11
@@ -23,12 +52,45 @@ class HEADSUP_Props:
     problematic_collections = set()
     collection_check_bool = True
     compositor_check_bool = True
-    view_layer_visible_collections = {}
+    object_check_bool = False
+    material_check_bool = False
+    collection_bits = {}   # Collection pointer → bit in the membership masks
+    object_masks = {}      # Object pointer → bits of the collections it is linked to
+    view_layer_masks = {}  # Used view layer name → bits of the collections it renders
+    visibility_snapshot = None  # HEADSUP_VisibilitySnapshot of the objects of the current scene
+    collection_visibility_snapshot = None  # HEADSUP_VisibilitySnapshot of bpy.data.collections
+    subtree_results = {}   # View layer pointer → path of collection pointers → (visible mask, mismatched names) of its subtree
     view_layer_visibilities = {}
     saved_just_now = False
     current_scene = None
     old_warn_state = None
     viewlayer_count = None
+    plan_dirty = True
+    active_plan = None
+    plan_signatures = {}
+    rule_results = {}
+    rule_costs = {}        # rule_id → moving average of its run time in seconds
+    deferred_rules = {}    # rule_id → time the rule was first skipped to stay within the budget
+    deferred_items = {}    # rule_id → (objects, materials) a deferred rule still has to check
+    last_mode = None
+    last_active_pointer = None
+    pending_changes = None
+    scan_job = None        # HEADSUP_ScanJob of a running time-sliced full scan
+    scan_progress = None   # 0..1 while a full scan runs, shown in the overlay
+    last_evaluation_time = 0.0
+    evaluating = False
+    updates_during_evaluation = False
+    busy_since = None      # perf_counter time the evaluations started being postponed, see should_postpone
+    follow_up_signature = None  # Updates that arrived during the last evaluation, see run_pending_evaluation
+    space_snapshots = {}   # SpaceView3D pointer → HEADSUP_SpaceSnapshot
+    space_snapshots_dirty = False
+    warn_info_mask = 0     # Bit N set while warn_info_N is active, bit 0 for the custom warning
+
+def warn_info_getter(bit):
+    """Getter reading a warn_info flag from the runtime bitmask instead of the Scene."""
+    def getter(self):
+        return bool(HEADSUP_Props.warn_info_mask & (1 << bit))
+    return getter
 
 class HEADSUP_WarnInfoProperties(bpy.types.PropertyGroup):
     def get_pass(self):
@@ -41,313 +103,441 @@ class HEADSUP_WarnInfoProperties(bpy.types.PropertyGroup):
     warn_info_1: bpy.props.BoolProperty(
         name="Viewport: Lock Camera to View",
         description="'Lock Camera To View’ is active in one of your 3D Viewports. This setting might destructively change your camera position and might not be undone. ▶▶▶ Disable via 3D Viewports Right Sidebar → View → Lock → Camera To View",
-        default=False, 
+        default=False,
+        get=warn_info_getter(1),
+        set=set_pass,
     )
 #    2 Viewport/Render Visibility Mismatch
     warn_info_2: bpy.props.BoolProperty(
         name="Viewport/Render: Visibility Mismatch",
         description="A Collection or Object has different settings for Viewport and Rendering. This can cause unexpected outcomes in Rendering, ▶▶▶ Use HeadsUp “Collection/Object Mismatch” Panels to resolve visiblity issues",
-        default=False
+        default=False,
+        get=warn_info_getter(2),
+        set=set_pass,
     )
 #    3 Shapekey Warning in Sculpt Mode
     warn_info_3: bpy.props.BoolProperty(
         name="Sculpt: Shapekey Value not 1",
         description="You are trying to sculpt on a Shape Key, but that Shape Key is not fully applied, therefore the Viewport is not „What you see is what you get“. ▶▶▶ Go to Properties → Mesh → Shape Keys → Set Active Shape Key Value to 1.0",
-        default=False
+        default=False,
+        get=warn_info_getter(3),
+        set=set_pass,
     )
 #    4 Auto Keying
     warn_info_4: bpy.props.BoolProperty(
         name="Animation: Auto Keying",
         description="„Auto-Keying“ is active. This can potentially be destructive by inserting unwanted Keyframes or overwriting existing ones. ▶▶▶ Disable via the Timeline UI Button (⏺)",
-        default=False
+        default=False,
+        get=warn_info_getter(4),
+        set=set_pass,
     )
 #    5 Proportional Editing
     warn_info_5: bpy.props.BoolProperty(
         name="General: Proportional Editing",
         description="Proportional Editing is active and might unintentionally change off-screen data. ▶▶▶ Press ‘o’ in the affected editor type or use the UI Button",
-        default=False
+        default=False,
+        get=warn_info_getter(5),
+        set=set_pass,
     )
 #    6 Affect only Origins/Locations/Parents 
     warn_info_6: bpy.props.BoolProperty(
         name="General: Affect Only",
         description="'Affect only Origins/Locations/Parents’ is active in your 3D Viewport.  ▶▶▶ Go to the 3D Viewport → Right Sidebar → Tool → Options → Transform → Affect",
-        default=False
+        default=False,
+        get=warn_info_getter(6),
+        set=set_pass,
     )
 #    7 Snapping
     warn_info_7: bpy.props.BoolProperty(
         name="General: Snapping",
         description="Snapping is activated. ▶▶▶ Go to the affected editor type and press on the Top Bar UI Button (Magnet)",
-        default=False
+        default=False,
+        get=warn_info_getter(7),
+        set=set_pass,
     )
 #    8 Scaling Issues 
     warn_info_8: bpy.props.BoolProperty(
         name="Active Object: Scaling Issues",
         description="Scaling issues detected for your active object. ▶▶▶ Check the scaling values and consider applying scale (Ctrl+A → Scale)",
-        default=False
+        default=False,
+        get=warn_info_getter(8),
+        set=set_pass,
     )
 #    9 Mirror Options
     warn_info_9: bpy.props.BoolProperty(
         name="Edit: Mirror Options",
         description="Mirror options are active in your 3D Viewport. ▶▶▶ Go to the 3D Viewport (Edit Mode) → Right Sidebar → Tool → Options → Transform → Mirror X/Y/Z",
-        default=False
+        default=False,
+        get=warn_info_getter(9),
+        set=set_pass,
     )
 #    10 Simplify 
     warn_info_10: bpy.props.BoolProperty(
         name="Render: Simplify",
         description="Simplify is turned on and the subdivision level is below your chosen threshold. Rendering with low Simplify settings can lead to unsatisfying results. ▶▶▶ Change the Simplify Settings in the Render Properties",
-        default=False
+        default=False,
+        get=warn_info_getter(10),
+        set=set_pass,
     )
 #    11 Sequencer
     warn_info_11: bpy.props.BoolProperty(
         name="Sequencer: Sequencer contains Strips",
         description="The Sequencer is turned on in the Output Properties and the Sequencer does contain image data. That might result in “Render” not working as expected. ▶▶▶ Consider turning off Output Properties → Post Processing → Sequencer",
-        default=False
+        default=False,
+        get=warn_info_getter(11),
+        set=set_pass,
     )
 #    12 Render Border
     warn_info_12: bpy.props.BoolProperty(
         name="Render: Render Region",
         description="Render Region is turned on in the Output Properties. Double check that render result is as expected. ▶▶▶ Consider turning off Output Properties → Format → Render Region",
-        default=False
+        default=False,
+        get=warn_info_getter(12),
+        set=set_pass,
     )
 #    13 Auto-Merge Vertices	     
     warn_info_13: bpy.props.BoolProperty(
         name="Edit: Auto-Merge Vertices",
         description="'Auto Merge Vertices’ is active in your 3d Viewport.  ▶▶▶ Go to the 3D Viewport → Right Sidebar → Tool → Options → Transform → ‘Auto Merge’",
-        default=False
+        default=False,
+        get=warn_info_getter(13),
+        set=set_pass,
     )
 #    14 UV Select Sync
     warn_info_14: bpy.props.BoolProperty(
         name="UV: Select Sync",
         description="'UV Sync Selection’ is turned on, you are only seeing UV for selected Geometry. Watch out for hidden Geometry. ▶▶▶ Consider disabling ‘UV Sync Selection’ in the UV Editor Top Bar or check if there is Geometry to unhide in the Edit-Mode (Alt+H)",
-        default=False
+        default=False,
+        get=warn_info_getter(14),
+        set=set_pass,
     )
 #    15 Live Unwrapping
     warn_info_15: bpy.props.BoolProperty(
         name="UV: Live Unwrap",
         description="UV ‘Live Unwrap’ is turned on. Changing the Geometry or Seams will change the UV Layout. ▶▶▶ Go to the 3D Viewport → Right Sidebar → Tool → Options → Transform → Uvs Live Unwrap",
-        default=False
+        default=False,
+        get=warn_info_getter(15),
+        set=set_pass,
     )
 #    16 Correct Face Attributes
     warn_info_16: bpy.props.BoolProperty(
         name="UV: Correct Face Attributes",
         description="'Correct Face Attributes’ is turned on. Changing the Geometry will change the UV Layout. ▶▶▶ Go to the 3D Viewport → Right Sidebar → Tool → Options → Correct Face Attributes",
-        default=False
+        default=False,
+        get=warn_info_getter(16),
+        set=set_pass,
     )
 #    17 Multiple Image Sequence Nodes with same datablock
     warn_info_17: bpy.props.BoolProperty(
         name="Shader: Img-Sequence not unique",
         description="Multiple Image Sequence nodes refer to the same datablock but have different settings, that is not really supported. Expect weird behavior. ▶▶▶ Create a unique datablock for your Image Sequence Nodes",
-        default=False
+        default=False,
+        get=warn_info_getter(17),
+        set=set_pass,
     )
 #    18 Sculpt Mode and Corrective Smooth
     warn_info_18: bpy.props.BoolProperty(
         name="Sculpt: Corrective Smooth active",
         description="Sculpt Mode + Corrective Smooth can lead to Geometry looking extremely different than expected once Corrective Smooth is turned off ▶▶▶Temporarily disable the modifier if needed",
-        default=False
+        default=False,
+        get=warn_info_getter(18),
+        set=set_pass,
     )
 #    19 Automatically Pack Ressources
     warn_info_19: bpy.props.BoolProperty(
         name="General: Autopack Ressources",
         description="Auto-Pack is activated, the Blender File will automatically pack all images and might become very large. ▶▶▶ File → External Data → Automatically Pack Ressources",
-        default=False
+        default=False,
+        get=warn_info_getter(19),
+        set=set_pass,
     )
 #    20 LocalView
     warn_info_20: bpy.props.BoolProperty(
         name="Viewport: Local View",
         description="'Local View’ is activated in one of your 3D Viewports. ▶▶▶ Press Numpad Slash (/) or go to the View menu in the 3D Viewport and select Local View → Toggle Local View",
-        default=False
+        default=False,
+        get=warn_info_getter(20),
+        set=set_pass,
     )
 #    21 Clipping Borders (Alt+B)
     warn_info_21: bpy.props.BoolProperty(
         name="Viewport: Clipping Border",
         description="'Clipping Borders’ are active in one of your 3D Viewports. ▶▶▶ Alt+B to clear Clipping Borders",
-        default=False
+        default=False,
+        get=warn_info_getter(21),
+        set=set_pass,
     )
 #    22 Active Object is Shadow Catcher/Holdout
     warn_info_22: bpy.props.BoolProperty(
         name="Active Object: Shadow Catcher/Holdout",
         description="Active Object is a Shadow Catcher or Holdout Object ▶▶▶ Check Object Properties → Visbility → Shadow Catcher / Holdout and change if needed", 
-        default=False
+        default=False,
+        get=warn_info_getter(22),
+        set=set_pass,
     )
 #    23 Render Resolution Percentage not 100%
     warn_info_23: bpy.props.BoolProperty(
         name="Render: Resolution not 100%",
         description="Render Resolution has been changed from 100% to another value. This is often done for test rendering and can lead to final render mistakes. ▶▶▶ In the Output Properties, reset the resolution to 100% if needed",
-        default=False
+        default=False,
+        get=warn_info_getter(23),
+        set=set_pass,
     )
 #    24 Render: Filter Size not 1.5
     warn_info_24: bpy.props.BoolProperty(
         name="Render: Filter Size",
         description="The Filter Size is changed from its default value. This can lead to pixelated or blurry renders. ▶▶▶ Consider changing the Filter Size back to 1.5px in the Render Properties → Film",
-        default=False
+        default=False,
+        get=warn_info_getter(24),
+        set=set_pass,
     )
 #    25 Viewport/Render Modifier Mismatch
     warn_info_25: bpy.props.BoolProperty(
         name="Viewport/Render: Modifier Mismatch",
         description="There is a mismatch for the Render/Viewport visibilities of some modifier. ▶▶▶ Check the modifiers and change if needed",
-        default=False
+        default=False,
+        get=warn_info_getter(25),
+        set=set_pass,
     )
 #    26 Sample Override 
     warn_info_26: bpy.props.BoolProperty(
         name="Render: Sample Override",
         description="There is an active Sample override for a Viewlayer. If this was done for test render purposes, this could be unwanted. ▶▶▶ Check Viewlayer Properties → Overrides and disable if needed",
-        default=False
+        default=False,
+        get=warn_info_getter(26),
+        set=set_pass,
     )
 #    27 Render Samples Low or High
     warn_info_27: bpy.props.BoolProperty(
         name="Render: Samples lower than threshold",
         description="This scene has either very high or low render samples. ▶▶▶ Check the sample numbers and change if needed",
-        default=False
+        default=False,
+        get=warn_info_getter(27),
+        set=set_pass,
     )
 #    28 Active Object: Array with relative Offset not first in stack
     warn_info_28: bpy.props.BoolProperty(
         name="Active Object: Relative Array",
         description="The active Object has an Array modifier with Relative offset with other modifiers in the stack before it. This might lead to changing positions between Render and Viewport. ▶▶▶ Double Check the Modifier Stack",
-        default=False
+        default=False,
+        get=warn_info_getter(28),
+        set=set_pass,
     )
 #    29 Viewport: Hidden Object Types    
     warn_info_29: bpy.props.BoolProperty(
         name="Viewport: Hidden Object Types",
         description="One of your 3D Viewports has Hidden Object Types. ▶▶▶ Toggle the Visibilities of the affected Viewport via the Top Bar Dropdown ’View Object Types’",
-        default=False
+        default=False,
+        get=warn_info_getter(29),
+        set=set_pass,
     )
 #    30 Viewport: Unselectable Object Types
     warn_info_30: bpy.props.BoolProperty(
         name="Viewport: Unselectable Object Types",
         description="One of your 3D Viewports has Unselectable Object Types. ▶▶▶ Toggle the Selectabilities of the affected Viewport via the Top Bar Dropdown ’View Object Types’",
-        default=False
+        default=False,
+        get=warn_info_getter(30),
+        set=set_pass,
     )
 #    31 Render: Preview Range is used
     warn_info_31: bpy.props.BoolProperty(
         name="Render: Use Preview Range",
         description="A Preview Range is used, that means not the whole timeline will play/render. ▶▶▶ Consider disabling via the Timeline → ‘Stopwatch’ Button in the Top Bar",
-        default=False
+        default=False,
+        get=warn_info_getter(31),
+        set=set_pass,
     )
 #    32 Cycles: Render Device
     warn_info_32: bpy.props.BoolProperty(
         name="Cycles: Render Device",
         description="The Cycles Render Device is not set to your chosen preference. ▶▶▶ Change in the Render Properties → Device",
-        default=False
+        default=False,
+        get=warn_info_getter(32),
+        set=set_pass,
     )
 #    33 Active Object: Locked Transforms
     warn_info_33: bpy.props.BoolProperty(
         name="Active Object: Locked Transforms",
         description="Active Object has locked Transforms ▶▶▶ In the 3D Viewport → Right Sidebar → Item → Lock/Unlock Icons",
-        default=False
+        default=False,
+        get=warn_info_getter(33),
+        set=set_pass,
     )
 #    34 Active Object: Rig in Rest Position
     warn_info_34: bpy.props.BoolProperty(
         name="Active Object: Rig in Rest Position",
         description="The Active Rig is set to Rest Position, so no animation can be seen or rendered right now ▶▶▶ In the Rig Properties → Skeleton → Pose Position",
-        default=False
+        default=False,
+        get=warn_info_getter(34),
+        set=set_pass,
     )
 #    35 Render: Material Override
     warn_info_35: bpy.props.BoolProperty(
         name="Render: Material Override",
         description="A Material Override has been set up for a Viewlayer ▶▶▶ Check Viewlayer Properties → Overrides and disable if needed",
-        default=False
+        default=False,
+        get=warn_info_getter(35),
+        set=set_pass,
     )
 #    36 Compositing: Use Nodes
     warn_info_36: bpy.props.BoolProperty(
         name="Compositing: 'Use Nodes' OFF",
         description="In the Compositor ‘Use Nodes’ is turned OFF but the Compositor contains Nodes ▶▶▶ Double Check and enable ‘Use Nodes’ in a Compositor if needed",
-        default=False
+        default=False,
+        get=warn_info_getter(36),
+        set=set_pass,
     )
 #    37 Render: Output to video
     warn_info_37: bpy.props.BoolProperty(
         name="Render: Output to Video",
         description="The Render Output has been set to a video format, that can cause issues, e.g. it won’t work on distributed rendering etc. ▶▶▶ Check Output Properties → Output → File Format and change If needed",
-        default=False
+        default=False,
+        get=warn_info_getter(37),
+        set=set_pass,
     )
 #    38 Render: Film Transparent
     warn_info_38: bpy.props.BoolProperty(
         name="Render: Film Transparent",
         description="The Transparency setting of the Render Output is different to your chosen preference. ▶▶▶ Check Render Properties → Film → Transparent and change If needed",
-        default=False
+        default=False,
+        get=warn_info_getter(38),
+        set=set_pass,
     )
 #    39 Sequencer: Loud audio
     warn_info_39: bpy.props.BoolProperty(
         name="Sequencer: Loud Audio",
         description="The Sequencer contains Audio Strips that are louder than your chosen threshold value. ▶▶▶ Check the Sequencer",
-        default=False
+        default=False,
+        get=warn_info_getter(39),
+        set=set_pass,
     )
 #    40 Active Object: Render < Viewport Subdiv
     warn_info_40: bpy.props.BoolProperty(
         name="SubSurf: Render < Viewport",
         description="The Active Object has a higher Viewport subdivision than Render subdivision. ▶▶▶ Check the Subdivision Surface modifier",
-        default=False
+        default=False,
+        get=warn_info_getter(40),
+        set=set_pass,
     )
 #    41 Material: Undefined Nodes
     warn_info_41: bpy.props.BoolProperty(
         name="Shader: 'Undefined' Nodes'",
         description="Materials contain Undefined Nodes, those are usually caused by Blendfiles being opened in lower versions than they were saved in. ▶▶▶ Use Headsup “Undefined” Panel to find problematic materials",
-        default=False
+        default=False,
+        get=warn_info_getter(41),
+        set=set_pass,
     )
 #    42 Data: Missing Textures
     warn_info_42: bpy.props.BoolProperty(
         name="Data: Missing Textures",
         description="Missing Textures found ▶▶▶ Go to File → External Data → Report Missing Files and check the Log printed to the Console",
-        default=False
+        default=False,
+        get=warn_info_getter(42),
+        set=set_pass,
     )
 #    43 Data: Missing Libraries
     warn_info_43: bpy.props.BoolProperty(
         name="Data: Missing Libraries",
         description="Missing Libraries found ▶▶▶ Go to File → External Data → Report Missing Files and check the Log printed to the Console",
-        default=False
+        default=False,
+        get=warn_info_getter(43),
+        set=set_pass,
     )
 #    44 Blender Version
     warn_info_44: bpy.props.BoolProperty(
         name="Data: Blender Version",
         description="The file was saved with another Blender Version. ▶▶▶ Make sure that you are aware of the differing versions, consider the limitations and save the file with this version to resolve the Warning",
-        default=False
+        default=False,
+        get=warn_info_getter(44),
+        set=set_pass,
     )
 #    45 Blender Version
     warn_info_45: bpy.props.BoolProperty(
         name="Compositing: Renderlayer Node Issue",
         description="In the Compositor a Renderlayer Node is either Muted or connected to a muted File Output Saver although the RenderLayer is active. ▶▶▶ Go to the Compositor and check",
-        default=False
+        default=False,
+        get=warn_info_getter(45),
+        set=set_pass,
     )
 #    46 Active Object: In Front
     warn_info_46: bpy.props.BoolProperty(
         name="Active Object: In Front",
         description="The Active Object is set to 'In Front', being shown in Front of all other objects in the 3D viewport. This might be confusing sometimes. ▶▶▶ Go to Object Properties → Viewport Display → 'In Front' ",
-        default=False
+        default=False,
+        get=warn_info_getter(46),
+        set=set_pass,
     )
 #    47 Active Object: Visible Texture Space
     warn_info_47: bpy.props.BoolProperty(
         name="Active Object: Visible Texture Space",
         description="The Active Object is set to show its Texture Space in the viewport. This might be confusing sometimes. ▶▶▶ Go to Object Properties → Viewport Display → 'Texture Space'",
-        default=False
+        default=False,
+        get=warn_info_getter(47),
+        set=set_pass,
     )
 #    48 Active Object: Wireframe Display
     warn_info_48: bpy.props.BoolProperty(
         name="Active Object: Wireframe Display",
         description="The Active Object is set to 'Wireframe' display mode in the viewport. This might be confusing sometimes. ▶▶▶ Go to Object Properties → Viewport Display → Display As",
-        default=False
+        default=False,
+        get=warn_info_getter(48),
+        set=set_pass,
     )
 #    49 Active Object: Collection Instance
     warn_info_49: bpy.props.BoolProperty(
         name="Active Object: Collection Instance",
         description="The Active Object is a Collection Instance. ▶▶▶ Go to Object Properties → Instancing",
-        default=False
+        default=False,
+        get=warn_info_getter(49),
+        set=set_pass,
     )
 #    50 Active Object: Faces/Verts Instance
     warn_info_50: bpy.props.BoolProperty(
         name="Active Object: Faces/Verts Instance",
         description="The Active Object is a Faces/Verts Instance. All children objects will be instanced to it's Verts/Faces. ▶▶▶ Go to Object Properties → Instancing",
-        default=False
+        default=False,
+        get=warn_info_getter(50),
+        set=set_pass,
     )
 #    51 Active Object: Solo Active Shape Key
     warn_info_51: bpy.props.BoolProperty(
         name="Active Object: Solo Active Shape Key",
         description="The Active Object has 'Solo Active Shape Key' enabled. This will ONLY show you the selected Shape Key. ▶▶▶ Go to Properties → Mesh → Shape Keys → Disable 'Solo Active Shape Key'",
-        default=False
+        default=False,
+        get=warn_info_getter(51),
+        set=set_pass,
     )
 #    52 Active Object: Hidden Geometry due to Shape Key
     warn_info_52: bpy.props.BoolProperty(
         name="Active Object: Shape Key Edit Mode",
         description="The Active Object is in Shape Key Edit Mode. This will show the MIX of all Shape Keys with their current values! Disable to only see current Shape Key! . ▶▶▶ Go to Properties → Mesh → Shape Keys → Disalbe 'Shape Key Edit Mode'",
-        default=False
+        default=False,
+        get=warn_info_getter(52),
+        set=set_pass,
+    )
+#    53 Data: Missing External Files
+    warn_info_53: bpy.props.BoolProperty(
+        name="Data: Missing External Files",
+        description="Movie clips, sounds, fonts, volumes, Alembic/USD caches, sequencer strips or point caches point to files that don't exist. A render farm will fail on them ▶▶▶ Go to File → External Data → Report Missing Files and check the Log printed to the Console",
+        default=False,
+        get=warn_info_getter(53),
+        set=set_pass,
+    )
+#    54 Data: Absolute Paths
+    warn_info_54: bpy.props.BoolProperty(
+        name="Data: Absolute Paths",
+        description="External files or output paths use absolute paths, which break when the project is moved or rendered on another machine ▶▶▶ Go to File → External Data → Make Paths Relative",
+        default=False,
+        get=warn_info_getter(54),
+        set=set_pass,
+    )
+#    55 Data: Outside Project Root
+    warn_info_55: bpy.props.BoolProperty(
+        name="Data: Outside Project Root",
+        description="External files or output paths are outside the project root and won't be uploaded with the project ▶▶▶ Move the files into the project folder or set the project root in the HeadsUp Preferences",
+        default=False,
+        get=warn_info_getter(55),
+        set=set_pass,
     )
 
 
@@ -355,7 +545,9 @@ class HEADSUP_WarnInfoProperties(bpy.types.PropertyGroup):
     warn_info_custom: bpy.props.BoolProperty(
         name="CUSTOM Warning",
         description="A custom HeadsUp warning was set up. ▶▶▶ To change or delete the warning, go to the text editor and find the text file that starts with ‘Headsup:’ in the first line",
-        default=False
+        default=False,
+        get=warn_info_getter(0),
+        set=set_pass,
     )
 
 WarnInfoIconMap = {
@@ -410,6 +602,9 @@ WarnInfoIconMap = {
     50:'SNAP_FACE_CENTER',
     51:'SOLO_ON',
     52:'EDITMODE_HLT',
+    53:'LIBRARY_DATA_BROKEN',
+    54:'FILE_FOLDER',
+    55:'FILE_PARENT',
 }
 
 def register():
@@ -0,0 +1,85 @@
+from .properties import HEADSUP_Props
+
+SEVERITY_INFO = 'INFO'
+SEVERITY_WARNING = 'WARNING'
+
+SCOPE_GLOBAL = None     # Shown in every editor, otherwise the hash of the space it applies to
+
+
+def split_runs(text):
+    """Split a warning into (text, highlighted) runs, [bracketed] parts are highlighted."""
+    runs = []
+    current = ""
+    inside_brackets = False
+    for char in text:
+        if char == "[":
+            if current:
+                runs.append((current, False))
+            current = "["
+            inside_brackets = True
+        elif char == "]":
+            runs.append((current + "]", True))
+            current = ""
+            inside_brackets = False
+        else:
+            current += char
+    if current:
+        runs.append((current, inside_brackets))
+    return tuple(runs)
+
+
+class HEADSUP_Warning:
+    """A single warning as reported by a rule."""
+
+    __slots__ = ("rule_id", "scope", "severity", "text", "runs")
+
+    def __init__(self, text, scope=SCOPE_GLOBAL, rule_id=None, severity=SEVERITY_WARNING):
+        self.rule_id = rule_id
+        self.scope = scope
+        self.severity = severity
+        self.text = text
+        self.runs = split_runs(text)
+
+    def _key(self):
+        return (self.rule_id, self.scope, self.severity, self.text)
+
+    def __eq__(self, other):
+        return isinstance(other, HEADSUP_Warning) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return f"<HEADSUP_Warning {self.rule_id} {self.scope} {self.text!r}>"
+
+
+def to_records(rule, results):
+    """Turn the strings or records a rule returned into records tagged with the rule."""
+    records = []
+    for result in results:
+        if not isinstance(result, HEADSUP_Warning):
+            result = HEADSUP_Warning(result, severity=rule.severity)
+        result.rule_id = rule.rule_id
+        records.append(result)
+    return records
+
+
+def index_by_space(records):
+    """Store the global records and, per space, the records shown there."""
+    global_records = [record for record in records if record.scope is SCOPE_GLOBAL]
+    space_records = {}
+    for record in records:
+        if record.scope is not SCOPE_GLOBAL and record.scope not in space_records:
+            # Keep the evaluation order of global and space specific warnings
+            space_records[record.scope] = [r for r in records if r.scope is SCOPE_GLOBAL or r.scope == record.scope]
+    HEADSUP_Props.global_warnings = global_records
+    HEADSUP_Props.space_warnings = space_records
+    HEADSUP_Props.warnings_generation += 1
+
+
+def warnings_for_space(space):
+    """Records to draw in ``space`` and whether any of them is specific to it."""
+    space_records = HEADSUP_Props.space_warnings.get(hash(space)) if space is not None else None
+    if space_records is None:
+        return HEADSUP_Props.global_warnings, False
+    return space_records, True
@@ -0,0 +1,254 @@
+import bpy
+import time
+import traceback
+
+from .properties import HEADSUP_Props
+from .records import *
+
+# Inputs a rule can depend on. The evaluator only re-runs a rule if at least
+# one of its inputs was marked dirty for the current update.
+INPUT_MODE = 'MODE'                    # bpy.context.mode
+INPUT_ACTIVE_OBJECT = 'ACTIVE_OBJECT'  # active object and its data/modifiers
+INPUT_TOOL_SETTINGS = 'TOOL_SETTINGS'  # scene.tool_settings
+INPUT_RENDER = 'RENDER'                # scene.render / cycles / eevee
+INPUT_SCENE = 'SCENE'                  # other scene settings (frame range, ...)
+INPUT_VIEW_LAYERS = 'VIEW_LAYERS'      # view layers and their overrides
+INPUT_WINDOWS = 'WINDOWS'              # window/screen/area/space layout
+INPUT_OBJECTS = 'OBJECTS'              # scene objects and collections
+INPUT_MATERIALS = 'MATERIALS'          # bpy.data.materials
+INPUT_IMAGES = 'IMAGES'                # bpy.data.images
+INPUT_LIBRARIES = 'LIBRARIES'          # bpy.data.libraries
+INPUT_EXTERNAL_FILES = 'EXTERNAL_FILES'  # every data-block with a filepath, see external_files.py
+INPUT_TEXTS = 'TEXTS'                  # bpy.data.texts
+INPUT_SEQUENCER = 'SEQUENCER'          # sequencer strips
+INPUT_COMPOSITOR = 'COMPOSITOR'        # compositor node tree
+INPUT_FILE = 'FILE'                    # blend file state (version, autopack, saved)
+
+ALL_INPUTS = frozenset({
+    INPUT_MODE, INPUT_ACTIVE_OBJECT, INPUT_TOOL_SETTINGS, INPUT_RENDER,
+    INPUT_SCENE, INPUT_VIEW_LAYERS, INPUT_WINDOWS, INPUT_OBJECTS,
+    INPUT_MATERIALS, INPUT_IMAGES, INPUT_LIBRARIES, INPUT_TEXTS,
+    INPUT_SEQUENCER, INPUT_COMPOSITOR, INPUT_FILE, INPUT_EXTERNAL_FILES,
+})
+
+# Inputs that need the full object/material sets when a rule starts running
+DATA_INPUTS = frozenset({INPUT_OBJECTS, INPUT_MATERIALS})
+
+COST_SMOOTHING = 0.3    # Weight of the newest measurement in the moving average of a rule's cost
+
+
+class HEADSUP_Rule:
+    """A single warning check and the inputs it depends on."""
+
+    def __init__(self, rule_id, func, inputs, info=None, options=(), severity=SEVERITY_WARNING):
+        self.rule_id = rule_id        # Preference toggling the rule, e.g. "warn_27_a"
+        self.func = func              # func(state) -> list of warning strings or HEADSUP_Warning
+        self.severity = severity
+        self.inputs = frozenset(inputs)
+        self.options = tuple(options) # Additional preferences the result depends on
+        # Suffix of the warn_info_* property set while the rule reports warnings
+        if info is None:
+            info = rule_id.split("_")[1]
+        self.info = str(info)
+
+    @property
+    def scans_data(self):
+        return bool(self.inputs & DATA_INPUTS)
+
+    def is_enabled(self, prefs):
+        return bool(getattr(prefs, self.rule_id, False))
+
+    def signature(self, prefs):
+        """Preference values the rule result depends on."""
+        return tuple(getattr(prefs, option, None) for option in self.options)
+
+    def __repr__(self):
+        return f"<HEADSUP_Rule {self.rule_id}>"
+
+
+# Registered rules in evaluation (and therefore display) order
+RULES = {}
+
+
+def headsup_rule(rule_id, inputs, info=None, options=(), severity=SEVERITY_WARNING):
+    """Decorator registering a check function as a HeadsUp rule."""
+    def decorator(func):
+        RULES[rule_id] = HEADSUP_Rule(rule_id, func, inputs, info, options, severity)
+        return func
+    return decorator
+
+
+class HEADSUP_EvalState:
+    """Everything a rule may read during one evaluation."""
+
+    def __init__(self, scene, prefs):
+        self.scene = scene
+        self.prefs = prefs
+        self.mode = bpy.context.mode
+        self.active_obj = bpy.context.active_object
+        self.check_objects = set()
+        self.check_materials = set()
+        self.full = False
+        self.snapshot = None    # Window/space snapshot, taken by the first viewport rule
+        self.tree_summaries = {}  # Node tree pointer → summary, shared by the material rules
+
+
+def invalidate_plan():
+    """Recompile the active plan on the next evaluation."""
+    HEADSUP_Props.plan_dirty = True
+
+
+def compile_plan(prefs):
+    """Rebuild the list of enabled rules if preferences changed.
+
+    Returns the rules that have to run regardless of dirty inputs, because they
+    were just enabled or one of their options changed.
+    """
+    if not HEADSUP_Props.plan_dirty and HEADSUP_Props.active_plan is not None:
+        return set()
+
+    plan = []
+    forced = set()
+    signatures = {}
+    for rule in RULES.values():
+        if not rule.is_enabled(prefs):
+            HEADSUP_Props.rule_results.pop(rule.rule_id, None)
+            HEADSUP_Props.deferred_rules.pop(rule.rule_id, None)
+            HEADSUP_Props.deferred_items.pop(rule.rule_id, None)
+            continue
+        plan.append(rule)
+        signature = rule.signature(prefs)
+        signatures[rule.rule_id] = signature
+        if HEADSUP_Props.plan_signatures.get(rule.rule_id) != signature or rule.rule_id not in HEADSUP_Props.rule_results:
+            forced.add(rule)
+
+    HEADSUP_Props.active_plan = plan
+    HEADSUP_Props.plan_signatures = signatures
+    HEADSUP_Props.plan_dirty = False
+    return forced
+
+
+def schedule_rules(state, dirty_inputs, forced=()):
+    """Rules of the active plan to run now, in plan order.
+
+    Forced rules and rules deferred for longer than the maximum delay always
+    run. The other dirty or deferred rules run cheapest first while their
+    measured cost fits the budget, the rest is deferred to a later evaluation.
+    """
+    prefs = state.prefs
+    deferred = HEADSUP_Props.deferred_rules
+    due = [rule for rule in HEADSUP_Props.active_plan or ()
+           if rule in forced or rule.inputs & dirty_inputs or rule.rule_id in deferred]
+    if state.full or not prefs.adaptive_scheduling:
+        return due
+
+    now = time.perf_counter()
+    costs = HEADSUP_Props.rule_costs
+    budget = prefs.rule_budget / 1000
+    run = set()
+    for rule in due:
+        since = deferred.get(rule.rule_id)
+        if rule in forced or (since is not None and now - since >= prefs.max_staleness):
+            run.add(rule)
+            budget -= costs.get(rule.rule_id, 0.0)
+    # Rules that never ran have no cost yet and are measured right away
+    for rule in sorted((rule for rule in due if rule not in run), key=lambda rule: costs.get(rule.rule_id, 0.0)):
+        cost = costs.get(rule.rule_id, 0.0)
+        if cost <= budget:
+            run.add(rule)
+            budget -= cost
+        else:
+            deferred.setdefault(rule.rule_id, now)
+            if rule.scans_data:
+                # The check-lists are rebuilt every evaluation, keep this rule's items
+                objects, materials = HEADSUP_Props.deferred_items.setdefault(rule.rule_id, (set(), set()))
+                objects.update(state.check_objects)
+                materials.update(state.check_materials)
+    return [rule for rule in due if rule in run]
+
+
+def next_deferred_delay(prefs):
+    """Seconds until deferred rules should be evaluated again, None without deferred rules."""
+    deferred = HEADSUP_Props.deferred_rules
+    if not deferred:
+        return None
+    budget = prefs.rule_budget / 1000
+    # A deferred rule fitting an otherwise idle evaluation doesn't have to wait
+    if any(HEADSUP_Props.rule_costs.get(rule_id, 0.0) <= budget for rule_id in deferred):
+        return 0.0
+    now = time.perf_counter()
+    return max(0.0, min(since + prefs.max_staleness - now for since in deferred.values()))
+
+
+def run_rule(rule, state):
+    """Run ``rule`` and update the moving average of its cost.
+
+    Items collected while the rule was deferred are only added to its own copy
+    of the check-lists, what the rule adds itself still reaches the later rules.
+    They are only forgotten once the rule succeeded.
+    """
+    objects, materials = HEADSUP_Props.deferred_items.get(rule.rule_id, ((), ()))
+    shared = None
+    if objects or materials:
+        shared = state.check_objects, state.check_materials
+        state.check_objects = state.check_objects | set(objects)
+        state.check_materials = state.check_materials | set(materials)
+        own = frozenset(state.check_objects), frozenset(state.check_materials)
+    HEADSUP_Props.deferred_rules.pop(rule.rule_id, None)
+    start = time.perf_counter()
+    try:
+        records = to_records(rule, rule.func(state) or [])
+    finally:
+        elapsed = time.perf_counter() - start
+        cost = HEADSUP_Props.rule_costs.get(rule.rule_id)
+        HEADSUP_Props.rule_costs[rule.rule_id] = elapsed if cost is None else cost + COST_SMOOTHING * (elapsed - cost)
+        if shared is not None:
+            shared[0].update(state.check_objects - own[0])
+            shared[1].update(state.check_materials - own[1])
+            state.check_objects, state.check_materials = shared
+    HEADSUP_Props.deferred_items.pop(rule.rule_id, None)
+    return records
+
+
+def evaluate_rules(state, dirty_inputs, forced=()):
+    """Run the rules of the active plan whose inputs are dirty, within the time budget.
+
+    Results of rules that did not need to run or were deferred are taken from
+    the previous evaluation. Returns the combined list of HEADSUP_Warning
+    records and the set of warn_info suffixes to enable.
+    """
+    results = HEADSUP_Props.rule_results
+    for rule in schedule_rules(state, dirty_inputs, forced):
+        try:
+            results[rule.rule_id] = run_rule(rule, state)
+        except Exception:
+            print(f"HeadsUp [{rule.rule_id}] Error:")
+            traceback.print_exc()
+            results[rule.rule_id] = []
+
+    new_warnings = []
+    infos = set()
+    for rule in HEADSUP_Props.active_plan or ():
+        rule_warnings = results.get(rule.rule_id)
+        if rule_warnings:
+            new_warnings.extend(rule_warnings)
+            infos.add(rule.info)
+    return new_warnings, infos
+
+
+def info_mask(infos):
+    """Pack the warn_info suffixes into a bitmask, bit 0 is the custom warning."""
+    mask = 0
+    for info in infos:
+        mask |= 1 << (0 if info == "custom" else int(info))
+    return mask
+
+
+def reset_rule_results():
+    """Forget cached results, e.g. after loading another file."""
+    HEADSUP_Props.rule_results = {}
+    HEADSUP_Props.rule_costs = {}
+    HEADSUP_Props.deferred_rules = {}
+    HEADSUP_Props.deferred_items = {}
+    HEADSUP_Props.warn_info_mask = 0
+    HEADSUP_Props.plan_dirty = True
@@ -0,0 +1,218 @@
+import bpy
+import time
+
+from .properties import HEADSUP_Props
+from .changes import *
+from .utils import redraw_overlays
+
+# Seconds to wait before trying again while a modal operator runs or animation plays
+BUSY_RETRY_INTERVAL = 0.2
+# Longest an evaluation is postponed, the warnings must not freeze during long playback or drags
+MAX_POSTPONE = 2.0
+# Modal operators that update the scene continuously, others (e.g. screencast add-ons) may run all the time
+BUSY_OPERATOR_PREFIXES = ("TRANSFORM_OT_", "VIEW3D_OT_", "SCULPT_OT_", "PAINT_OT_")
+# Seconds between two slices of a full scan, lets Blender handle events in between
+SCAN_SLICE_INTERVAL = 0.01
+INITIAL_SLICE_SIZE = 50
+
+_evaluation_timer = None
+_evaluator = None       # headsup_check_warnings, set on register
+
+
+def is_busy():
+    """True while a transform, navigation or paint operator runs or an animation plays in any window."""
+    window_manager = bpy.context.window_manager
+    if window_manager is None:
+        return False
+    for window in window_manager.windows:
+        if bpy.app.version >= (4, 2) and any(operator.bl_idname.startswith(BUSY_OPERATOR_PREFIXES)
+                                             for operator in window.modal_operators):
+            return True
+        if window.screen and window.screen.is_animation_playing:
+            return True
+    return False
+
+
+def should_postpone():
+    """True while busy, but for at most MAX_POSTPONE seconds in a row."""
+    if not is_busy():
+        HEADSUP_Props.busy_since = None
+        return False
+    now = time.perf_counter()
+    if HEADSUP_Props.busy_since is None:
+        HEADSUP_Props.busy_since = now
+    if now - HEADSUP_Props.busy_since < MAX_POSTPONE:
+        return True
+    HEADSUP_Props.busy_since = now
+    return False
+
+
+def request_evaluation(depsgraph, evaluate):
+    """Mark the warnings dirty and schedule a bounded-rate evaluation.
+
+    Depsgraph updates arriving before the evaluation runs are merged into the
+    pending change set, the last one is always followed by an evaluation.
+    """
+    HEADSUP_Props.pending_changes = classify_updates(depsgraph, HEADSUP_Props.pending_changes)
+    # Updates arriving during an evaluation are evaluated right after it, see run_pending_evaluation
+    if HEADSUP_Props.evaluating:
+        HEADSUP_Props.updates_during_evaluation = True
+        return
+
+    prefs = bpy.context.preferences.addons[__package__].preferences
+    if prefs.synchronous_evaluation and not is_busy():
+        run_pending_evaluation(evaluate)
+        return
+
+    schedule_evaluation(evaluate, prefs.max_evaluation_rate)
+
+
+def set_evaluator(evaluate):
+    """Function evaluating a change set, used by request_inputs."""
+    global _evaluator
+    _evaluator = evaluate
+
+
+def request_inputs(inputs, min_delay=0.0):
+    """Re-run the rules reading ``inputs``, e.g. when background results arrived."""
+    if _evaluator is None:
+        return
+    changes = HEADSUP_Props.pending_changes or HEADSUP_ChangeSet()
+    changes.inputs.update(inputs)
+    HEADSUP_Props.pending_changes = changes
+    prefs = bpy.context.preferences.addons[__package__].preferences
+    schedule_evaluation(_evaluator, prefs.max_evaluation_rate, min_delay)
+
+
+def schedule_evaluation(evaluate, max_rate, min_delay=0.0):
+    """Register the evaluation timer unless it is already waiting."""
+    global _evaluation_timer
+    if _evaluation_timer is not None and bpy.app.timers.is_registered(_evaluation_timer):
+        return
+
+    def evaluation_timer():
+        if should_postpone():
+            return BUSY_RETRY_INTERVAL
+        run_pending_evaluation(evaluate)
+        return None
+
+    min_interval = 1.0 / max(1, max_rate)
+    delay = max(min_delay, HEADSUP_Props.last_evaluation_time + min_interval - time.perf_counter())
+    _evaluation_timer = evaluation_timer
+    bpy.app.timers.register(evaluation_timer, first_interval=delay)
+
+
+def _change_signature(changes):
+    """Comparable summary of a change set, see run_pending_evaluation."""
+    return (frozenset(changes.inputs), frozenset(changes.objects), frozenset(changes.materials),
+            frozenset(changes.node_trees), frozenset(changes.collections), changes.compositor,
+            frozenset(changes.external_ids))
+
+
+def run_pending_evaluation(evaluate):
+    """Evaluate all changes collected since the last evaluation."""
+    changes = HEADSUP_Props.pending_changes or HEADSUP_ChangeSet()
+    HEADSUP_Props.pending_changes = None
+    HEADSUP_Props.last_evaluation_time = time.perf_counter()
+    previous_signature = HEADSUP_Props.follow_up_signature
+    HEADSUP_Props.follow_up_signature = None
+    HEADSUP_Props.updates_during_evaluation = False
+    HEADSUP_Props.evaluating = True
+    try:
+        evaluate(changes)
+    finally:
+        HEADSUP_Props.evaluating = False
+
+    # Updates that arrived meanwhile get a rate-limited follow-up evaluation. If the follow-up
+    # causes exactly the updates it evaluated, the evaluation caused them itself, drop them
+    # instead of re-triggering it forever
+    if HEADSUP_Props.updates_during_evaluation and HEADSUP_Props.pending_changes is not None:
+        signature = _change_signature(HEADSUP_Props.pending_changes)
+        if signature == previous_signature:
+            HEADSUP_Props.pending_changes = None
+            return
+        HEADSUP_Props.follow_up_signature = signature
+        prefs = bpy.context.preferences.addons[__package__].preferences
+        schedule_evaluation(evaluate, prefs.max_evaluation_rate)
+
+
+def cancel_pending_evaluation():
+    """Drop queued changes and the waiting timer, e.g. when a new file is loaded."""
+    global _evaluation_timer
+    HEADSUP_Props.pending_changes = None
+    HEADSUP_Props.follow_up_signature = None
+    if _evaluation_timer is not None and bpy.app.timers.is_registered(_evaluation_timer):
+        bpy.app.timers.unregister(_evaluation_timer)
+    _evaluation_timer = None
+
+
+class HEADSUP_ScanJob:
+    """Objects and materials of a full scan, evaluated a slice at a time."""
+
+    def __init__(self, objects, materials):
+        self.items = [(True, obj) for obj in objects] + [(False, mat) for mat in materials]
+        self.position = 0
+        self.slice_size = INITIAL_SLICE_SIZE    # Adapted to the time budget after every slice
+
+    @property
+    def progress(self):
+        return self.position / len(self.items) if self.items else 1.0
+
+
+def start_scan_job(objects, materials):
+    """Hand the objects and materials of a full scan to the evaluator over several timer calls."""
+    HEADSUP_Props.scan_job = HEADSUP_ScanJob(objects, materials)
+    HEADSUP_Props.scan_progress = 0.0
+    if not bpy.app.timers.is_registered(run_scan_slice):
+        bpy.app.timers.register(run_scan_slice, first_interval=SCAN_SLICE_INTERVAL)
+
+
+def run_scan_slice():
+    """Timer evaluating the next slice of the full scan within the time budget."""
+    job = HEADSUP_Props.scan_job
+    if job is None or _evaluator is None:
+        return None
+    if should_postpone():
+        return BUSY_RETRY_INTERVAL
+
+    items = job.items[job.position:job.position + job.slice_size]
+    job.position += len(items)
+    changes = HEADSUP_Props.pending_changes or HEADSUP_ChangeSet()
+    for is_object, id_data in items:
+        if is_object:
+            changes.objects.add(id_data)
+            changes.inputs.add(INPUT_OBJECTS)
+        else:
+            changes.materials.add(id_data)
+            changes.inputs.add(INPUT_MATERIALS)
+    HEADSUP_Props.pending_changes = changes
+
+    finished = job.position >= len(job.items)
+    if finished:
+        # The last evaluation already removes the progress marker
+        HEADSUP_Props.scan_job = None
+        HEADSUP_Props.scan_progress = None
+    else:
+        HEADSUP_Props.scan_progress = job.progress
+
+    start = time.perf_counter()
+    run_pending_evaluation(_evaluator)
+    elapsed = time.perf_counter() - start
+    # The progress marker changes even if the warnings don't
+    redraw_overlays()
+
+    # The evaluation may have started a new full scan, e.g. after a save, this timer runs it
+    if HEADSUP_Props.scan_job is not job:
+        return SCAN_SLICE_INTERVAL if HEADSUP_Props.scan_job is not None else None
+    prefs = bpy.context.preferences.addons[__package__].preferences
+    budget = prefs.scan_slice_budget / 1000
+    # Aim the next slice at the budget, but don't grow it too fast after a cheap slice
+    job.slice_size = max(1, min(job.slice_size * 2, int(len(items) * budget / max(elapsed, 1e-6))))
+    return SCAN_SLICE_INTERVAL
+
+
+def cancel_scan_job():
+    HEADSUP_Props.scan_job = None
+    HEADSUP_Props.scan_progress = None
+    if bpy.app.timers.is_registered(run_scan_slice):
+        bpy.app.timers.unregister(run_scan_slice)
@@ -0,0 +1,117 @@
+import bpy
+
+from .properties import HEADSUP_Props
+
+# Object types of the viewport visibility/selectability toggles, bit i of the masks below
+OBJECT_TYPES = (
+    ("armature", "Armatures"),
+    ("camera", "Cameras"),
+    ("curve", "Curves"),
+    ("curves", "Hair Curves"),
+    ("empty", "Empties"),
+    ("font", "Fonts"),
+    ("grease_pencil", "Grease Pencil"),
+    ("lattice", "Lattices"),
+    ("light", "Lights"),
+    ("light_probe", "Light Probes"),
+    ("mesh", "Meshes"),
+    ("meta", "Meta Balls"),
+    ("pointcloud", "Pointclouds"),
+    ("speaker", "Speakers"),
+    ("surf", "Surfaces"),
+    ("volume", "Volumes"),
+)
+
+
+def object_type_mask(space, prefix):
+    """Bitmask of the object types whose show_object_<prefix>_* toggle is off."""
+    mask = 0
+    for bit, (object_type, _label) in enumerate(OBJECT_TYPES):
+        if not getattr(space, f"show_object_{prefix}_{object_type}", True):
+            mask |= 1 << bit
+    return mask
+
+
+def object_type_labels(mask):
+    """Sorted, comma separated labels of the object types set in ``mask``."""
+    return ", ".join(sorted(label for bit, (_type, label) in enumerate(OBJECT_TYPES) if mask & (1 << bit)))
+
+
+class HEADSUP_SpaceSnapshot:
+    """Settings of one 3D Viewport space the viewport rules read."""
+
+    def __init__(self, space):
+        self.identifier = hash(space)   # Scope of its warnings, warnings_for_space() looks them up by hash(space)
+        self.lock_camera = False
+        self.local_view = False
+        self.clip_planes = False
+        self.hidden_mask = object_type_mask(space, "viewport")
+        self.unselectable_mask = object_type_mask(space, "select")
+
+
+class HEADSUP_WindowSnapshot:
+    """One pass over all windows, areas and 3D Viewport spaces."""
+
+    def __init__(self):
+        self.spaces = []            # HEADSUP_SpaceSnapshot of every open 3D Viewport
+        self.editor_types = set()   # Area types open in any window
+
+
+def take_snapshot():
+    """Walk windows → areas → spaces once and reuse the cached per-space masks.
+
+    The object type masks are only re-read for spaces that are new or after a
+    msgbus notification changed one of the toggles.
+    """
+    cache = HEADSUP_Props.space_snapshots
+    if HEADSUP_Props.space_snapshots_dirty:
+        cache.clear()
+        HEADSUP_Props.space_snapshots_dirty = False
+
+    snapshot = HEADSUP_WindowSnapshot()
+    seen = set()
+    window_manager = bpy.context.window_manager
+    if window_manager is None:
+        return snapshot
+
+    for window in window_manager.windows:
+        screen = window.screen
+        if screen is None:
+            continue
+        for area in screen.areas:
+            snapshot.editor_types.add(area.type)
+            if area.type != 'VIEW_3D':
+                continue
+            space = area.spaces.active
+            if space is None or space.type != 'VIEW_3D':
+                continue
+
+            pointer = space.as_pointer()
+            seen.add(pointer)
+            space_snapshot = cache.get(pointer)
+            if space_snapshot is None:
+                space_snapshot = cache[pointer] = HEADSUP_SpaceSnapshot(space)
+
+            # Cheap settings, changed by operators without any notification
+            space_snapshot.lock_camera = space.lock_camera
+            space_snapshot.local_view = space.local_view is not None
+            space_snapshot.clip_planes = any(region.type == 'WINDOW' and region.data is not None and region.data.use_clip_planes
+                                             for region in area.regions)
+            snapshot.spaces.append(space_snapshot)
+
+    # Drop closed areas so a reused pointer starts with fresh masks
+    for pointer in set(cache) - seen:
+        del cache[pointer]
+    return snapshot
+
+
+def get_snapshot(state):
+    """Snapshot shared by all viewport rules of one evaluation."""
+    if state.snapshot is None:
+        state.snapshot = take_snapshot()
+    return state.snapshot
+
+
+def invalidate_snapshots():
+    """Re-read the object type masks of all spaces on the next evaluation."""
+    HEADSUP_Props.space_snapshots_dirty = True
@@ -0,0 +1,96 @@
+import bpy
+import os
+import sqlite3
+import time
+import traceback
+
+from .properties import HEADSUP_Props
+
+DATABASE_NAME = "stat_cache.sqlite"
+
+_connection = None      # Opened on first use, only ever touched by the main thread
+
+
+def database_path():
+    directory = bpy.utils.user_resource('CONFIG', path="headsup", create=True)
+    return os.path.join(directory, DATABASE_NAME)
+
+
+def _connect():
+    global _connection
+    if _connection is None:
+        _connection = sqlite3.connect(database_path())
+        _connection.execute(
+            "CREATE TABLE IF NOT EXISTS stats ("
+            "path TEXT PRIMARY KEY, present INTEGER, size INTEGER, mtime REAL, verified REAL)"
+        )
+    return _connection
+
+
+def stat_cache_validity():
+    """Seconds a stored stat is trusted without a new check, None if the cache is disabled."""
+    prefs = bpy.context.preferences.addons[__package__].preferences
+    if not prefs.persistent_stat_cache or HEADSUP_Props.stat_cache_failed:
+        return None
+    return prefs.stat_cache_validity * 3600
+
+
+def _disable(func):
+    # A locked or corrupt database must not break the file checks
+    print(f"HeadsUp [{func}] Error:")
+    traceback.print_exc()
+    HEADSUP_Props.stat_cache_failed = True
+    close_stat_cache()
+
+
+def load_stat(path, check_time):
+    """Stored existence of ``path`` as a ``path_cache`` entry, None if it is unknown or was already looked up.
+
+    Fresh entries get ``check_time``, expired ones a check time in the distant
+    past, so ``path_exists`` returns them right away and refreshes them in the
+    background.
+    """
+    validity = stat_cache_validity()
+    if validity is None or path in HEADSUP_Props.stat_lookups:
+        return None
+    # Paths still being checked miss on every evaluation, query each one once
+    HEADSUP_Props.stat_lookups.add(path)
+    try:
+        row = _connect().execute("SELECT present, verified FROM stats WHERE path = ?", (path,)).fetchone()
+    except sqlite3.Error:
+        _disable("load_stat")
+        return None
+    if row is None:
+        return None
+    present, verified = row
+    return bool(present), check_time if time.time() - verified <= validity else float("-inf")
+
+
+def queue_stat(path, stat):
+    """Remember a worker result, written in one transaction by ``flush_stats``."""
+    if stat_cache_validity() is not None:
+        present, size, mtime = stat
+        HEADSUP_Props.pending_stats.append((path, int(present), size, mtime, time.time()))
+
+
+def flush_stats():
+    if not HEADSUP_Props.pending_stats:
+        return
+    stats = HEADSUP_Props.pending_stats
+    HEADSUP_Props.pending_stats = []
+    try:
+        with _connect() as connection:
+            connection.executemany("INSERT OR REPLACE INTO stats VALUES (?, ?, ?, ?, ?)", stats)
+    except sqlite3.Error:
+        _disable("flush_stats")
+
+
+def close_stat_cache():
+    global _connection
+    HEADSUP_Props.stat_lookups = set()
+    if _connection is not None:
+        try:
+            _connection.close()
+        except sqlite3.Error:
+            pass
+        _connection = None
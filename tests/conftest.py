@@ -0,0 +1,61 @@
+import importlib.util
+import os
+import pathlib
+import sys
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+ADDON_NAME = "headsup_warnings"
+
+
+@pytest.fixture(scope="session")
+def headsup():
+    """The registered add-on, needs Blender's bpy module (pip install bpy)."""
+    bpy = pytest.importorskip("bpy")
+    spec = importlib.util.spec_from_file_location(ADDON_NAME, ROOT / "__init__.py",
+                                                  submodule_search_locations=[str(ROOT)])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[ADDON_NAME] = module
+    spec.loader.exec_module(module)
+    # The add-on reads its preferences through bpy.context.preferences.addons[__package__]
+    if ADDON_NAME not in bpy.context.preferences.addons:
+        bpy.context.preferences.addons.new().module = ADDON_NAME
+    module.register()
+    # Timers don't run in background mode, the startup delay is skipped
+    bpy.app.timers.unregister(module.handlers.check_startup_time)
+    module.properties.HEADSUP_Props.startup_done = True
+    yield module
+    module.unregister()
+
+
+def pytest_sessionfinish(session, exitstatus):
+    session.config.headsup_exitstatus = exitstatus
+
+
+def pytest_unconfigure(config):
+    # The bpy module can hang while freeing Blender at interpreter exit after
+    # files were loaded with add-on classes registered, leave right after the summary
+    if "bpy" in sys.modules and hasattr(config, "headsup_exitstatus"):
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(int(config.headsup_exitstatus))
+
+
+@pytest.fixture
+def prefs(headsup):
+    import bpy
+    return bpy.context.preferences.addons[ADDON_NAME].preferences
+
+
+@pytest.fixture
+def evaluate(headsup):
+    """Run the pending evaluation and every slice of a running full scan, timers don't run in background mode."""
+    def run():
+        headsup.scheduler.run_pending_evaluation(headsup.handlers.headsup_check_warnings)
+        while headsup.scheduler.run_scan_slice() is not None:
+            pass
+        # Nothing is left to do for the timers, see headsup()
+        headsup.scheduler.cancel_scan_job()
+        headsup.scheduler.cancel_pending_evaluation()
+    return run
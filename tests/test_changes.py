@@ -0,0 +1,21 @@
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+
+def test_only_added_or_removed_strips_reread_the_scene_files(headsup):
+    changes = headsup.changes
+    bpy.ops.wm.read_homefile(use_empty=True)
+    scene = bpy.context.scene
+    headsup.external_files.invalidate_external_files()
+    assert changes._strips_changed(scene)
+    scene.render.resolution_x = 640
+    assert not changes._strips_changed(scene)
+
+    editor = scene.sequence_editor_create()
+    strips = editor.strips if hasattr(editor, "strips") else editor.sequences
+    strip = strips.new_effect("Color", 'COLOR', channel=1, frame_start=1, frame_end=10)
+    assert changes._strips_changed(scene)
+    assert not changes._strips_changed(scene)
+    strips.remove(strip)
+    assert changes._strips_changed(scene)
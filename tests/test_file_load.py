@@ -0,0 +1,53 @@
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+
+def test_second_file_load_drops_previous_results(headsup, prefs, evaluate, tmp_path):
+    props = headsup.properties.HEADSUP_Props
+    prefs.warn_2 = True
+    prefs.time_sliced_scans = True
+
+    bpy.ops.wm.read_homefile(use_empty=True)
+    empty_file = str(tmp_path / "empty.blend")
+    bpy.ops.wm.save_as_mainfile(filepath=empty_file)
+
+    obj = bpy.data.objects.new("Mismatch", bpy.data.meshes.new("Mismatch"))
+    bpy.context.scene.collection.objects.link(obj)
+    obj.hide_render = True
+    props.undefined_nodes = ["Stale Material"]
+    props.load_up_done = False
+    evaluate()
+    assert [mismatch["object"].name for mismatch in props.object_mismatches] == ["Mismatch"]
+
+    bpy.ops.wm.open_mainfile(filepath=empty_file)
+    # Only the first evaluation, before any slice of the time-sliced scan ran
+    headsup.scheduler.run_pending_evaluation(headsup.handlers.headsup_check_warnings)
+    assert props.scan_progress is not None
+    assert props.scan_job is not None
+    assert props.object_mismatches == []
+    assert props.undefined_nodes == []
+
+    evaluate()
+    assert props.scan_progress is None
+    assert props.object_mismatches == []
+    assert props.undefined_nodes == []
+    assert not any(warning.rule_id in {"warn_2", "warn_41"} for warning in props.warnings)
+
+
+
+def test_time_sliced_scan_takes_the_visibility_baseline(headsup, prefs, evaluate):
+    props = headsup.properties.HEADSUP_Props
+    prefs.time_sliced_scans = True
+    bpy.ops.wm.read_homefile(use_empty=True)
+    for index in range(10):
+        obj = bpy.data.objects.new(f"Object {index}", bpy.data.meshes.new(f"Object {index}"))
+        bpy.context.scene.collection.objects.link(obj)
+    headsup.visibility.reset_visibility()
+
+    props.load_up_done = False
+    headsup.scheduler.run_pending_evaluation(headsup.handlers.headsup_check_warnings)
+    assert props.scan_job is not None
+    # Otherwise the first slice checks every object of the scene
+    assert headsup.visibility.refresh_visibility(bpy.context.scene) == []
+    evaluate()
@@ -0,0 +1,83 @@
+import threading
+import time
+
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+
+@pytest.fixture
+def filecheck(headsup, monkeypatch):
+    filecheck = headsup.filecheck
+    props = headsup.properties.HEADSUP_Props
+    blocked = threading.Event()
+
+    def stat_path(path):
+        blocked.wait(5)
+        return False, None, None
+
+    monkeypatch.setattr(filecheck, "_stat_path", stat_path)
+    monkeypatch.setattr(filecheck, "WORKER_COUNT", 1)
+    monkeypatch.setattr(filecheck, "MAX_STUCK_WORKERS", 1)
+    filecheck.stop_file_checks()
+    props.pending_paths = {}
+    yield filecheck
+    blocked.set()
+    filecheck.stop_file_checks()
+
+
+def wait_until_started(filecheck, path):
+    for _attempt in range(100):
+        if (filecheck.CHECK_PATH, path) in filecheck._started:
+            return
+        time.sleep(0.01)
+    raise AssertionError(f"{path} was never started")
+
+
+def time_out(filecheck, props, path):
+    """Make the running check of ``path`` look older than PATH_TIMEOUT."""
+    key = (filecheck.CHECK_PATH, path)
+    started, thread = filecheck._started[key]
+    filecheck._started[key] = (started - 10, thread)
+    props.pending_paths[key] -= 10
+
+
+def test_requests_behind_stuck_workers_dont_wait_forever(headsup, filecheck):
+    props = headsup.properties.HEADSUP_Props
+    for path in ("/first/mount/a.png", "/second/mount/b.png"):
+        assert filecheck.path_exists(path) is None
+        wait_until_started(filecheck, path)
+        time_out(filecheck, props, path)
+        filecheck.drain_results()
+    assert filecheck._workers == []
+
+    # No worker can be started, the request stays unknown instead of pending forever
+    path = "/third/mount/c.png"
+    assert filecheck.path_exists(path) is None
+    props.pending_paths[(filecheck.CHECK_PATH, path)] -= 10
+    assert filecheck.drain_results() is None
+    assert props.pending_paths == {}
+
+
+def test_pending_paths_are_looked_up_once(headsup, filecheck, monkeypatch, tmp_path):
+    stat_cache = headsup.stat_cache
+    queries = []
+
+    class Connection:
+        def __init__(self, connection):
+            self.connection = connection
+
+        def execute(self, *args):
+            queries.append(args)
+            return self.connection.execute(*args)
+
+    monkeypatch.setattr(stat_cache, "stat_cache_validity", lambda: 3600)
+    monkeypatch.setattr(stat_cache, "database_path", lambda: str(tmp_path / "stats.sqlite"))
+    connect = stat_cache._connect
+    monkeypatch.setattr(stat_cache, "_connect", lambda: Connection(connect()))
+    try:
+        for _evaluation in range(3):
+            assert filecheck.path_exists("/pending/mount/a.png") is None
+        assert len(queries) == 1
+    finally:
+        stat_cache.close_stat_cache()
@@ -0,0 +1,50 @@
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+
+def link_twice():
+    """Collection "Shared" with one object, linked under the collections "A" and "B"."""
+    bpy.ops.wm.read_homefile(use_empty=True)
+    scene = bpy.context.scene
+    shared = bpy.data.collections.new("Shared")
+    obj = bpy.data.objects.new("Object", bpy.data.meshes.new("Object"))
+    shared.objects.link(obj)
+    for name in ("A", "B"):
+        parent = bpy.data.collections.new(name)
+        scene.collection.children.link(parent)
+        parent.children.link(shared)
+    return obj
+
+
+@pytest.mark.parametrize("excluded_parents, visible", [
+    (("A",), True),
+    (("B",), True),
+    (("A", "B"), False),
+])
+def test_collection_linked_twice(headsup, excluded_parents, visible):
+    membership = headsup.membership
+    obj = link_twice()
+    view_layer = bpy.context.view_layer
+    for name in excluded_parents:
+        view_layer.layer_collection.children[name].children["Shared"].exclude = True
+
+    membership.reset_membership()
+    membership.update_visible_collections()
+    assert bool(membership.visible_view_layers(obj)) == visible
+
+
+def test_exclude_change_of_one_link(headsup):
+    membership = headsup.membership
+    obj = link_twice()
+    view_layer = bpy.context.view_layer
+    membership.reset_membership()
+    membership.update_visible_collections()
+    assert membership.visible_view_layers(obj) == [view_layer.name]
+
+    # Only the cached subtrees of the changed collection and its ancestors are dropped
+    for name in ("A", "B"):
+        view_layer.layer_collection.children[name].children["Shared"].exclude = True
+        membership.invalidate_collection_subtrees([bpy.data.collections["Shared"]])
+        membership.update_visible_collections()
+    assert membership.visible_view_layers(obj) == []
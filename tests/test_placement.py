@@ -0,0 +1,88 @@
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+
+@pytest.fixture
+def placement(headsup):
+    return headsup.placement
+
+
+def text_state(scale=1.0, modern_ui=True, tools_width=None, header_bottom=False, shelf_height=0,
+               show_header=True, hud_x=None):
+    return scale, modern_ui, tools_width, header_bottom, shelf_height, show_header, hud_x
+
+
+def rec_state(scale=1.0, modern_ui=True, area_height=800, tools_width=None, show_header=True,
+              show_tool_header=True, show_text=False, show_stats=False, object_type=None,
+              pose_mode=False, ortho_side_view=False, engine='CYCLES', shading_type='SOLID',
+              use_compositor='DISABLED', header_bottom=False):
+    return (scale, modern_ui, area_height, tools_width, show_header, show_tool_header, show_text,
+            show_stats, object_type, pose_mode, ortho_side_view, engine, shading_type,
+            use_compositor, header_bottom)
+
+
+def test_text_anchor_default(placement):
+    assert placement.text_anchor(text_state()) == (10, 10)
+
+
+def test_text_anchor_scales(placement):
+    assert placement.text_anchor(text_state(scale=2.0)) == (20, 20)
+
+
+def test_text_anchor_right_of_toolbar(placement):
+    assert placement.text_anchor(text_state(tools_width=50))[0] == 59
+
+
+@pytest.mark.parametrize("state, y", [
+    (text_state(header_bottom=True), 37),
+    (text_state(header_bottom=True, show_header=False), 10),
+    (text_state(header_bottom=True, modern_ui=False), 10),
+    (text_state(shelf_height=100), 137),
+    (text_state(shelf_height=1), 10),
+])
+def test_text_anchor_above_bottom_regions(placement, state, y):
+    assert placement.text_anchor(state)[1] == y
+
+
+def test_text_anchor_above_open_hud(placement):
+    # The redo panel only counts when it starts right of the toolbar
+    assert placement.text_anchor(text_state(tools_width=50, hud_x=60))[1] == 35
+    assert placement.text_anchor(text_state(tools_width=50, hud_x=50))[1] == 10
+    assert placement.text_anchor(text_state(hud_x=60))[1] == 10
+
+
+def test_rec_anchor_default(placement):
+    x, y, text_x, text_y = placement.rec_anchor(rec_state())
+    assert (x, y) == (19, 800 - 40 - 9 - 25)
+    assert (text_x, text_y) == (x + 9 + 4, y - 3)
+
+
+def test_rec_anchor_right_of_toolbar(placement):
+    assert placement.rec_anchor(rec_state(tools_width=50))[0] == 68
+
+
+@pytest.mark.parametrize("changes, offset", [
+    ({"show_header": False}, 50),
+    ({"show_tool_header": False}, 25),
+    ({"show_text": True}, -35),
+    ({"show_stats": True}, -100),
+    ({"show_stats": True, "object_type": 'MESH'}, -100),
+    ({"show_stats": True, "object_type": 'CAMERA'}, -30),
+    ({"show_stats": True, "object_type": 'LIGHT'}, -56),
+    ({"show_stats": True, "object_type": 'ARMATURE', "pose_mode": True}, -56),
+    ({"ortho_side_view": True}, -16),
+    ({"shading_type": 'RENDERED'}, -16),
+    ({"shading_type": 'RENDERED', "engine": 'BLENDER_EEVEE_NEXT'}, -16),
+    ({"shading_type": 'RENDERED', "engine": 'BLENDER_EEVEE_NEXT', "use_compositor": 'ALWAYS'}, -32),
+    ({"shading_type": 'RENDERED', "engine": 'BLENDER_WORKBENCH'}, 0),
+    ({"header_bottom": True}, 27),
+])
+def test_rec_anchor_below_top_overlays(placement, changes, offset):
+    default_y = placement.rec_anchor(rec_state())[1]
+    assert placement.rec_anchor(rec_state(**changes))[1] == default_y + offset
+
+
+def test_rec_anchor_scales(placement):
+    assert placement.rec_anchor(rec_state(scale=2.0, area_height=1600)) == tuple(
+        2 * value for value in placement.rec_anchor(rec_state()))
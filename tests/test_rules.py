@@ -0,0 +1,53 @@
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+
+def test_deferred_items_only_reach_their_rule(headsup):
+    rules = headsup.rules
+    props = headsup.properties.HEADSUP_Props
+    deferred, shared, added = "deferred", "shared", "added"
+    seen = {}
+
+    def check(state):
+        seen["check"] = set(state.check_objects)
+        state.check_objects.add(added)
+        return []
+
+    def later(state):
+        seen["later"] = set(state.check_objects)
+        return []
+
+    state = rules.HEADSUP_EvalState(bpy.context.scene, None)
+    state.check_objects.add(shared)
+    props.deferred_items["test_check"] = ({deferred}, set())
+    try:
+        rules.run_rule(rules.HEADSUP_Rule("test_check", check, {rules.INPUT_OBJECTS}), state)
+        rules.run_rule(rules.HEADSUP_Rule("test_later", later, {rules.INPUT_OBJECTS}), state)
+    finally:
+        props.deferred_items.pop("test_check", None)
+        props.rule_costs.pop("test_check", None)
+        props.rule_costs.pop("test_later", None)
+    assert seen["check"] == {deferred, shared}
+    # What the rule added itself is still shared
+    assert seen["later"] == {shared, added}
+    assert "test_check" not in props.deferred_items
+
+
+def test_deferred_items_stay_when_the_rule_fails(headsup):
+    rules = headsup.rules
+    props = headsup.properties.HEADSUP_Props
+
+    def check(state):
+        raise RuntimeError
+
+    state = rules.HEADSUP_EvalState(bpy.context.scene, None)
+    props.deferred_items["test_check"] = ({"deferred"}, set())
+    try:
+        with pytest.raises(RuntimeError):
+            rules.run_rule(rules.HEADSUP_Rule("test_check", check, {rules.INPUT_OBJECTS}), state)
+        assert props.deferred_items["test_check"] == ({"deferred"}, set())
+        assert state.check_objects == set()
+    finally:
+        props.deferred_items.pop("test_check", None)
+        props.rule_costs.pop("test_check", None)
@@ -0,0 +1,93 @@
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+
+def test_updates_caused_by_the_evaluation_stop_after_the_follow_up(headsup):
+    scheduler = headsup.scheduler
+    props = headsup.properties.HEADSUP_Props
+    bpy.ops.wm.read_homefile(use_empty=True)
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    evaluated = []
+
+    def evaluate(changes):
+        evaluated.append(changes)
+        # Every evaluation causes the same depsgraph update
+        scheduler.request_evaluation(depsgraph, evaluate)
+
+    scheduler.cancel_pending_evaluation()
+    scheduler.run_pending_evaluation(evaluate)
+    assert props.pending_changes is not None
+    assert props.follow_up_signature is not None
+
+    scheduler.run_pending_evaluation(evaluate)
+    assert len(evaluated) == 2
+    assert props.pending_changes is None
+    assert props.follow_up_signature is None
+    scheduler.cancel_pending_evaluation()
+
+
+def test_new_updates_during_the_follow_up_get_another_one(headsup):
+    scheduler = headsup.scheduler
+    props = headsup.properties.HEADSUP_Props
+    bpy.ops.wm.read_homefile(use_empty=True)
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    objects = [bpy.data.objects.new(f"Object {index}", None) for index in range(2)]
+
+    def evaluate(changes):
+        if objects:
+            # E.g. the user edited another object while the evaluation ran
+            scheduler.request_evaluation(depsgraph, evaluate)
+            props.pending_changes.objects.add(objects.pop())
+
+    scheduler.cancel_pending_evaluation()
+    scheduler.run_pending_evaluation(evaluate)
+    scheduler.run_pending_evaluation(evaluate)
+    assert props.pending_changes is not None
+    assert props.follow_up_signature is not None
+    scheduler.run_pending_evaluation(evaluate)
+    assert props.pending_changes is None
+    assert props.follow_up_signature is None
+    scheduler.cancel_pending_evaluation()
+
+
+def test_scan_started_by_the_last_slice_runs(headsup):
+    scheduler = headsup.scheduler
+    props = headsup.properties.HEADSUP_Props
+    restarted = []
+
+    def evaluate(changes):
+        # E.g. a save or a rule toggle landing on the last slice queues a new full scan
+        if not restarted:
+            restarted.append(True)
+            scheduler.start_scan_job([], [])
+
+    scheduler.set_evaluator(evaluate)
+    try:
+        scheduler.start_scan_job([], [])
+        assert scheduler.run_scan_slice() == scheduler.SCAN_SLICE_INTERVAL
+        assert props.scan_job is not None
+        assert scheduler.run_scan_slice() is None
+        assert props.scan_job is None and props.scan_progress is None
+    finally:
+        scheduler.set_evaluator(headsup.handlers.headsup_check_warnings)
+        scheduler.cancel_scan_job()
+        scheduler.cancel_pending_evaluation()
+
+
+def test_busy_postpones_for_a_limited_time(headsup, monkeypatch):
+    scheduler = headsup.scheduler
+    props = headsup.properties.HEADSUP_Props
+    monkeypatch.setattr(scheduler, "is_busy", lambda: True)
+    props.busy_since = None
+    assert scheduler.should_postpone()
+    assert scheduler.should_postpone()
+
+    props.busy_since -= scheduler.MAX_POSTPONE
+    assert not scheduler.should_postpone()
+    # The next evaluation may be postponed again
+    assert scheduler.should_postpone()
+
+    monkeypatch.setattr(scheduler, "is_busy", lambda: False)
+    assert not scheduler.should_postpone()
+    assert props.busy_since is None
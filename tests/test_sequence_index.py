@@ -0,0 +1,42 @@
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+
+def sequence_material(name, image, frame_offset):
+    material = bpy.data.materials.new(name)
+    material.use_nodes = True
+    node = material.node_tree.nodes.new('ShaderNodeTexImage')
+    node.name = "Sequence"
+    node.image = image
+    node.image_user.frame_offset = frame_offset
+    return material
+
+
+def index(node_scan, materials):
+    changed_images = node_scan.update_sequence_index(materials, {})
+    node_scan.update_sequence_conflicts(changed_images)
+    return node_scan.sequence_conflicts()
+
+
+def test_renamed_image_keeps_its_users(headsup):
+    node_scan = headsup.node_scan
+    bpy.ops.wm.read_homefile(use_empty=True)
+    image = bpy.data.images.new("Sequence", 4, 4)
+    image.source = 'SEQUENCE'
+    first = sequence_material("First", image, 0)
+    second = sequence_material("Second", image, 10)
+    # Unused materials are not reported
+    first.use_fake_user = second.use_fake_user = True
+
+    node_scan.invalidate_tree_scans()
+    node_scan.reset_sequence_index()
+    assert list(index(node_scan, [first, second])) == ["Sequence"]
+
+    # Only the second material is re-indexed after the rename
+    image.name = "Renamed"
+    second.node_tree.nodes["Sequence"].image_user.frame_offset = 20
+    node_scan.invalidate_tree_scans([second.node_tree.as_pointer()])
+    conflicts = index(node_scan, [second])
+    assert list(conflicts) == ["Renamed"]
+    assert [material_name for material_name, _node_path, _settings in conflicts["Renamed"]] == ["First", "Second"]
@@ -0,0 +1,182 @@
+import bpy
+import blf
+import gpu
+import re
+import traceback
+from gpu_extras.batch import batch_for_shader
+from mathutils import Matrix
+
+from .properties import HEADSUP_Props
+from .utils import get_builtin_shader, get_cached_batch
+
+# Words including their trailing spaces, the units a line can be broken between
+TOKEN_PATTERN = re.compile(r"\s+|\S+\s*")
+
+LINE_SPACING = 1.5      # Line height relative to the text size
+OFFSCREEN_PADDING = 8   # Room for the text shadow around the cached texture
+MAX_CACHED_LAYOUTS = 16 # A few editors of different widths, dragging a region edge creates one per width
+
+
+class HEADSUP_TextLayout:
+    """Pre-measured runs of a warning list, ready to be replayed by draw calls."""
+
+    def __init__(self, records):
+        self.records = records  # Keeps the list alive, its id is part of the cache key
+        self.runs = []          # (x, y, text, highlighted) relative to the lower left corner
+        self.width = 0
+        self.height = 0
+        self.offscreen = None       # GPUOffScreen with the rendered runs, see draw_warning_records
+        self.offscreen_colors = None
+
+    def free(self):
+        if self.offscreen is not None:
+            self.offscreen.free()
+            self.offscreen = None
+
+
+def build_layout(records, max_width, line_height):
+    """Measure the runs of ``records`` and wrap them at ``max_width``.
+
+    The blf size has to be set before, all measuring uses font 0. Lines grow
+    upwards from the anchor, so the first warning ends up on the top line.
+    """
+    layout = HEADSUP_TextLayout(records)
+    runs = [("HeadsUp: ", False)]
+    for i, record in enumerate(records):
+        if i:
+            runs.append((" , ", False))
+        runs.extend(record.runs)
+
+    lines = [[]]
+    x = 0
+    for text, highlighted in runs:
+        for token in TOKEN_PATTERN.findall(text):
+            token_width = blf.dimensions(0, token)[0]
+            if x > 0 and x + token_width > max_width and token.strip():
+                lines.append([])
+                x = 0
+            if x == 0 and not token.strip():
+                continue  # No leading spaces on wrapped lines
+            line = lines[-1]
+            # Consecutive tokens of the same color are drawn in one call
+            if line and line[-1][2] == highlighted:
+                start, previous, _highlighted = line[-1]
+                line[-1] = (start, previous + token, highlighted)
+            else:
+                line.append((x, token, highlighted))
+            x += token_width
+            layout.width = max(layout.width, x)
+
+    line_count = len(lines)
+    for index, line in enumerate(lines):
+        y = (line_count - 1 - index) * line_height
+        for x, text, highlighted in line:
+            layout.runs.append((x, y, text, highlighted))
+    layout.height = line_count * line_height
+    return layout
+
+
+def free_text_layouts():
+    """Drop all cached layouts and free their textures."""
+    for layout in HEADSUP_Props.text_layouts.values():
+        layout.free()
+    HEADSUP_Props.text_layouts.clear()
+
+
+def get_layout(records, text_size, dpi, max_width):
+    """Cached layout for the warning list at the current text size, DPI and region width."""
+    if HEADSUP_Props.text_layouts_generation != HEADSUP_Props.warnings_generation:
+        free_text_layouts()
+        HEADSUP_Props.text_layouts_generation = HEADSUP_Props.warnings_generation
+
+    key = (id(records), text_size, dpi, int(max_width))
+    layout = HEADSUP_Props.text_layouts.get(key)
+    if layout is None:
+        if len(HEADSUP_Props.text_layouts) >= MAX_CACHED_LAYOUTS:
+            free_text_layouts()
+        layout = build_layout(records, max_width, text_size * LINE_SPACING)
+        HEADSUP_Props.text_layouts[key] = layout
+    return layout
+
+
+def replay_runs(layout, x_position, y_position, colors):
+    """Draw the measured runs of ``layout`` with blf."""
+    warn_color, highlight_color = colors
+    for x, y, text, highlighted in layout.runs:
+        blf.color(0, *(highlight_color if highlighted else warn_color))
+        blf.position(0, x_position + x, y_position + y, 0)
+        blf.draw(0, text)
+
+
+def render_offscreen(layout, colors):
+    """Render the runs of ``layout`` once into a transparent offscreen texture."""
+    width = int(layout.width) + 2 * OFFSCREEN_PADDING
+    height = int(layout.height) + 2 * OFFSCREEN_PADDING
+    offscreen = gpu.types.GPUOffScreen(width, height)
+    with offscreen.bind():
+        framebuffer = gpu.state.active_framebuffer_get()
+        framebuffer.clear(color=(0.0, 0.0, 0.0, 0.0))
+        with gpu.matrix.push_pop(), gpu.matrix.push_pop_projection():
+            # Pixel coordinates of the texture
+            gpu.matrix.load_identity()
+            gpu.matrix.load_projection_matrix(Matrix((
+                (2.0 / width, 0.0, 0.0, -1.0),
+                (0.0, 2.0 / height, 0.0, -1.0),
+                (0.0, 0.0, 1.0, 0.0),
+                (0.0, 0.0, 0.0, 1.0),
+            )))
+            replay_runs(layout, OFFSCREEN_PADDING, OFFSCREEN_PADDING, colors)
+    return offscreen
+
+
+def draw_texture(texture, x_position, y_position, width, height):
+    """Draw ``texture`` as a quad, the quad batch is cached per texture size."""
+    shader = get_builtin_shader('IMAGE')
+
+    def build():
+        return batch_for_shader(shader, 'TRI_FAN', {
+            "pos": ((0, 0), (width, 0), (width, height), (0, height)),
+            "texCoord": ((0, 0), (1, 0), (1, 1), (0, 1)),
+        })
+
+    batch = get_cached_batch('TEXT_TEXTURE', width, height, 1.0, build)
+    with gpu.matrix.push_pop():
+        gpu.matrix.translate((x_position, y_position))
+        shader.bind()
+        shader.uniform_sampler("image", texture)
+        batch.draw(shader)
+
+
+def draw_warning_records(records, x_position, y_position, prefs, max_width):
+    """Draw "HeadsUp: " followed by the warnings, [bracketed] runs in the highlight color.
+
+    With "Cache Overlay Texture" enabled the runs are rendered into a texture
+    once and every redraw only draws a textured quad. Returns the height of
+    the drawn text.
+    """
+    if not records:
+        return 0
+    layout = get_layout(records, HEADSUP_Props.actual_text_size, bpy.context.preferences.system.dpi, max_width)
+    colors = ((*prefs.warn_color, 1.0), (*prefs.highlight_color, 1.0))
+
+    if prefs.cache_overlay_texture and not HEADSUP_Props.offscreen_failed:
+        try:
+            if layout.offscreen is None or layout.offscreen_colors != colors:
+                layout.free()
+                layout.offscreen = render_offscreen(layout, colors)
+                layout.offscreen_colors = colors
+            # The texture holds premultiplied colors
+            gpu.state.blend_set('ALPHA_PREMULT')
+            draw_texture(layout.offscreen.texture_color, x_position - OFFSCREEN_PADDING,
+                         y_position - OFFSCREEN_PADDING, layout.offscreen.width, layout.offscreen.height)
+            gpu.state.blend_set('NONE')
+            return layout.height
+        except Exception:
+            # Don't retry every frame, draw the text directly from now on
+            print("HeadsUp [draw_warning_records] Error:")
+            traceback.print_exc()
+            HEADSUP_Props.offscreen_failed = True
+            layout.free()
+
+    replay_runs(layout, x_position, y_position, colors)
+    return layout.height
@@ -1,12 +1,12 @@
 import bpy
 import blf
-import re
 import math
 import gpu
 import traceback
 from gpu_extras.batch import batch_for_shader
 from .properties import *
 from .preferences import *
+from .placement import *
 
 def open_headsup_prefs():
     bpy.ops.screen.userpref_show(section='ADDONS')
@@ -28,87 +28,6 @@ def store_original_theme_color():
         print("HeadsUp: Stored current theme color!")
         prefs.first_setup_bool = True
     
-def multiple_sequence_nodes(check_materials):
-    # Store image sequence nodes with their properties
-    image_sequences = {}
-
-    # Loop through all materials in the blend file
-    for material in check_materials:
-        # Check if the material is valid and uses nodes
-        if material and material.use_nodes:  
-            if material.users == 0 or not material.use_nodes or material.library:
-                continue
-            # Check if the material has a node tree
-            node_tree = material.node_tree
-            if node_tree:
-                for node in node_tree.nodes:
-                    try:
-                        # Check if the node is an Image Texture node
-                        if "undefined" in node.bl_idname.lower():
-                            continue
-                        if node and hasattr(node, 'type'):
-                            if node.type == 'TEX_IMAGE' and \
-                            hasattr(node, 'image') and node.image and node.image.source == 'SEQUENCE':
-                                
-                                image_name = node.image.name
-                                # Safely access image user properties
-                                if node.image_user:
-                                    frame_start = node.image_user.frame_start
-                                    frame_offset = node.image_user.frame_offset
-                                    frame_duration = node.image_user.frame_duration
-                                    settings = (frame_start, frame_offset, frame_duration)
-
-                                    # Check if the image has already been added to the dictionary
-                                    if image_name in image_sequences:
-                                        # Compare settings
-                                        if image_sequences[image_name] != settings:
-                                            HEADSUP_Props.problematic_materials.add(material)
-                                            return True  # Found a match with different settings
-                                    else:
-                                        # Add the image and its settings to the dictionary
-                                        image_sequences[image_name] = settings
-                    except:
-                        continue
-
-    return False  # No matching cases found
-
-def clean_viewport_warnings(strings, target_number):
-    processed_list = []
-    viewport_warnings_found = False
-    for s in strings:
-        # Check if the string starts with a number inside question marks
-        match = re.match(r"^\?(-?\d+)\?", s)
-        if match:
-            # Extract the number
-            found_number = int(match.group(1))
-            if found_number == target_number:
-                # Remove the ?number? part
-                viewport_warnings_found = True
-                processed_list.append(s[match.end():].strip())
-        else:
-            # If no ?number? is found, keep the string as is
-            processed_list.append(s)
-    
-    return processed_list, viewport_warnings_found
-
-def is_in_ortho_view(region_data):
-    if region_data.view_perspective != 'ORTHO':
-        return False  # Not in orthographic mode
-    
-    # View direction (rounded for precision)
-    direction = tuple(round(v, 3) for v in region_data.view_matrix.col[2][:3])
-
-    # Known orthographic directions
-    ortho_directions = {
-        (0.0, 0.0, 1.0),   # Top
-        (0.0, 0.0, -1.0),  # Bottom
-        (1.0, 0.0, 0.0),   # Right
-        (-1.0, 0.0, 0.0),  # Left
-        (0.0, 1.0, 0.0),   # Front
-        (0.0, -1.0, 0.0)   # Back
-    }
-    return direction in ortho_directions
-
 def rgb_to_rgba(rgb, alpha=1.0):
     """
     Convert an RGB tuple to RGBA by adding an alpha value.
@@ -126,6 +45,77 @@ def calculate_text_size(prefs):
     #* (1 / bpy.context.preferences.system.pixel_size)
     return round(text_size * text_scale)
 
+def get_builtin_shader(name):
+    """Builtin 2D shader, fetched once per session. ``name`` is the 4.0+ name."""
+    shader = HEADSUP_Props.shaders.get(name)
+    if shader is None:
+        if bpy.app.version >= (4, 0, 0):
+            shader = gpu.shader.from_builtin(name)
+        else:
+            shader = gpu.shader.from_builtin(f"2D_{name}")
+        HEADSUP_Props.shaders[name] = shader
+    return shader
+
+def get_cached_batch(kind, width, height, scale, build):
+    """Batch for an overlay of the given region size, ``build()`` only runs after a resize."""
+    key = (kind, width, height, scale)
+    batch = HEADSUP_Props.batches.get(key)
+    if batch is None:
+        # Interactive resizing creates a batch per size, don't keep them all
+        if len(HEADSUP_Props.batches) > 32:
+            HEADSUP_Props.batches.clear()
+        batch = HEADSUP_Props.batches[key] = build()
+    return batch
+
+# The old REC dot stacked 13 linear falloffs: 1 - (1 - a)^13 with a = 1 - r, i.e. 1 - r^13
+REC_GLOW_FALLOFF = 13.0
+
+def get_rec_glow_shader():
+    """Shader drawing the REC dot with its glow in one pass, None if it can't be compiled."""
+    if 'REC_GLOW' not in HEADSUP_Props.shaders:
+        shader = None
+        try:
+            vert_out = gpu.types.GPUStageInterfaceInfo("headsup_rec_glow_interface")
+            vert_out.smooth('VEC2', "uv")
+
+            shader_info = gpu.types.GPUShaderCreateInfo()
+            shader_info.push_constant('MAT4', "ModelViewProjectionMatrix")
+            shader_info.push_constant('VEC4', "color")
+            shader_info.push_constant('FLOAT', "falloff")
+            shader_info.vertex_in(0, 'VEC2', "pos")
+            shader_info.vertex_in(1, 'VEC2', "texCoord")
+            shader_info.vertex_out(vert_out)
+            shader_info.fragment_out(0, 'VEC4', "fragColor")
+            shader_info.vertex_source(
+                "void main()"
+                "{"
+                "  uv = texCoord;"
+                "  gl_Position = ModelViewProjectionMatrix * vec4(pos, 0.0, 1.0);"
+                "}"
+            )
+            shader_info.fragment_source(
+                "void main()"
+                "{"
+                "  float r = length(uv);"
+                "  if (r > 1.0) {"
+                "    discard;"
+                "  }"
+                "  fragColor = vec4(color.rgb, color.a * (1.0 - pow(r, falloff)));"
+                "}"
+            )
+            shader = gpu.shader.create_from_info(shader_info)
+        except Exception:
+            # Versions without GPUShaderCreateInfo keep drawing the stacked batch
+            print("HeadsUp [get_rec_glow_shader] Error:")
+            traceback.print_exc()
+        HEADSUP_Props.shaders['REC_GLOW'] = shader
+    return HEADSUP_Props.shaders['REC_GLOW']
+
+def clear_gpu_caches():
+    """Drop cached shaders and batches, e.g. when the add-on is disabled."""
+    HEADSUP_Props.shaders.clear()
+    HEADSUP_Props.batches.clear()
+
 def draw_highlight_border(border_thickness, border_color=None):
     """Draws a border with rounded corners."""
     try:
@@ -138,31 +128,28 @@ def draw_highlight_border(border_thickness, border_color=None):
         if border_color is None:
             border_color = rgb_to_rgba(prefs.highlight_color, 1)  # (RGBA tuple)
 
-        # Select the appropriate shader
-        if bpy.app.version >= (4, 0, 0):
-            HIGHLIGHT_BORDER_SHADER = gpu.shader.from_builtin('UNIFORM_COLOR')
-        else:
-            HIGHLIGHT_BORDER_SHADER = gpu.shader.from_builtin('2D_UNIFORM_COLOR')
+        HIGHLIGHT_BORDER_SHADER = get_builtin_shader('UNIFORM_COLOR')
 
         # Set GPU state for line drawing
         gpu.state.blend_set('ALPHA')
         gpu.state.line_width_set(border_thickness)
 
-        # Generate the rounded rectangle positions
-        corner_radius = 8
-        positions = [
-            (0, 0 + corner_radius),  # Bottom-left
-            (0 + corner_radius, 0),  # Bottom-left
-            (width - corner_radius, 0),  # Bottom-right
-            (width, 0 + corner_radius),  # Bottom-right
-            (width, height - corner_radius),  # Top-right
-            (width - corner_radius, height),  # Top-right
-            (0 + corner_radius, height),  # Top-left
-            (0, height - corner_radius),  # Top-left
-        ]
-
-        # Create the batch for the border
-        batch = batch_for_shader(HIGHLIGHT_BORDER_SHADER, 'LINE_LOOP', {"pos": positions})
+        def build():
+            # Generate the rounded rectangle positions
+            corner_radius = 8
+            positions = [
+                (0, 0 + corner_radius),  # Bottom-left
+                (0 + corner_radius, 0),  # Bottom-left
+                (width - corner_radius, 0),  # Bottom-right
+                (width, 0 + corner_radius),  # Bottom-right
+                (width, height - corner_radius),  # Top-right
+                (width - corner_radius, height),  # Top-right
+                (0 + corner_radius, height),  # Top-left
+                (0, height - corner_radius),  # Top-left
+            ]
+            return batch_for_shader(HIGHLIGHT_BORDER_SHADER, 'LINE_LOOP', {"pos": positions})
+
+        batch = get_cached_batch('BORDER', width, height, 1.0, build)
 
         # Set the shader color and draw
         HIGHLIGHT_BORDER_SHADER.bind()
@@ -196,95 +183,58 @@ def draw_filled_red_circle():
             if prefs.toggle_with_overlays and not bpy.context.space_data.overlay.show_overlays:
                 continue
 
-            if bpy.app.version >= (4, 0, 0):
-                RED_CIRCLE_SHADER = gpu.shader.from_builtin('SMOOTH_COLOR')
-            else:
-                RED_CIRCLE_SHADER = gpu.shader.from_builtin('2D_SMOOTH_COLOR')
-
-            # Define the circle vertices and colors for TRI_FAN
-            segments = 16
             radius = 9 * scale  # Radius in pixels
-            vertices = [(0, 0)]  # Center of the circle
-            colors = [(1.0, 0.0, 0.0, 1.0)]  # Red color for the center
-
-            vertices += [
-                (
-                    radius * math.cos(2 * math.pi * i / segments),
-                    radius * math.sin(2 * math.pi * i / segments)
-                )
-                for i in range(segments)
-            ]
-            colors += [(1.0, 0.0, 0.0, 0.0) for _ in range(segments)]  # Same red for all vertices
-            vertices.append(vertices[1])  # Close the circle
-            colors.append(colors[1])
-
-            # Create a batch for the filled circle
-            batch = batch_for_shader(RED_CIRCLE_SHADER, 'TRI_FAN', {"pos": vertices, "color": colors})
+            RED_CIRCLE_SHADER = get_rec_glow_shader()
+
+            def build_glow():
+                positions = [(-radius, -radius), (radius, -radius), (radius, radius), (-radius, radius)]
+                tex_coords = [(-1, -1), (1, -1), (1, 1), (-1, 1)]
+                return batch_for_shader(RED_CIRCLE_SHADER, 'TRI_FAN', {"pos": positions, "texCoord": tex_coords})
+
+            def build():
+                # Define the circle vertices and colors for TRI_FAN
+                segments = 16
+                vertices = [(0, 0)]  # Center of the circle
+                colors = [(1.0, 0.0, 0.0, 1.0)]  # Red color for the center
+
+                vertices += [
+                    (
+                        radius * math.cos(2 * math.pi * i / segments),
+                        radius * math.sin(2 * math.pi * i / segments)
+                    )
+                    for i in range(segments)
+                ]
+                colors += [(1.0, 0.0, 0.0, 0.0) for _ in range(segments)]  # Same red for all vertices
+                vertices.append(vertices[1])  # Close the circle
+                colors.append(colors[1])
+                return batch_for_shader(RED_CIRCLE_SHADER, 'TRI_FAN', {"pos": vertices, "color": colors})
+
+            # The dot is drawn at a fixed size, only the UI scale matters
+            if RED_CIRCLE_SHADER is not None:
+                batch = get_cached_batch('REC_GLOW', 0, 0, scale, build_glow)
+            else:
+                RED_CIRCLE_SHADER = get_builtin_shader('SMOOTH_COLOR')
+                batch = get_cached_batch('REC_DOT', 0, 0, scale, build)
             gpu.state.blend_set('ALPHA')
 
-            # Set default positions for each VIEW_3D area
-            x_pos = 10 * scale + radius
-            y_pos = area.height - 40 * scale - radius  
-
-            # Check for TOOLS region and set x_position if found
-            tools_region = next((region for region in area.regions if region.type == 'TOOLS'), None)
-            if tools_region:
-                toolshelf = tools_region.width
-                x_pos = x_pos - 1 * scale + toolshelf 
-            if bpy.app.version >= (4, 0, 0):
-                y_pos = y_pos - 25 * scale 
-            if not bpy.context.space_data.show_region_header:
-                y_pos = y_pos + 50 * scale
-            if bpy.context.space_data.show_region_header and not bpy.context.space_data.show_region_tool_header: 
-                y_pos = y_pos + 25 * scale           
-            if bpy.context.space_data.overlay.show_text:
-                y_pos = y_pos - 35 * scale 
-            if bpy.context.space_data.overlay.show_stats:
-                if active_obj:
-                    if active_obj.type == 'MESH' or active_obj.type == 'FONT' or active_obj.type == 'GREASEPENCIL' or active_obj.type == 'GPENCIL':
-                        y_pos = y_pos - 100 * scale
-                    if active_obj.type == 'CAMERA' or active_obj.type == 'CURVE' or active_obj.type == 'ARMATURE' or active_obj.type == 'META' or active_obj.type == 'EMPTY' or active_obj.type == 'SPEAKER' or active_obj.type == 'LIGHT_PROBE' or active_obj.type ==  'SURFACE' or active_obj.type == 'VOLUME':
-                        y_pos = y_pos - 30 * scale
-                    if active_obj.type == 'LIGHT':
-                        y_pos = y_pos - 56 * scale
-                    if bpy.context.mode == 'POSE':  
-                        y_pos = y_pos - 26 * scale
-                else:
-                    y_pos = y_pos - 100 * scale 
-
-            if is_in_ortho_view(bpy.context.space_data.region_3d):
-                y_pos = y_pos - 16 * scale 
-            if bpy.context.scene.render.engine  == "CYCLES":
-                if bpy.context.space_data.shading.type == 'RENDERED':
-                    y_pos = y_pos - 16 * scale 
-            if bpy.context.scene.render.engine  == "BLENDER_EEVEE" or bpy.context.scene.render.engine  == "BLENDER_EEVEE_NEXT":
-                if bpy.context.space_data.shading.type == 'RENDERED':
-                    if bpy.context.space_data.shading.use_compositor == 'DISABLED':
-                        y_pos = y_pos - 16 * scale
-                    else:
-                        y_pos = y_pos - 32 * scale
-
-            
-            header_region = next((region for region in area.regions if region.type == 'HEADER'), None) 
-            if header_region:
-                if header_region.alignment == 'BOTTOM':
-                    y_pos = y_pos + 27 * scale
+            x_pos, y_pos, text_x, text_y = rec_anchor(rec_anchor_state(area, bpy.context.space_data, scale))
 
             gpu.matrix.push()
             gpu.matrix.load_identity()
             gpu.matrix.translate((x_pos, y_pos, 0))  # Top-left corner position
             RED_CIRCLE_SHADER.bind()
-            for i in range(1,14):
+            if RED_CIRCLE_SHADER is HEADSUP_Props.shaders['REC_GLOW']:
+                RED_CIRCLE_SHADER.uniform_float("color", (1.0, 0.0, 0.0, 1.0))
+                RED_CIRCLE_SHADER.uniform_float("falloff", REC_GLOW_FALLOFF)
                 batch.draw(RED_CIRCLE_SHADER)
+            else:
+                for i in range(1,14):
+                    batch.draw(RED_CIRCLE_SHADER)
             gpu.matrix.pop()
             gpu.state.blend_set('NONE')
 
 
             # Draw "REC" text next to the circle
-            text_margin = 4 * scale # Distance between the circle and the text
-            text_x = x_pos + radius + text_margin
-            text_y = y_pos - 3 * scale   # Slight adjustment to vertically center the text
-        
             # Set the font and size
             blf.position(0, text_x, text_y, 0)
             blf.color(0, *prefs.highlight_color, 1.0)  # White text
@@ -313,40 +263,37 @@ def draw_circular_gradient():
         region = bpy.context.region
         width, height = region.width, region.height
 
-        # Center of the viewport
-        center_x, center_y = width / 2, height / 2
+        shader = get_builtin_shader('SMOOTH_COLOR')
 
-        # Define the number of segments for the circle
-        segments = 64
-        angle_step = 2 * math.pi / segments
+        def build():
+            # Center of the viewport
+            center_x, center_y = width / 2, height / 2
 
-        # Radius of the gradient (diagonal length for full coverage)
-        radius = math.sqrt(width ** 2 + height ** 2) / 2
+            # Define the number of segments for the circle
+            segments = 64
+            angle_step = 2 * math.pi / segments
 
-        # Create vertices for the circular gradient
-        vertices = [(center_x, center_y)]  # Add the center vertex
-        vertices.extend([
-            (center_x + radius * math.cos(i * angle_step),
-            center_y + radius * math.sin(i * angle_step))
-            for i in range(segments + 1)  # Close the circle
-        ])
+            # Radius of the gradient (diagonal length for full coverage)
+            radius = math.sqrt(width ** 2 + height ** 2) / 2
 
-        # Define colors for the gradient
-        colors = [(0.1, 0.1, 0.1, 1.0)]  # Dark grey center
-        colors.extend([(0.1, 0.1, 0.1, 0.0) for _ in range(segments + 1)])  # Transparent edges
+            # Create vertices for the circular gradient
+            vertices = [(center_x, center_y)]  # Add the center vertex
+            vertices.extend([
+                (center_x + radius * math.cos(i * angle_step),
+                center_y + radius * math.sin(i * angle_step))
+                for i in range(segments + 1)  # Close the circle
+            ])
 
-        # Create a shader for drawing
-        if bpy.app.version >= (4,0,0):
-            shader = gpu.shader.from_builtin('SMOOTH_COLOR')
-        else:
-            shader = gpu.shader.from_builtin('2D_SMOOTH_COLOR')
+            # Define colors for the gradient
+            colors = [(0.1, 0.1, 0.1, 1.0)]  # Dark grey center
+            colors.extend([(0.1, 0.1, 0.1, 0.0) for _ in range(segments + 1)])  # Transparent edges
+            return batch_for_shader(shader, 'TRI_FAN', {"pos": vertices, "color": colors})
+
+        batch = get_cached_batch('VIGNETTE', width, height, 1.0, build)
 
         # Enable blending for transparency
         gpu.state.blend_set('ALPHA')
 
-        # Create a batch for the gradient
-        batch = batch_for_shader(shader, 'TRI_FAN', {"pos": vertices, "color": colors})
-
         # Draw the gradient
         shader.bind()
         batch.draw(shader)
@@ -354,7 +301,7 @@ def draw_circular_gradient():
         # Restore the default blend state
         gpu.state.blend_set('NONE')
     except Exception:
-        print("[check_object_mismatches] Error:")
+        print("HeadsUp [draw_circular_gradient] Error:")
         traceback.print_exc()
 
 def safe_setattr(target, attr, value):
@@ -369,6 +316,33 @@ def safe_setattr(target, attr, value):
                 print(f"Failed to set attribute '{attr}' on {target}: {inner_e}")
         bpy.app.timers.register(_apply, first_interval=0.01)
 
+def redraw_sidebars():
+    """Redraw the 3D Viewport sidebars, which show the warn_info flags."""
+    window_manager = bpy.context.window_manager
+    if window_manager is None:
+        return
+    for window in window_manager.windows:
+        if window.screen is None:
+            continue
+        for area in window.screen.areas:
+            if area.type != 'VIEW_3D':
+                continue
+            for region in area.regions:
+                if region.type == 'UI':
+                    region.tag_redraw()
+
+def redraw_overlays():
+    """Redraw the editors showing the warning overlay."""
+    window_manager = bpy.context.window_manager
+    if window_manager is None:
+        return
+    for window in window_manager.windows:
+        if window.screen is None:
+            continue
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D' or area.type == 'NODE_EDITOR':
+                area.tag_redraw()
+
 def check_renderlayer_compositing_conditions():
     try:
         def is_connected_to_file_output(node, visited):
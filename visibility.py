@@ -0,0 +1,90 @@
+import bpy
+import numpy as np
+
+from .properties import HEADSUP_Props
+from .membership import *
+
+
+class HEADSUP_VisibilitySnapshot:
+    """hide_render/hide_viewport of all objects of a scene or all collections, read with foreach_get."""
+
+    def __init__(self, items, owner_pointer):
+        count = len(items)
+        self.owner_pointer = owner_pointer  # Scene of the objects, 0 for bpy.data.collections
+        self.uids = np.empty(count, dtype=np.int32)    # RNA int, other dtypes make foreach_get loop per item
+        self.hide_render = np.empty(count, dtype=bool)
+        self.hide_viewport = np.empty(count, dtype=bool)
+        items.foreach_get("session_uid", self.uids)
+        items.foreach_get("hide_render", self.hide_render)
+        items.foreach_get("hide_viewport", self.hide_viewport)
+
+    def changed_indices(self, previous):
+        """Indices of the items that are new or flipped a flag since ``previous``."""
+        if previous is None or previous.owner_pointer != self.owner_pointer or not len(previous.uids):
+            return np.arange(len(self.uids))
+        # Match objects by session_uid, adding or removing objects shifts the indices
+        order = np.argsort(previous.uids)
+        sorted_uids = previous.uids[order]
+        positions = np.minimum(np.searchsorted(sorted_uids, self.uids), len(sorted_uids) - 1)
+        matched = sorted_uids[positions] == self.uids
+        previous_indices = order[positions]
+        changed = (~matched
+                   | (self.hide_render != previous.hide_render[previous_indices])
+                   | (self.hide_viewport != previous.hide_viewport[previous_indices]))
+        return np.flatnonzero(changed)
+
+    def mismatched_indices(self):
+        """Indices of the objects whose render and viewport visibility differ."""
+        return np.flatnonzero(self.hide_render != self.hide_viewport)
+
+
+def refresh_visibility(scene):
+    """Take a new snapshot and return the objects whose visibility flags changed."""
+    snapshot = HEADSUP_VisibilitySnapshot(scene.objects, scene.as_pointer())
+    changed = snapshot.changed_indices(HEADSUP_Props.visibility_snapshot)
+    HEADSUP_Props.visibility_snapshot = snapshot
+    # Indexing the RNA collection walks it, index a list instead
+    objects = list(scene.objects)
+    return [objects[index] for index in changed]
+
+
+def mismatched_objects(scene):
+    """Objects with differing hide_render and hide_viewport, one vectorized comparison."""
+    snapshot = HEADSUP_Props.visibility_snapshot
+    if snapshot is None or snapshot.owner_pointer != scene.as_pointer():
+        refresh_visibility(scene)
+        snapshot = HEADSUP_Props.visibility_snapshot
+    objects = list(scene.objects)
+    return [objects[index] for index in snapshot.mismatched_indices()]
+
+
+def refresh_collection_visibility():
+    """Take a new snapshot of all collections and return those whose visibility flags changed."""
+    collections = bpy.data.collections
+    snapshot = HEADSUP_VisibilitySnapshot(collections, 0)
+    changed = snapshot.changed_indices(HEADSUP_Props.collection_visibility_snapshot)
+    HEADSUP_Props.collection_visibility_snapshot = snapshot
+    collections = list(collections)
+    return [collections[index] for index in changed]
+
+
+def objects_in_changed_layers(scene):
+    """Rebuild the view layer masks and return the objects whose render layers changed."""
+    old_masks = HEADSUP_Props.view_layer_masks
+    update_visible_collections()
+    new_masks = HEADSUP_Props.view_layer_masks
+    changed_bits = 0
+    for layer_name in old_masks.keys() | new_masks.keys():
+        changed_bits |= old_masks.get(layer_name, 0) ^ new_masks.get(layer_name, 0)
+    if not changed_bits:
+        return set()
+    objects = set()
+    for collection in (scene.collection, *scene.collection.children_recursive):
+        if collection_bit(collection) & changed_bits:
+            objects.update(collection.objects)
+    return objects
+
+
+def reset_visibility():
+    HEADSUP_Props.visibility_snapshot = None
+    HEADSUP_Props.collection_visibility_snapshot = None